@@ -0,0 +1,73 @@
+"""
+Rows per second for turning ORM rows into a FastUI table.
+
+    python -m benchmarks.bench_as_model_table [rows]
+"""
+
+import sys
+import time
+
+import sqlalchemy as sa
+from fastui import components
+
+from fastadmin import FastBase, FastColumn
+
+
+class BenchBase(FastBase):
+    __abstract__ = True
+    metadata = sa.MetaData()
+
+
+class Row(BenchBase):
+    __tablename__ = "bench_rows"
+
+    id = FastColumn(sa.Integer, primary_key=True)
+    name = FastColumn(sa.String, nullable=False)
+    email = FastColumn(sa.String, nullable=True)
+    age = FastColumn(sa.Integer, nullable=True)
+
+
+def per_row(rows: list[Row]) -> components.Table:
+    # previous behaviour: one generated model per row
+    model = Row.as_pydantic_model()
+    table = Row.__table__
+    data = []
+    for row in rows:
+        row_model = table._build_pydantic_model(**model.fast_model_config)
+        data.append(row_model(**row.__column_values__(row_model.model_fields)))
+    return components.Table(data=data, data_model=model)
+
+
+def batched(rows: list[Row]) -> components.Table:
+    return Row.as_pydantic_model().as_model_table(rows)
+
+
+def trusted(rows: list[Row]) -> components.Table:
+    return Row.as_pydantic_model().as_model_table(rows, trusted=True)
+
+
+def measure(func, rows: list[Row], repeat: int) -> float:
+    func(rows)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(rows)
+    return len(rows) * repeat / (time.perf_counter() - started)
+
+
+def main(size: int = 500) -> None:
+    rows = [
+        Row(id=i, name=f"user {i}", email=f"user{i}@example.com", age=i % 90)
+        for i in range(size)
+    ]
+    before = measure(per_row, rows, repeat=1)
+    after = measure(batched, rows, repeat=20)
+    construct = measure(trusted, rows, repeat=20)
+
+    print(f"rows: {size}")
+    print(f"per-row models: {before:12,.0f} rows/s")
+    print(f"batched:        {after:12,.0f} rows/s ({after / before:.1f}x)")
+    print(f"trusted:        {construct:12,.0f} rows/s ({construct / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""
+Models per second for generating the Pydantic model of a wide table.
+
+    python -m benchmarks.bench_column_fields [columns] [repeat]
+"""
+
+import sys
+import time
+
+import sqlalchemy as sa
+
+from fastadmin import FastAdminTable, FastColumn
+
+
+def wide_table(size: int) -> FastAdminTable:
+    columns = [FastColumn("id", sa.Integer, primary_key=True)]
+    for i in range(size - 1):
+        if i % 2:
+            column = FastColumn(f"name_{i}", sa.String, max_length=64, title="Name")
+        else:
+            column = FastColumn(f"count_{i}", sa.Integer, ge=0, default=0)
+        columns.append(column)
+    return FastAdminTable(f"bench_wide_{size}", sa.MetaData(), *columns)
+
+
+def uncached(table: FastAdminTable) -> None:
+    # previous behaviour: every column builds its FieldInfo again
+    for column in table.columns:
+        column.invalidate_pydantic_fields()
+    table._build_pydantic_model(**model_config())
+
+
+def cached(table: FastAdminTable) -> None:
+    table._build_pydantic_model(**model_config())
+
+
+def model_config() -> dict:
+    return {
+        "config": None,
+        "doc": None,
+        "base": None,
+        "module": __name__,
+        "validators": None,
+        "cls_kwargs": None,
+        "exclude": [],
+    }
+
+
+def measure(func, table: FastAdminTable, repeat: int) -> float:
+    func(table)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(table)
+    return repeat / (time.perf_counter() - started)
+
+
+def main(size: int = 200, repeat: int = 50) -> None:
+    table = wide_table(size)
+    before = measure(uncached, table, repeat)
+    after = measure(cached, table, repeat)
+
+    print(f"columns: {size}")
+    print(f"uncached fields: {before:10,.1f} models/s")
+    print(f"cached fields:   {after:10,.1f} models/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
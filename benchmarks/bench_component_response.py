@@ -0,0 +1,78 @@
+"""
+Responses per second for a component page rendering a 1,000 row table,
+with and without FastAPI validating the component tree again.
+
+    python -m benchmarks.bench_component_response [rows]
+"""
+
+import asyncio
+import sys
+import time
+
+import httpx
+import sqlalchemy as sa
+
+from fastadmin import AnyComponent, FastAdminTable, FastColumn, FastUIRouter, PageMeta
+from fastadmin import Page as _page
+
+metadata = sa.MetaData()
+table = FastAdminTable(
+    "bench_rows",
+    metadata,
+    FastColumn("id", sa.Integer, primary_key=True),
+    FastColumn("name", sa.String, nullable=False),
+    FastColumn("email", sa.String, nullable=True),
+    FastColumn("age", sa.Integer, nullable=True),
+)
+COMPONENTS: list[AnyComponent] = []
+
+
+class BenchPage(_page):
+    __pagemeta__ = PageMeta()
+
+
+class TablePage(BenchPage):
+    uri = "/table"
+
+    def render(self) -> list[AnyComponent]:
+        # built once so only the response path is measured
+        return COMPONENTS
+
+
+async def measure(app: FastUIRouter, repeat: int) -> tuple[float, bytes]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        url = TablePage.get_uri()
+        content = (await client.get(url)).content
+        started = time.perf_counter()
+        for _ in range(repeat):
+            await client.get(url)
+        return repeat / (time.perf_counter() - started), content
+
+
+def main(size: int = 1000, repeat: int = 50) -> None:
+    rows = [
+        {"id": i, "name": f"user {i}", "email": f"user{i}@example.com", "age": i % 90}
+        for i in range(size)
+    ]
+    model = table.as_pydantic_model()
+    COMPONENTS[:] = [BenchPage.comp.Page(components=[model.as_model_table(rows)])]
+
+    results = {}
+    for validate in (True, False):
+        app = FastUIRouter(
+            metadata, BenchPage.__pagemeta__, validate_components=validate
+        )
+        results[validate] = asyncio.run(measure(app, repeat))
+
+    (before, validated), (after, serialized) = results[True], results[False]
+    assert validated == serialized
+    print(f"rows: {size}")
+    print(f"validated:   {before:8,.1f} responses/s")
+    print(f"serialized:  {after:8,.1f} responses/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
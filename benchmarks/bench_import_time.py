@@ -0,0 +1,58 @@
+"""
+Import time of the fastadmin entry points, in fresh interpreters.
+
+    python -m benchmarks.bench_import_time [repeat] [budget_ms]
+
+With a budget, exits with status 1 when importing the core
+(`FastBase`/`FastColumn`) takes longer than `budget_ms`.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+    "interpreter": "pass",
+    "core": "import fastadmin; fastadmin.FastBase",
+    "page layer": "import fastadmin; fastadmin.Page",
+    "router": "import fastadmin; fastadmin.FastUIRouter",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def loaded_modules(code: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {name.partition(".")[0] for name in output.split()}
+
+
+def main(repeat: int = 5, budget_ms: int | None = None) -> None:
+    timings = {label: measure(code, repeat) for label, code in TARGETS.items()}
+    baseline = timings.pop("interpreter")
+
+    for label, timing in timings.items():
+        print(f"{label + ':':<12}{timing - baseline:8.1f} ms")
+
+    heavy = loaded_modules(TARGETS["core"]) & {"fastapi", "starlette", "jinja2"}
+    print(f"core imports: {', '.join(sorted(heavy)) or 'no web framework'}")
+
+    if budget_ms is not None and timings["core"] - baseline > budget_ms:
+        print(f"core import exceeds the {budget_ms} ms budget")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,74 @@
+"""
+Calls per second for resolving the URI of a nested page.
+
+    python -m benchmarks.bench_page_uri [repeat]
+"""
+
+import sys
+import time
+
+from fastapi import responses
+
+from fastadmin.tools.page import Page, PageMeta
+
+meta = PageMeta()
+meta.root_url = "/fastui"
+meta.mount_path = "/admin"
+
+
+class BenchPage(Page):
+    __pagemeta__ = meta
+
+
+class Users(BenchPage, prefix="/admin"):
+    uri = "/users"
+
+    def render(self) -> responses.HTMLResponse:
+        return "users"
+
+
+class UserGroups(Users):
+    uri = "/{user_id}/groups"
+
+    def render(self) -> responses.HTMLResponse:
+        return "groups"
+
+
+class UserGroup(UserGroups):
+    uri = "/{id}"
+
+    def render(self) -> responses.HTMLResponse:
+        return "group"
+
+
+def uncached(page: type[Page], **kwds) -> str:
+    # previous behaviour: walk the parents and format on every call
+    uri = page._build_uri(True)
+    return uri.format(**kwds) if kwds else uri
+
+
+def cached(page: type[Page], **kwds) -> str:
+    return page.get_uri(**kwds)
+
+
+def measure(func, repeat: int, **kwds) -> float:
+    func(UserGroup, **kwds)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(UserGroup, **kwds)
+    return repeat / (time.perf_counter() - started)
+
+
+def main(repeat: int = 100_000) -> None:
+    for label, kwds in (("template", {}), ("formatted", {"user_id": 1, "id": 2})):
+        assert uncached(UserGroup, **kwds) == cached(UserGroup, **kwds)
+        before = measure(uncached, repeat, **kwds)
+        after = measure(cached, repeat, **kwds)
+        print(
+            f"{label + ':':<11}{before:12,.0f} -> {after:12,.0f} calls/s "
+            f"({after / before:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
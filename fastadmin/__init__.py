@@ -1,5 +1,84 @@
-import sqlalchemy.types as sqltypes
-from fastui import AnyComponent
+import typing as _t
 
-from .router import FastUIRouter
-from .tools import *
+from .tools import (
+    LAZY_ATTRIBUTES as _TOOLS_LAZY_ATTRIBUTES,
+)
+from .tools import (
+    FastAdminTable,
+    FastBase,
+    FastColumn,
+    FastMappedColumn,
+    TableInfo,
+    fastadmin_mapped_column,
+)
+from .tools.lazy import lazy_attributes
+
+if _t.TYPE_CHECKING:
+    import sqlalchemy.types as sqltypes
+    from fastui import AnyComponent
+
+    from .router import FastUIRouter
+    from .tools import (
+        CountMode,
+        FullTextSearch,
+        InvalidCursor,
+        InvalidQuery,
+        KeysetPage,
+        KeysetPaginator,
+        MemoryPageCache,
+        Page,
+        PageCache,
+        PageCacheBackend,
+        PageMeta,
+        ParsedQuery,
+        QueryBuilder,
+        RelatedLoader,
+        RestMethods,
+        RowCount,
+        RowCounter,
+        SearchHit,
+        Template,
+        UriType,
+    )
+
+# the router and page layers import FastAPI, so they are loaded on first use
+LAZY_ATTRIBUTES = {
+    "sqltypes": ("sqlalchemy.types", None),
+    "AnyComponent": ("fastui", "AnyComponent"),
+    "FastUIRouter": (".router", "FastUIRouter"),
+    **{name: (".tools", name) for name in _TOOLS_LAZY_ATTRIBUTES},
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY_ATTRIBUTES)
+
+__all__ = [
+    "fastadmin_mapped_column",
+    "FastMappedColumn",
+    "FastAdminTable",
+    "FastBase",
+    "FastColumn",
+    "TableInfo",
+    "sqltypes",
+    "AnyComponent",
+    "FastUIRouter",
+    "Template",
+    "PageMeta",
+    "RestMethods",
+    "UriType",
+    "Page",
+    "MemoryPageCache",
+    "PageCache",
+    "PageCacheBackend",
+    "RelatedLoader",
+    "CountMode",
+    "RowCount",
+    "RowCounter",
+    "InvalidQuery",
+    "ParsedQuery",
+    "QueryBuilder",
+    "FullTextSearch",
+    "SearchHit",
+    "InvalidCursor",
+    "KeysetPage",
+    "KeysetPaginator",
+]
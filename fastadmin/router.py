@@ -1,13 +1,24 @@
 import typing as _t
+from contextlib import asynccontextmanager
 from functools import partial
 
 import fastapi as _fa
-from fastui import AnyComponent, FastUI, prebuilt_html
+from fastui import AnyComponent, FastUI
+from starlette.applications import Starlette
+from starlette.types import Receive, Scope, Send
 
 from .config import PATH_STRIP, ROOT_URL
 from .tools import (
     FastAdminTable,
 )
+from .tools.bulk import BulkMode, BulkResult, bulk_write
+from .tools.connections import ConnectionManager
+from .tools.export import ExportFormat, export_response
+from .tools.prebuilt import PrebuiltKey, PrebuiltShell
+from .tools.render import render_endpoint
+from .tools.response import FastUIResponse, component_endpoint
+from .tools.search import search_page
+from .tools.warmup import WarmupReport, warmup
 
 if _t.TYPE_CHECKING:
     import sqlalchemy as _sa
@@ -27,11 +38,36 @@ class FastUIRouter(_fa.FastAPI):
         path_mode: _t.Literal["append", "query"] | None = None,
         path_strip: str = PATH_STRIP,
         init_prebuilt: bool = True,
+        validate_components: bool = False,
+        prebuilt_cache_control: str = "no-cache",
+        prebuilt_compress: bool = True,
+        export_tables: bool = False,
+        export_chunk_size: int = 1000,
+        stats_endpoint: bool = False,
+        bulk_tables: bool = False,
+        bulk_chunk_size: int | None = None,
+        search_tables: bool = False,
+        warmup: bool | _t.Literal["startup"] = False,
+        warmup_workers: int | None = None,
         **fastapi_kwds,
     ):
         super(FastUIRouter, self).__init__(**fastapi_kwds)
+        # composed with the `lifespan` (or startup/shutdown handlers) given
+        self._lifespan = self.router.lifespan_context
+        self.router.lifespan_context = self.lifespan
+        self._started = False
 
         self.metadata = metadata
+        self.validate_components = validate_components
+        self.export_tables = export_tables
+        self.export_chunk_size = export_chunk_size
+        self.stats_endpoint = stats_endpoint
+        self.bulk_tables = bulk_tables
+        self.bulk_chunk_size = bulk_chunk_size
+        self.search_tables = search_tables
+        self.prebuilt = PrebuiltShell(
+            cache_control=prebuilt_cache_control, compress=prebuilt_compress
+        )
         if init_prebuilt:
             page_meta.root_url = root_url
             page_meta.path_strip = path_strip
@@ -47,6 +83,54 @@ class FastUIRouter(_fa.FastAPI):
         if init_prebuilt:
             self.__init_prebuilt__()
 
+        self.warmup_workers = warmup_workers
+        self.warmup_report: WarmupReport | None = None
+        self._warmup_on_startup = warmup == "startup"
+        if warmup and not self._warmup_on_startup:
+            self.warm_up()
+
+    @asynccontextmanager
+    async def lifespan(self, app: Starlette):
+        """
+        Lifespan of the router, wrapping the one it was created with.
+        Warms up with `warmup="startup"` and stops the render pool on shutdown.
+        """
+        self.__startup__()
+        try:
+            async with self._lifespan(app) as state:
+                yield state
+        finally:
+            self.page_meta.render_pool.shutdown()
+
+    def __startup__(self):
+        if self._started:
+            return
+        self._started = True
+        if self._warmup_on_startup:
+            self.warm_up()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._started and scope["type"] in ("http", "websocket"):
+            # mounted apps get no lifespan events: start on the first request
+            # and stop with the app it is mounted in
+            self.__startup__()
+            host = scope.get("app")
+            if isinstance(host, Starlette) and host is not self:
+                host.router.on_shutdown.append(self.page_meta.render_pool.shutdown)
+        await super(FastUIRouter, self).__call__(scope, receive, send)
+
+    def warm_up(self) -> WarmupReport:
+        """
+        Build the models, schemas, table metadata and page URIs that would
+        otherwise be built by the first requests.
+        """
+        self.warmup_report = warmup(
+            self.metadata.tables.values(),
+            self.pages.values(),
+            workers=self.warmup_workers,
+        )
+        return self.warmup_report
+
     @property
     def pages(self) -> _t.Dict[str, type["Page"]]:
         return self.page_meta.__pages__
@@ -61,40 +145,152 @@ class FastUIRouter(_fa.FastAPI):
         ):
             raise ValueError("metadata.tables must be FastAdminTable instances")
 
+        for table in self.metadata.tables.values():
+            # compiled now rather than on the first request
+            table.__fastadmin_metadata__()
+
     def __configure_fast_routes__(self):
         router = _fa.FastAPI()
+        render_pool = self.page_meta.render_pool
         for uri, page in self.pages.items():
-            add_route = partial(
-                router.add_api_route,
-                uri,
+            render = render_endpoint(
                 page().render,
-                methods=[page.method],
+                render_pool,
+                page.render_concurrency,
+                is_async=page._async_render,
             )
+            add_route = partial(self.__add_page_route__, router, uri, page)
             match page:
                 case _ if page._type in (
                     "list[AnyComponent]",
                     list[AnyComponent],
                     list["AnyComponent"],
                 ):
-                    add_route(response_model_exclude_none=True, response_model=FastUI)
+                    if self.validate_components:
+                        add_route(
+                            render,
+                            response_model_exclude_none=True,
+                            response_model=FastUI,
+                        )
+                    else:
+                        add_route(
+                            component_endpoint(render),
+                            response_model=None,
+                            response_class=FastUIResponse,
+                            responses={200: {"model": FastUI}},
+                        )
                 case _:
-                    add_route(response_class=page._type)
+                    add_route(render, response_class=page._type)
+
+        if self.export_tables:
+            router.add_api_route(
+                "/export/{export_format}/{table_name}",
+                self.export_table,
+                methods=["GET"],
+                response_class=_fa.responses.StreamingResponse,
+            )
+        if self.bulk_tables:
+            router.add_api_route(
+                "/bulk/{bulk_mode}/{table_name}", self.bulk_write, methods=["POST"]
+            )
+        if self.search_tables:
+            for table in self.metadata.tables.values():
+                if table.fulltext_columns:
+                    # FTS5 tables of existing tables are created on first search
+                    table.full_text_search()
+            router.add_api_route(
+                "/search/{table_name}",
+                self.search_table,
+                methods=["GET"],
+                response_model=None,
+                response_class=FastUIResponse,
+                responses={200: {"model": FastUI}},
+            )
+        if self.stats_endpoint:
+            router.add_api_route("/stats", self.connection_stats, methods=["GET"])
         return router
 
+    def __add_page_route__(
+        self,
+        router: _fa.FastAPI,
+        uri: str,
+        page: type["Page"],
+        endpoint: _t.Callable[..., _t.Any],
+        **route_kwds,
+    ):
+        if page.cache is not None:
+            endpoint = page.cache.endpoint(
+                page,
+                endpoint,
+                self.page_meta.page_cache,
+                page.cache.table_names(self.page_meta._tables),
+            )
+        router.add_api_route(uri, endpoint, methods=[page.method], **route_kwds)
+
+    async def connection_stats(self) -> dict[str, _t.Any]:
+        if ConnectionManager.configured() is False:
+            raise _fa.HTTPException(503, "ConnectionManager is not configured")
+        return ConnectionManager().stats()
+
+    async def export_table(
+        self, export_format: ExportFormat, table_name: str
+    ) -> _fa.responses.StreamingResponse:
+        table = self.metadata.tables.get(table_name)
+        if table is None:
+            raise _fa.HTTPException(404, f"Table `{table_name}` not found")
+
+        return export_response(table, export_format, chunk_size=self.export_chunk_size)
+
+    async def bulk_write(
+        self,
+        bulk_mode: BulkMode,
+        table_name: str,
+        rows: list[dict[str, _t.Any]] = _fa.Body(),
+    ) -> BulkResult:
+        table = self.metadata.tables.get(table_name)
+        if table is None:
+            raise _fa.HTTPException(404, f"Table `{table_name}` not found")
+
+        return await bulk_write(table, rows, bulk_mode, chunk_size=self.bulk_chunk_size)
+
+    async def search_table(
+        self, table_name: str, q: str = "", limit: int = 20
+    ) -> FastUIResponse:
+        table = self.metadata.tables.get(table_name)
+        if table is None or not table.fulltext_columns:
+            raise _fa.HTTPException(404, f"Table `{table_name}` is not searchable")
+
+        results = []
+        if q:
+            search = table.full_text_search()
+            # commits the FTS5 table when it has to be created
+            async with ConnectionManager().scoped_aconnection(commit=True) as conn:
+                await conn.run_sync(search.create)
+                results = await search.arows(conn, q, limit)
+        return FastUIResponse(search_page(table, q, results))
+
+    def prebuilt_key(self) -> PrebuiltKey:
+        return PrebuiltKey(
+            title=self.title,
+            root_url=self.page_meta.root_url,
+            path_mode=self._path_mode,
+            path_strip=self.page_meta.path_strip,
+        )
+
     def __init_prebuilt__(self):
         _ = _fa.FastAPI()
+        self.prebuilt.render(self.prebuilt_key())
 
-        async def prebuilt() -> _fa.responses.HTMLResponse:
-            return _fa.responses.HTMLResponse(
-                prebuilt_html(
-                    title=self.title,
-                    api_root_url=self.page_meta.root_url,
-                    api_path_mode=self._path_mode,
-                    api_path_strip=self.page_meta.path_strip,
-                )
-            )
+        async def prebuilt(request: _fa.Request) -> _fa.responses.HTMLResponse:
+            self.prebuilt.render(self.prebuilt_key())
+            return self.prebuilt.response(request)
 
-        _.add_api_route("/{path:path}", prebuilt, methods=["GET"])
+        _.add_api_route(
+            "/{path:path}",
+            prebuilt,
+            methods=["GET"],
+            response_class=_fa.responses.HTMLResponse,
+        )
         self.mount(self.page_meta.path_strip, _)
 
     def mount(self, path: str, app: "FastUIRouter", name=None):
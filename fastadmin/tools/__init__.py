@@ -1,15 +1,100 @@
+import typing as _t
+
+from .lazy import lazy_attributes
 from .tools import (
-    fastadmin_mapped_column,
-    FastMappedColumn,
     FastAdminTable,
     FastBase,
     FastColumn,
+    FastMappedColumn,
     TableInfo,
+    fastadmin_mapped_column,
 )
-from .page import (
-    Template,
-    PageMeta,
-    RestMethods,
-    UriType,
-    Page,
-)
+
+if _t.TYPE_CHECKING:
+    from .counts import (
+        CountMode,
+        RowCount,
+        RowCounter,
+    )
+    from .loaders import RelatedLoader
+    from .page import (
+        Page,
+        PageMeta,
+        RestMethods,
+        Template,
+        UriType,
+    )
+    from .page_cache import (
+        MemoryPageCache,
+        PageCache,
+        PageCacheBackend,
+    )
+    from .pagination import (
+        InvalidCursor,
+        KeysetPage,
+        KeysetPaginator,
+    )
+    from .query import (
+        InvalidQuery,
+        ParsedQuery,
+        QueryBuilder,
+    )
+    from .search import (
+        FullTextSearch,
+        SearchHit,
+    )
+
+# the page layer pulls in FastAPI and FastUI, so it is imported on first use
+LAZY_ATTRIBUTES = {
+    "Template": (".page", "Template"),
+    "PageMeta": (".page", "PageMeta"),
+    "RestMethods": (".page", "RestMethods"),
+    "UriType": (".page", "UriType"),
+    "Page": (".page", "Page"),
+    "MemoryPageCache": (".page_cache", "MemoryPageCache"),
+    "PageCache": (".page_cache", "PageCache"),
+    "PageCacheBackend": (".page_cache", "PageCacheBackend"),
+    "RelatedLoader": (".loaders", "RelatedLoader"),
+    "CountMode": (".counts", "CountMode"),
+    "RowCount": (".counts", "RowCount"),
+    "RowCounter": (".counts", "RowCounter"),
+    "InvalidQuery": (".query", "InvalidQuery"),
+    "ParsedQuery": (".query", "ParsedQuery"),
+    "QueryBuilder": (".query", "QueryBuilder"),
+    "FullTextSearch": (".search", "FullTextSearch"),
+    "SearchHit": (".search", "SearchHit"),
+    "InvalidCursor": (".pagination", "InvalidCursor"),
+    "KeysetPage": (".pagination", "KeysetPage"),
+    "KeysetPaginator": (".pagination", "KeysetPaginator"),
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), LAZY_ATTRIBUTES)
+
+__all__ = [
+    "fastadmin_mapped_column",
+    "FastMappedColumn",
+    "FastAdminTable",
+    "FastBase",
+    "FastColumn",
+    "TableInfo",
+    "Template",
+    "PageMeta",
+    "RestMethods",
+    "UriType",
+    "Page",
+    "MemoryPageCache",
+    "PageCache",
+    "PageCacheBackend",
+    "RelatedLoader",
+    "CountMode",
+    "RowCount",
+    "RowCounter",
+    "InvalidQuery",
+    "ParsedQuery",
+    "QueryBuilder",
+    "FullTextSearch",
+    "SearchHit",
+    "InvalidCursor",
+    "KeysetPage",
+    "KeysetPaginator",
+]
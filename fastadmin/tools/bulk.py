@@ -0,0 +1,213 @@
+import dataclasses
+import enum
+import itertools
+import typing as _t
+
+import pydantic as _p
+import sqlalchemy as _sa
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from .connections import ConnectionManager
+
+if _t.TYPE_CHECKING:
+    from .components import BaseModelComponents
+    from .tools import FastAdminTable
+
+
+class BulkMode(enum.StrEnum):
+    INSERT = "insert"
+    UPDATE = "update"
+
+
+@dataclasses.dataclass(slots=True)
+class RowError:
+    """
+    Errors of the submitted row at `index`, in Pydantic's error format.
+    """
+
+    index: int
+    errors: list[dict[str, _t.Any]]
+
+
+@dataclasses.dataclass(slots=True)
+class BulkResult:
+    written: int = 0
+    errors: list[RowError] = dataclasses.field(default_factory=list)
+
+
+def validate_rows(
+    model: type["BaseModelComponents"], rows: _t.Sequence[_t.Any]
+) -> tuple[list[tuple[int, dict[str, _t.Any]]], list[RowError]]:
+    """
+    Validate all `rows` with the list adapter of `model` in one pass and
+    return the valid ones as `(index, values)` with the errors of the rest.
+    Values only hold the fields that were submitted, so omitted columns
+    keep their database defaults.
+    """
+    adapter = model.list_adapter()
+    try:
+        models = adapter.validate_python(rows)
+    except _p.ValidationError as e:
+        by_row: dict[int, list[dict[str, _t.Any]]] = {}
+        for error in e.errors(include_url=False, include_context=False):
+            index, *loc = error["loc"]
+            by_row.setdefault(index, []).append({**error, "loc": tuple(loc)})
+
+        errors = [RowError(index, row_errors) for index, row_errors in by_row.items()]
+        valid = [index for index in range(len(rows)) if index not in by_row]
+        # the remaining rows passed the first pass, this one cannot fail
+        models = adapter.validate_python([rows[index] for index in valid])
+    else:
+        errors, valid = [], range(len(rows))
+
+    return [
+        (index, instance.model_dump(exclude_unset=True))
+        for index, instance in zip(valid, models)
+    ], errors
+
+
+def _database_error(index: int, error: _sa.exc.DBAPIError) -> RowError:
+    return RowError(
+        index, [{"type": "database_error", "loc": (), "msg": str(error.orig)}]
+    )
+
+
+async def _begin_outer(conn: AsyncConnection) -> None:
+    # pysqlite does not emit BEGIN before a SAVEPOINT, so the savepoint would
+    # open the transaction and its RELEASE commit the chunk
+    if conn.dialect.name != "sqlite":
+        return
+    raw = await conn.get_raw_connection()
+    if not raw.driver_connection.in_transaction:
+        await conn.exec_driver_sql("BEGIN")
+
+
+class BulkWriter:
+    """
+    Writes validated rows of `table` in chunks of `chunk_size` with one
+    executemany per chunk (`insertmanyvalues` for inserts on dialects
+    supporting it). Each chunk runs in a savepoint; a failing chunk is
+    rolled back and retried row by row, so only the failing rows are
+    reported and the rest are kept. Updates match rows by primary key.
+    """
+
+    def __init__(self, table: "FastAdminTable", mode: BulkMode | str, chunk_size: int):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.table = table
+        self.mode = BulkMode(mode)
+        self.chunk_size = chunk_size
+        self.primary_key_names = table.__fastadmin_metadata__().primary_key_names
+
+    def statement(self) -> _sa.Executable:
+        if self.mode is BulkMode.INSERT:
+            return self.table.insert()
+        return self.table.update().where(
+            *(
+                self.table.c[name] == _sa.bindparam(f"pk_{name}")
+                for name in self.primary_key_names
+            )
+        )
+
+    def parameters(self, values: dict[str, _t.Any]) -> dict[str, _t.Any]:
+        if self.mode is BulkMode.INSERT:
+            return values
+        parameters = {
+            name: value
+            for name, value in values.items()
+            if name not in self.primary_key_names
+        }
+        for name in self.primary_key_names:
+            parameters[f"pk_{name}"] = values[name]
+        return parameters
+
+    def check(self, values: dict[str, _t.Any]) -> str | None:
+        if self.mode is BulkMode.INSERT:
+            return None
+        if not self.primary_key_names:
+            return f"Table `{self.table.name}` has no primary key"
+        if any(name not in values for name in self.primary_key_names):
+            return "Primary key is required to update a row"
+        if values.keys() <= set(self.primary_key_names):
+            return "No columns to update"
+        return None
+
+    async def write(
+        self, conn: AsyncConnection, rows: _t.Iterable[tuple[int, dict[str, _t.Any]]]
+    ) -> BulkResult:
+        result = BulkResult()
+        statement = self.statement()
+        options = {"insertmanyvalues_page_size": self.chunk_size}
+
+        # executemany binds the columns of the first row, group by column set
+        groups: dict[frozenset[str], list[tuple[int, dict[str, _t.Any]]]] = {}
+        for index, values in rows:
+            message = self.check(values)
+            if message is not None:
+                error = {"type": "bulk_error", "loc": (), "msg": message}
+                result.errors.append(RowError(index, [error]))
+                continue
+            groups.setdefault(frozenset(values), []).append((index, values))
+
+        await _begin_outer(conn)
+        for group in groups.values():
+            for chunk in itertools.batched(group, self.chunk_size):
+                parameters = [self.parameters(values) for _, values in chunk]
+                try:
+                    async with conn.begin_nested():
+                        await conn.execute(
+                            statement, parameters, execution_options=options
+                        )
+                except _sa.exc.DBAPIError:
+                    await self._write_each(conn, statement, chunk, result)
+                else:
+                    result.written += len(chunk)
+        return result
+
+    async def _write_each(
+        self,
+        conn: AsyncConnection,
+        statement: _sa.Executable,
+        chunk: _t.Sequence[tuple[int, dict[str, _t.Any]]],
+        result: BulkResult,
+    ) -> None:
+        for index, values in chunk:
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(statement, [self.parameters(values)])
+            except _sa.exc.DBAPIError as e:
+                result.errors.append(_database_error(index, e))
+            else:
+                result.written += 1
+
+
+async def bulk_write(
+    table: "FastAdminTable",
+    rows: _t.Iterable[_t.Any],
+    mode: BulkMode | str = BulkMode.INSERT,
+    *,
+    chunk_size: int | None = None,
+    model: type["BaseModelComponents"] | None = None,
+) -> BulkResult:
+    """
+    Validate `rows` against `model` (the default model of `table`) and
+    write the valid ones in a single transaction. Updates only require the
+    primary key; the other fields of `model` are optional. Invalid rows and
+    rows rejected by the database are reported in `BulkResult.errors` by
+    their index in `rows`; they do not prevent the other rows from being
+    written.
+    """
+    writer = BulkWriter(
+        table, mode, table.bulk_chunk_size if chunk_size is None else chunk_size
+    )
+    model = table.as_pydantic_model() if model is None else model
+    if writer.mode is BulkMode.UPDATE:
+        # corrections only carry the columns they change
+        model = model.partial_model(writer.primary_key_names)
+    valid, errors = validate_rows(model, list(rows))
+
+    async with ConnectionManager().scoped_aconnection(commit=True) as conn:
+        result = await writer.write(conn, valid)
+
+    result.errors = sorted(errors + result.errors, key=lambda error: error.index)
+    return result
@@ -0,0 +1,166 @@
+import threading
+import time
+import typing as _t
+from collections import OrderedDict
+
+_K = _t.TypeVar("_K", bound=_t.Hashable)
+_V = _t.TypeVar("_V")
+
+
+class CacheInfo(_t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class LRUCache(_t.Generic[_K, _V]):
+    """
+    Thread-safe least-recently-used mapping with hit/miss accounting.
+    `maxsize=None` disables eviction.
+    """
+
+    def __init__(self, maxsize: int | None = 128):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be a positive integer or None")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._data
+
+    def get(self, key: _K, default: _V | None = None) -> _V | None:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def get_or_set(self, key: _K, factory: _t.Callable[[], _V]) -> _V:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+            value = factory()
+            self.set(key, value)
+            return value
+
+    def items(self) -> list[tuple[_K, _V]]:
+        with self._lock:
+            return list(self._data.items())
+
+    def pop(self, key: _K, default: _V | None = None) -> _V | None:
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self, *, reset_stats: bool = False) -> None:
+        with self._lock:
+            self._data.clear()
+            if reset_stats:
+                self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+class _TTLEntry(_t.NamedTuple):
+    expires: float | None
+    tags: frozenset[str]
+    value: _t.Any
+
+
+class TTLCache(_t.Generic[_K, _V]):
+    """
+    `LRUCache` whose entries expire after their `ttl` (never with `None`)
+    and carry tags. `invalidate` drops the entries tagged with any of the
+    given tags (all entries without tags) and bumps `generation`; `set`
+    ignores values computed under an older generation, so a result that
+    was being built during an invalidation is not stored afterwards.
+    """
+
+    def __init__(self, maxsize: int | None = 128):
+        self.generation = 0
+        self.entries: LRUCache[_K, _TTLEntry] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> _V | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires <= time.monotonic():
+            self.entries.pop(key)
+            return None
+        return entry.value
+
+    def set(
+        self,
+        key: _K,
+        value: _V,
+        *,
+        ttl: float | None,
+        generation: int,
+        tags: frozenset[str] = frozenset(),
+    ) -> None:
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if generation == self.generation:
+                self.entries.set(key, _TTLEntry(expires, tags, value))
+
+    def invalidate(self, tags: frozenset[str] | None = None) -> None:
+        with self._lock:
+            self.generation += 1
+            if tags is None:
+                self.entries.clear()
+                return
+            for key, entry in self.entries.items():
+                if not entry.tags.isdisjoint(tags):
+                    self.entries.pop(key)
+
+    def info(self) -> CacheInfo:
+        return self.entries.info()
+
+
+def freeze(value: _t.Any) -> _t.Hashable:
+    """
+    Build a hashable fingerprint of `value`, normalizing containers so
+    that equal arguments produce equal keys. Leaves are tagged with their
+    type, so `1`, `True` and `1.0` stay distinct at any depth. Unhashable
+    leaves fall back to their identity.
+    """
+    if isinstance(value, _t.Mapping):
+        items = sorted(value.items(), key=lambda item: str(item[0]))
+        return (dict, tuple((freeze(k), freeze(v)) for k, v in items))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(freeze(item) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(freeze(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (id, id(value))
+    return (type(value), value)
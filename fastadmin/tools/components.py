@@ -7,20 +7,214 @@ from fastui import (
     events,
     types,
 )
+from fastui.components.forms import FormField
+from fastui.json_schema import model_json_schema_to_fields
+from pydantic.fields import FieldInfo
+from sqlalchemy.engine import Row
 
 _T = _t.TypeVar("_T")
 
 
 if _t.TYPE_CHECKING:
+    from .tools import FastAdminTable
 
     class CustomizedTable(components.Table, _t.Generic[_T]):
         data: _t.Sequence[_p.SerializeAsAny[_T]]
         data_model: _t.Union[_t.Type[_T], None] = _p.Field(default=None, exclude=True)
 
 
+def related_field(name: str) -> str:
+    """
+    Name of the display field added for the foreign key column `name`.
+    """
+    return f"{name}__display"
+
+
+class CachedModelForm(components.ModelForm):
+    """
+    `ModelForm` taking its form fields from the cache of the model
+    (`BaseModelComponents.model_form_fields`) instead of deriving them
+    from the JSON schema on every render.
+    """
+
+    @_p.computed_field(alias="formFields")
+    def form_fields(self) -> _t.List[FormField]:
+        form_fields = getattr(self.model, "model_form_fields", None)
+        if form_fields is None:
+            return model_json_schema_to_fields(self.model)
+        return form_fields()
+
+
 class BaseModelComponents(_p.BaseModel):
     if _t.TYPE_CHECKING:
         fast_model_config: _t.ClassVar[_t.Dict[str, _t.Any]]
+        __fastadmin_list_adapter__: _t.ClassVar[_p.TypeAdapter[_t.List[_t.Self]]]
+        __fastadmin_rows_model__: _t.ClassVar[type[_p.RootModel[_t.List[_t.Self]]]]
+        __fastadmin_form_fields__: _t.ClassVar[_t.List[FormField]]
+        __fastadmin_related_models__: _t.ClassVar[
+            _t.Dict[tuple[str, ...], type["BaseModelComponents"]]
+        ]
+        __fastadmin_partial_models__: _t.ClassVar[
+            _t.Dict[tuple[str, ...], type["BaseModelComponents"]]
+        ]
+        __fastadmin_table__: _t.ClassVar["FastAdminTable"]
+
+    @classmethod
+    def list_adapter(cls) -> _p.TypeAdapter[_t.List[_t.Self]]:
+        """
+        TypeAdapter validating a list of this model, built once per model class.
+        """
+        adapter = cls.__dict__.get("__fastadmin_list_adapter__")
+        if adapter is None:
+            adapter = _p.TypeAdapter(_t.List[cls])
+            cls.__fastadmin_list_adapter__ = adapter
+        return adapter
+
+    @classmethod
+    def rows_model(cls) -> type[_p.RootModel[_t.List[_t.Self]]]:
+        """
+        Root model over a list of this model, built once per model class.
+        """
+        model = cls.__dict__.get("__fastadmin_rows_model__")
+        if model is None:
+            model = _p.RootModel[_t.List[cls]]
+            cls.__fastadmin_rows_model__ = model
+        return model
+
+    @classmethod
+    def model_form_fields(cls) -> _t.List[FormField]:
+        """
+        Form fields derived from the JSON schema, built once per model class.
+        """
+        form_fields = cls.__dict__.get("__fastadmin_form_fields__")
+        if form_fields is None:
+            form_fields = model_json_schema_to_fields(cls)
+            cls.__fastadmin_form_fields__ = form_fields
+        return form_fields
+
+    @classmethod
+    def related_model(cls, names: _t.Iterable[str]) -> type[_t.Self]:
+        """
+        Subclass with an optional display field (`related_field`) for each
+        foreign key column in `names`, built once per set of names.
+        """
+        names = tuple(sorted(names))
+        models = cls.__dict__.get("__fastadmin_related_models__")
+        if models is None:
+            models = cls.__fastadmin_related_models__ = {}
+
+        model = models.get(names)
+        if model is None:
+            model = models[names] = _p.create_model(
+                f"{cls.__name__}Related",
+                __base__=cls,
+                __module__=cls.__module__,
+                **{related_field(name): (_t.Any, None) for name in names},
+            )
+        return model
+
+    @classmethod
+    def partial_model(cls, required: _t.Iterable[str]) -> type[_t.Self]:
+        """
+        Subclass where every field not in `required` is optional, for
+        validating partial updates, built once per set of names.
+        Omitted fields stay unset, see `model_dump(exclude_unset=True)`.
+        """
+        required = tuple(sorted(required))
+        models = cls.__dict__.get("__fastadmin_partial_models__")
+        if models is None:
+            models = cls.__fastadmin_partial_models__ = {}
+
+        model = models.get(required)
+        if model is None:
+            model = models[required] = _p.create_model(
+                f"{cls.__name__}Partial",
+                __base__=cls,
+                __module__=cls.__module__,
+                **{
+                    name: (
+                        field.annotation,
+                        FieldInfo.merge_field_infos(
+                            field, default=None, default_factory=None
+                        ),
+                    )
+                    for name, field in cls.model_fields.items()
+                    if name not in required
+                },
+            )
+        return model
+
+    @classmethod
+    def validate_many(
+        cls, data: _t.Iterable[_t.Mapping[str, _t.Any]]
+    ) -> _t.List[_t.Self]:
+        """
+        Validate many row mappings in a single pass.
+        """
+        return cls.list_adapter().validate_python(list(data))
+
+    @classmethod
+    def construct_many(
+        cls, data: _t.Iterable[_t.Mapping[str, _t.Any]]
+    ) -> _t.List[_t.Self]:
+        """
+        Build instances from trusted row mappings without validation.
+        """
+        if cls.__private_attributes__ or cls.__pydantic_post_init__:
+            return [cls.model_construct(**row) for row in data]
+
+        names = tuple(cls.model_fields)
+        new, setattr_ = cls.__new__, object.__setattr__
+
+        models = []
+        for row in data:
+            try:
+                values = {name: row[name] for name in names}
+            except KeyError:
+                models.append(cls.model_construct(**row))
+                continue
+            model = new(cls)
+            setattr_(model, "__dict__", values)
+            setattr_(model, "__pydantic_fields_set__", set(names))
+            setattr_(model, "__pydantic_extra__", None)
+            setattr_(model, "__pydantic_private__", None)
+            models.append(model)
+        return models
+
+    @classmethod
+    def trusts_rows(cls) -> bool:
+        """
+        Whether rows of the source table skip validation (`FastAdminTable.trust_rows`).
+        """
+        table = getattr(cls, "__fastadmin_table__", None)
+        return table is not None and table.trust_rows
+
+    @classmethod
+    def _iter_model_data(
+        cls, data: _t.Sequence[_t.Any]
+    ) -> _t.Iterator[tuple[int, bool, _t.Mapping[str, _t.Any]]]:
+        """
+        Yield `(index, from_database, mapping)` for the items that need to be
+        turned into model instances.
+        """
+        from .tools import FastBase
+
+        names_by_table = {}
+        for index, item in enumerate(data):
+            if isinstance(item, dict):
+                yield index, False, item
+            elif isinstance(item, Row):
+                yield index, True, item._mapping
+            elif isinstance(item, FastBase):
+                table = item.__table__
+                names = names_by_table.get(table)
+                if names is None:
+                    names = names_by_table[table] = [
+                        name
+                        for column in table.columns
+                        if (name := column.name) in cls.model_fields
+                    ]
+                yield index, True, {name: getattr(item, name) for name in names}
 
     @classmethod
     def as_model_form(
@@ -38,7 +232,7 @@ class BaseModelComponents(_p.BaseModel):
         """
         Use this method to create a ModelForm component from a Pydantic model.
         """
-        return components.ModelForm(
+        return CachedModelForm(
             submit_url=submit_url,
             initial=initial_data,
             method=method,
@@ -67,7 +261,7 @@ class BaseModelComponents(_p.BaseModel):
         Create a ModelForm component
         from the model instance with initial data from the instance.
         """
-        return components.ModelForm(
+        return CachedModelForm(
             submit_url=submit_url,
             initial=self.model_dump(**dump_kwds),
             method=method,
@@ -145,26 +339,45 @@ class BaseModelComponents(_p.BaseModel):
         columns: _t.List[components.display.DisplayLookup] | None = None,
         no_data_message: str | None = None,
         class_name: class_name.ClassNameField | None = None,
+        trusted: bool | None = None,
+        related: _t.Mapping[str, _t.Mapping[_t.Any, _t.Any]] | None = None,
     ) -> "CustomizedTable[_T | _t.Self]":
         """
         Use this method to create a Table component from a Pydantic model.
-        """
-        from .tools import FastAdminTable, FastBase
 
-        to_table = []
+        With `trusted` database rows are built with `model_construct`
+        and skip validation; dicts are always validated.
+        Defaults to the table's `trust_rows` setting.
 
-        for item in data:
-            if isinstance(item, dict):
-                to_table.append(cls(**item))
-            elif isinstance(item, (FastBase, FastAdminTable)):
-                model = item.to_pydantic_model(**cls.fast_model_config)
-                to_table.append(model)
+        `related` maps foreign key columns to `{value: display}` lookups,
+        e.g. from `RelatedLoader.display`, shown as extra display columns.
+        """
+        trusted = cls.trusts_rows() if trusted is None else trusted
+        to_table = list(data)
+        model = cls.related_model(related) if related else cls
+
+        pending, rows = [], []
+        trusted_pending, trusted_rows = [], []
+        for index, from_database, row in model._iter_model_data(to_table):
+            if related:
+                row = dict(row)
+                for name, values in related.items():
+                    row[related_field(name)] = values.get(row.get(name))
+            if trusted and from_database:
+                trusted_pending.append(index)
+                trusted_rows.append(row)
             else:
-                to_table.append(item)
+                pending.append(index)
+                rows.append(row)
+
+        for index, instance in zip(pending, model.validate_many(rows)):
+            to_table[index] = instance
+        for index, instance in zip(trusted_pending, model.construct_many(trusted_rows)):
+            to_table[index] = instance
 
         return components.Table(
             data=to_table,
-            data_model=cls,
+            data_model=model,
             columns=columns,
             no_data_message=no_data_message,
             class_name=class_name,
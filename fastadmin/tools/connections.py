@@ -1,9 +1,19 @@
+import asyncio
+import dataclasses
+import inspect
+import threading
+import time
+import weakref
+from collections import deque
 from contextlib import asynccontextmanager, contextmanager
-from typing import Generic, TypeVar
+from contextvars import ContextVar
+from typing import Any, Callable, Generic, Iterable, TypeVar
 
-from sqlalchemy import Connection, Engine
+from sqlalchemy import Connection, Engine, event
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 
+from .metrics import InMemoryMetrics, MetricsSink
+
 
 class ConnectionMeta(type):
     _instance = None
@@ -14,113 +24,570 @@ class ConnectionMeta(type):
         return self._instance
 
 
+class PoolTimeout(TimeoutError):
+    pass
+
+
 _T = TypeVar("_T", AsyncConnection, Connection)
 _E = TypeVar("_E", Engine, AsyncEngine)
 
 
-# TODO: tests
 class ConnectionABS(Generic[_T, _E]):
-    def __init__(self, engine: _E):
-        self.connections: set[_T] = set()
+    """
+    Bounded pool of open connections.
+
+    A connection is either idle or checked out by exactly one caller.
+    Checkout reuses the most recently returned healthy connection, opens a
+    new one while fewer than `max_size` exist, and otherwise waits up to
+    `timeout` seconds for a checkin. Idle connections unused for longer than
+    `max_idle_time` seconds are closed, and connections held for longer than
+    `leak_threshold` seconds are reported by `leaks()`.
+    """
+
+    metrics_prefix: str = "pool"
+
+    def __init__(
+        self,
+        engine: _E,
+        *,
+        max_size: int = 10,
+        timeout: float | None = 30.0,
+        max_idle_time: float | None = None,
+        leak_threshold: float = 60.0,
+        metrics: MetricsSink | None = None,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
         self.engine = engine
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        self.leak_threshold = leak_threshold
+        self.metrics = metrics or MetricsSink()
+        self.idle: deque[tuple[_T, float]] = deque()
+        self.checked_out: dict[_T, float] = {}
+        self._opening = 0
+
+    @property
+    def connections(self) -> set[_T]:
+        return {conn for conn, _ in self.idle} | self.checked_out.keys()
+
+    @property
+    def size(self) -> int:
+        return len(self.idle) + len(self.checked_out) + self._opening
 
     @property
     def empty(self) -> bool:
-        return not self.connections
+        return self.size == 0
 
-    def new_connection(self) -> _T:
-        conn = self.engine.connect()
-        self.add(conn)
-        return conn
+    @staticmethod
+    def is_healthy(conn: _T) -> bool:
+        return not (conn.closed or conn.invalidated)
+
+    def _check_engine(self) -> None:
+        if self.engine is None:
+            raise ValueError(f"{type(self).__name__} has no engine configured")
+
+    def _deadline(self) -> float | None:
+        if self.timeout is None:
+            return None
+        return time.monotonic() + self.timeout
+
+    def leaks(self, threshold: float | None = None) -> list[tuple[_T, float]]:
+        """
+        Checked out connections held for longer than `threshold` seconds.
+        """
+        threshold = self.leak_threshold if threshold is None else threshold
+        now = time.monotonic()
+        return [
+            (conn, held)
+            for conn, since in list(self.checked_out.items())
+            if (held := now - since) >= threshold
+        ]
+
+    def stats(self) -> dict[str, int | float | None]:
+        return {
+            "size": self.size,
+            "idle": len(self.idle),
+            "checked_out": len(self.checked_out),
+            "max_size": self.max_size,
+            "timeout": self.timeout,
+            "leaks": len(self.leaks()),
+        }
+
+    def _metric(self, name: str) -> str:
+        return f"{self.metrics_prefix}.{name}"
+
+    def _report_size(self) -> None:
+        self.metrics.gauge(self._metric("open"), self.size)
+        self.metrics.gauge(self._metric("checked_out"), len(self.checked_out))
+
+    def _timeout_error(self) -> PoolTimeout:
+        self.metrics.increment(self._metric("timeouts"))
+        return PoolTimeout(
+            f"No connection available within {self.timeout}s (max_size={self.max_size})"
+        )
+
+    def _remaining(self, deadline: float | None) -> float | None:
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise self._timeout_error()
+        return remaining
+
+    def _take_idle(self, started: float) -> tuple[_T | None, list[_T]]:
+        stale = []
+        if self.max_idle_time is not None:
+            expire = time.monotonic() - self.max_idle_time
+            while self.idle and self.idle[0][1] < expire:
+                stale.append(self.idle.popleft()[0])
+        if stale:
+            self.metrics.increment(self._metric("evicted"), len(stale))
+
+        while self.idle:
+            conn, _ = self.idle.pop()
+            if self.is_healthy(conn):
+                self._check_out(conn, started)
+                return conn, stale
+            self.metrics.increment(self._metric("discarded"))
+        return None, stale
+
+    def _check_out(self, conn: _T, started: float) -> None:
+        now = time.monotonic()
+        self.checked_out[conn] = now
+        self.metrics.observe(self._metric("checkout_wait"), now - started)
+        self._report_size()
+
+    def _release(self, conn: _T) -> None:
+        now = time.monotonic()
+        if (since := self.checked_out.pop(conn, None)) is not None:
+            self.metrics.observe(self._metric("hold"), now - since)
+        if self.is_healthy(conn):
+            self.idle.append((conn, now))
+        self._report_size()
 
-    def add(self, conn: _T) -> None:
-        if conn not in self.connections:
-            self.connections.add(conn)
+    def _leaked_transaction(self) -> None:
+        # checked in with an open transaction, bypassing `ConnectionManager`
+        self.metrics.increment(self._metric("leaked_transactions"))
 
-    def get_connection(self) -> _T:
-        if self.empty:
-            return self.new_connection()
 
-        for conn in self.connections:
-            if conn.closed:
-                self.connections.remove(conn)
-            return conn
-        return self.new_connection()
+class ConnectionRegistry(ConnectionABS[Connection, Engine]):
+    metrics_prefix = "pool.sync"
+
+    def __init__(self, engine: Engine, **pool_kwds):
+        super(ConnectionRegistry, self).__init__(engine, **pool_kwds)
+        self._condition = threading.Condition()
+
+    def checkout(self) -> Connection:
+        self._check_engine()
+        started = time.monotonic()
+        deadline = self._deadline()
+
+        with self._condition:
+            while True:
+                conn, stale = self._take_idle(started)
+                for expired in stale:
+                    expired.close()
+                if conn is not None:
+                    return conn
+                if self.size < self.max_size:
+                    self._opening += 1
+                    break
+                self._condition.wait(self._remaining(deadline))
+
+        try:
+            conn = self.engine.connect()
+        except BaseException:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._opening -= 1
+            self.metrics.increment(self._metric("opened"))
+            self._check_out(conn, started)
+        return conn
+
+    def checkin(self, conn: Connection) -> None:
+        if self.is_healthy(conn) and conn.in_transaction():
+            self._leaked_transaction()
+            conn.rollback()
+
+        with self._condition:
+            self._release(conn)
+            self._condition.notify()
 
     @contextmanager
     def connection(self):
-        conn = self.get_connection()
+        conn = self.checkout()
         try:
             yield conn
         finally:
-            if conn.closed:
-                self.connections.remove(conn)
+            self.checkin(conn)
 
-
-class ConnectionRegistry(ConnectionABS[Connection, Engine]):
     def close_all(self):
-        for conn in self.connections:
+        with self._condition:
+            connections = self.connections
+            self.idle.clear()
+            self.checked_out.clear()
+
+        for conn in connections:
             if not conn.closed:
                 conn.close()
 
 
 class AsyncConnectionRegistry(ConnectionABS[AsyncConnection, AsyncEngine]):
+    metrics_prefix = "pool.async"
+
+    def __init__(self, engine: AsyncEngine, **pool_kwds):
+        super(AsyncConnectionRegistry, self).__init__(engine, **pool_kwds)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._condition: asyncio.Condition | None = None
+
+    async def _get_condition(self) -> asyncio.Condition:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # connections opened on another event loop cannot be reused here
+            abandoned = self.connections
+            self.idle.clear()
+            self.checked_out.clear()
+            self._opening = 0
+            self._loop, self._condition = loop, asyncio.Condition()
+            for conn in abandoned:
+                await self._invalidate(conn)
+            self._report_size()
+        return self._condition
+
+    async def _invalidate(self, conn: AsyncConnection) -> None:
+        self.metrics.increment(self._metric("discarded"))
+        if not self.is_healthy(conn):
+            return
+        try:
+            await conn.invalidate()
+        except Exception:
+            # the driver may not outlive the event loop it was opened on;
+            # the connection is unreferenced either way
+            pass
+
+    async def checkout(self) -> AsyncConnection:
+        self._check_engine()
+        condition = await self._get_condition()
+        started = time.monotonic()
+        deadline = self._deadline()
+
+        async with condition:
+            while True:
+                conn, stale = self._take_idle(started)
+                for expired in stale:
+                    await expired.close()
+                if conn is not None:
+                    return conn
+                if self.size < self.max_size:
+                    self._opening += 1
+                    break
+                try:
+                    await asyncio.wait_for(condition.wait(), self._remaining(deadline))
+                except TimeoutError:
+                    raise self._timeout_error() from None
+
+        try:
+            conn = await self.engine.connect().start()
+        except BaseException:
+            async with condition:
+                self._opening -= 1
+                condition.notify()
+            raise
+
+        async with condition:
+            self._opening -= 1
+            self.metrics.increment(self._metric("opened"))
+            self._check_out(conn, started)
+        return conn
+
+    async def checkin(self, conn: AsyncConnection) -> None:
+        if self.is_healthy(conn) and conn.in_transaction():
+            self._leaked_transaction()
+            await conn.rollback()
+
+        condition = await self._get_condition()
+        async with condition:
+            self._release(conn)
+            condition.notify()
+
+    @asynccontextmanager
+    async def connection(self):
+        conn = await self.checkout()
+        try:
+            yield conn
+        finally:
+            await self.checkin(conn)
+
     async def close_all(self):
-        for conn in self.connections:
+        async with await self._get_condition():
+            connections = self.connections
+            self.idle.clear()
+            self.checked_out.clear()
+
+        for conn in connections:
             if not conn.closed:
                 await conn.close()
 
 
+@dataclasses.dataclass(slots=True)
+class ConnectionScope(Generic[_T]):
+    connection: _T
+    owner: Any
+    commit: bool = False
+
+
+_scoped_connection: ContextVar[ConnectionScope[Connection] | None] = ContextVar(
+    "fastadmin_scoped_connection", default=None
+)
+_scoped_aconnection: ContextVar[ConnectionScope[AsyncConnection] | None] = ContextVar(
+    "fastadmin_scoped_aconnection", default=None
+)
+
+
+class TableWrites:
+    """
+    Notifies receivers with the names of the tables written by each
+    committed transaction of a `ConnectionManager` connection.
+
+    Receivers are held by weak reference (`weakref.WeakMethod` for bound
+    methods), so connecting does not keep their owner alive; receivers
+    that were garbage collected are dropped on the next `send`.
+    """
+
+    def __init__(self):
+        self._receivers: dict[weakref.ref[Callable[[frozenset[str]], None]], None] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ref(
+        receiver: Callable[[frozenset[str]], None],
+    ) -> weakref.ref[Callable[[frozenset[str]], None]]:
+        if inspect.ismethod(receiver):
+            return weakref.WeakMethod(receiver)
+        return weakref.ref(receiver)
+
+    def connect(self, receiver: Callable[[frozenset[str]], None]) -> None:
+        with self._lock:
+            self._receivers[self._ref(receiver)] = None
+
+    def disconnect(self, receiver: Callable[[frozenset[str]], None]) -> None:
+        with self._lock:
+            self._receivers.pop(self._ref(receiver), None)
+
+    def send(self, tables: Iterable[str]) -> None:
+        tables = frozenset(tables)
+        if not tables:
+            return
+        with self._lock:
+            refs = list(self._receivers)
+        dead = []
+        for ref in refs:
+            receiver = ref()
+            if receiver is None:
+                dead.append(ref)
+            else:
+                receiver(tables)
+        if dead:
+            with self._lock:
+                for ref in dead:
+                    self._receivers.pop(ref, None)
+
+
+table_writes = TableWrites()
+
+_WRITTEN_TABLES = "fastadmin_written_tables"
+
+
+def _record_write(conn: Connection, clauseelement: Any, *args) -> None:
+    if getattr(clauseelement, "is_dml", False) is False:
+        return
+    name = getattr(getattr(clauseelement, "table", None), "fullname", None)
+    if name is not None:
+        conn.info.setdefault(_WRITTEN_TABLES, set()).add(name)
+
+
+def _publish_writes(conn: Connection) -> None:
+    tables = conn.info.pop(_WRITTEN_TABLES, None)
+    if tables:
+        table_writes.send(tables)
+
+
+def _discard_writes(conn: Connection) -> None:
+    conn.info.pop(_WRITTEN_TABLES, None)
+
+
+def track_writes(engine: Engine) -> None:
+    """
+    Publish the tables written through `engine` to `table_writes` once the
+    transaction commits. Rolled back writes are dropped.
+    """
+    for name, listener in (
+        ("after_execute", _record_write),
+        ("commit", _publish_writes),
+        ("rollback", _discard_writes),
+    ):
+        if not event.contains(engine, name, listener):
+            event.listen(engine, name, listener)
+
+
 class ConnectionManager(metaclass=ConnectionMeta):
     def __init__(
-        self, engine: Engine | None = None, aengine: AsyncEngine | None = None
+        self,
+        engine: Engine | None = None,
+        aengine: AsyncEngine | None = None,
+        *,
+        pool_size: int = 10,
+        pool_timeout: float | None = 30.0,
+        max_idle_time: float | None = None,
+        leak_threshold: float = 60.0,
+        metrics: MetricsSink | None = None,
     ):
         if engine is None and aengine is None:
             raise ValueError("Either engine or aengine must be provided.")
 
-        self.registry = ConnectionRegistry(engine)
-        self.async_registry = AsyncConnectionRegistry(aengine)
+        self.metrics = InMemoryMetrics() if metrics is None else metrics
+        pool_kwds = {
+            "max_size": pool_size,
+            "timeout": pool_timeout,
+            "max_idle_time": max_idle_time,
+            "leak_threshold": leak_threshold,
+            "metrics": self.metrics,
+        }
+        self.registry = ConnectionRegistry(engine, **pool_kwds)
+        self.async_registry = AsyncConnectionRegistry(aengine, **pool_kwds)
+
+        if engine is not None:
+            track_writes(engine)
+        if aengine is not None:
+            track_writes(aengine.sync_engine)
+
+    @classmethod
+    def configured(cls) -> bool:
+        return cls._instance is not None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "pools": {
+                "sync": self.registry.stats(),
+                "async": self.async_registry.stats(),
+            },
+            "metrics": self.metrics.snapshot(),
+        }
 
     @contextmanager
-    def connection(self, *, close_after: bool = True, commit: bool = False):
+    def connection(self, *, close_after: bool = False, commit: bool = False):
+        """
+        Check out a pooled connection. On exit it commits when `commit` is
+        set, rolls back otherwise, and goes back to the pool for reuse;
+        `close_after=True` closes it instead.
+        """
         with self.registry.connection() as conn:
             try:
                 yield conn
             except Exception as e:
                 if conn.in_transaction():
                     conn.rollback()
+                    self.metrics.increment("connection.rollback")
                 raise e
             else:
-                if commit and not conn.in_transaction():
+                if commit and conn.in_transaction():
                     conn.commit()
+                    self.metrics.increment("connection.commit")
             finally:
                 if close_after and not conn.closed:
                     conn.close()
+                elif not conn.closed and conn.in_transaction():
+                    # the connection goes back to the pool for reuse
+                    conn.rollback()
 
     @asynccontextmanager
-    async def aconnection(self, *, close_after: bool = True, commit: bool = False):
-        with self.async_registry.connection() as conn:
+    async def aconnection(self, *, close_after: bool = False, commit: bool = False):
+        async with self.async_registry.connection() as conn:
             try:
                 yield conn
             except Exception as e:
                 if conn.in_transaction():
                     await conn.rollback()
+                    self.metrics.increment("connection.rollback")
                 raise e
             else:
-                if commit and not conn.in_transaction():
+                if commit and conn.in_transaction():
                     await conn.commit()
+                    self.metrics.increment("connection.commit")
             finally:
                 if close_after and not conn.closed:
                     await conn.close()
+                elif not conn.closed and conn.in_transaction():
+                    # the connection goes back to the pool for reuse
+                    await conn.rollback()
+
+    @contextmanager
+    def scoped_connection(self, *, close_after: bool = False, commit: bool = False):
+        """
+        Like `connection`, but nested calls in the same thread and context
+        reuse the outermost connection and transaction. Only the outermost
+        call releases the connection; it commits if any nested call asked to.
+        """
+        owner = threading.get_ident()
+        scope = _scoped_connection.get()
+        if scope is not None and scope.owner == owner:
+            scope.commit = scope.commit or commit
+            yield scope.connection
+            return
+
+        with self.connection(close_after=close_after) as conn:
+            scope = ConnectionScope(conn, owner, commit)
+            token = _scoped_connection.set(scope)
+            try:
+                yield conn
+                if scope.commit and conn.in_transaction():
+                    conn.commit()
+                    self.metrics.increment("connection.commit")
+            finally:
+                _scoped_connection.reset(token)
+
+    @asynccontextmanager
+    async def scoped_aconnection(
+        self, *, close_after: bool = False, commit: bool = False
+    ):
+        """
+        Like `aconnection`, but nested calls in the same task reuse the
+        outermost connection and transaction. Other tasks, including ones
+        spawned inside the scope, get their own connection.
+        """
+        owner = asyncio.current_task()
+        scope = _scoped_aconnection.get()
+        if scope is not None and scope.owner is owner:
+            scope.commit = scope.commit or commit
+            yield scope.connection
+            return
+
+        async with self.aconnection(close_after=close_after) as conn:
+            scope = ConnectionScope(conn, owner, commit)
+            token = _scoped_aconnection.set(scope)
+            try:
+                yield conn
+                if scope.commit and conn.in_transaction():
+                    await conn.commit()
+                    self.metrics.increment("connection.commit")
+            finally:
+                _scoped_aconnection.reset(token)
 
 
 def connection[_F](
-    func: _F | None = None, *, close_after: bool = True, commit: bool = False
+    func: _F | None = None, *, close_after: bool = False, commit: bool = False
 ) -> _F:
     def decorator(func):
         def wrapper(*args, **kwds):
             conn_manager = ConnectionManager()
-            with conn_manager.connection(
+            with conn_manager.scoped_connection(
                 close_after=close_after, commit=commit
             ) as conn:
                 return func(*args, connection=conn, **kwds)
@@ -131,12 +598,12 @@ def connection[_F](
 
 
 def aconnection[_F](
-    func: _F | None = None, *, close_after: bool = True, commit: bool = False
+    func: _F | None = None, *, close_after: bool = False, commit: bool = False
 ) -> _F:
     def decorator(func):
         async def wrapper(*args, **kwds):
             conn_manager = ConnectionManager()
-            async with conn_manager.aconnection(
+            async with conn_manager.scoped_aconnection(
                 close_after=close_after, commit=commit
             ) as conn:
                 return await func(*args, connection=conn, **kwds)
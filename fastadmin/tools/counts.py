@@ -0,0 +1,160 @@
+import dataclasses
+import enum
+import typing as _t
+
+import sqlalchemy as _sa
+
+from .cache import TTLCache, freeze
+from .connections import table_writes
+
+if _t.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from .query import ParsedQuery
+    from .tools import FastAdminTable
+
+Estimator: _t.TypeAlias = _t.Callable[[_sa.Connection, _sa.Table], int | None]
+
+
+class CountMode(enum.StrEnum):
+    EXACT = "exact"
+    TRACKED = "tracked"
+    ESTIMATE = "estimate"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RowCount:
+    value: int
+    estimated: bool = False
+
+    def __str__(self) -> str:
+        return f"about {self.value:,}" if self.estimated else f"{self.value:,}"
+
+
+def _sqlite_estimate(connection: _sa.Connection, table: _sa.Table) -> int | None:
+    # sqlite_stat1 only exists once ANALYZE has run
+    exists = connection.execute(
+        _sa.text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        )
+    ).scalar()
+    if exists is None:
+        return None
+    stat = connection.execute(
+        _sa.text("SELECT stat FROM sqlite_stat1 WHERE tbl = :name ORDER BY idx"),
+        {"name": table.name},
+    ).scalar()
+    return None if stat is None else int(stat.split()[0])
+
+
+def _postgresql_estimate(connection: _sa.Connection, table: _sa.Table) -> int | None:
+    rows = connection.execute(
+        _sa.text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)"),
+        {"name": table.fullname},
+    ).scalar()
+    # -1 until the table is vacuumed or analyzed
+    return None if rows is None or rows < 0 else int(rows)
+
+
+def _mysql_estimate(connection: _sa.Connection, table: _sa.Table) -> int | None:
+    return connection.execute(
+        _sa.text(
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = COALESCE(:schema, DATABASE()) "
+            "AND table_name = :name"
+        ),
+        {"schema": table.schema, "name": table.name},
+    ).scalar()
+
+
+ESTIMATORS: dict[str, Estimator] = {
+    "sqlite": _sqlite_estimate,
+    "postgresql": _postgresql_estimate,
+    "mysql": _mysql_estimate,
+    "mariadb": _mysql_estimate,
+}
+
+
+class RowCounter:
+    """
+    Cached row counts of a `FastAdminTable`, unfiltered or for a
+    `ParsedQuery` of its `QueryBuilder`.
+
+    `EXACT` caches `COUNT(*)` for `ttl` seconds. `TRACKED` also drops the
+    cached counts when the table is written through `ConnectionManager`.
+    `ESTIMATE` additionally answers unfiltered counts from the planner
+    statistics of the dialect (`ESTIMATORS`) once they reach
+    `estimate_threshold` rows; smaller tables and dialects without
+    statistics are counted exactly.
+    """
+
+    def __init__(
+        self,
+        table: "FastAdminTable",
+        mode: CountMode | str = CountMode.TRACKED,
+        *,
+        ttl: float | None = 60.0,
+        estimate_threshold: int = 100_000,
+        maxsize: int | None = 128,
+    ):
+        self.table = table
+        self.mode = CountMode(mode)
+        self.ttl = ttl
+        self.estimate_threshold = estimate_threshold
+        self.entries: TTLCache[_t.Hashable, RowCount] = TTLCache(maxsize)
+
+        if self.mode is not CountMode.EXACT:
+            table_writes.connect(self.tables_written)
+
+    def tables_written(self, tables: frozenset[str]) -> None:
+        if self.table.fullname in tables:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        self.entries.invalidate()
+
+    def close(self) -> None:
+        table_writes.disconnect(self.tables_written)
+
+    def estimate(self, connection: _sa.Connection) -> int | None:
+        estimator = ESTIMATORS.get(connection.dialect.name)
+        return None if estimator is None else estimator(connection, self.table)
+
+    def count(
+        self, connection: _sa.Connection, query: "ParsedQuery | None" = None
+    ) -> RowCount:
+        """
+        Number of rows of the table, or of the rows matching `query`.
+        """
+        filtered = query is not None and bool(query.filters or query.search)
+        key = (
+            (query.filters, query.search is not None, freeze(query.parameters))
+            if filtered
+            else None
+        )
+        if (count := self.entries.get(key)) is not None:
+            return count
+
+        # not cached if a write invalidates the table while counting
+        generation = self.entries.generation
+        count = None
+        if self.mode is CountMode.ESTIMATE and not filtered:
+            estimate = self.estimate(connection)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                count = RowCount(estimate, estimated=True)
+
+        if count is None:
+            statement = _sa.select(_sa.func.count()).select_from(self.table)
+            if filtered:
+                where = self.table.query_builder().where(query)
+                statement = statement.where(*where)
+            parameters = query.parameters if filtered else None
+            count = RowCount(connection.execute(statement, parameters).scalar_one())
+
+        self.entries.set(key, count, ttl=self.ttl, generation=generation)
+        return count
+
+    async def acount(
+        self, connection: "AsyncConnection", query: "ParsedQuery | None" = None
+    ) -> RowCount:
+        return await connection.run_sync(self.count, query)
@@ -0,0 +1,158 @@
+import copy
+import threading
+import types
+import typing as _t
+import weakref
+
+import pydantic.fields as _pf
+
+from .cache import freeze
+
+_EMPTY_EXTRA: _t.Mapping[str, _t.Any] = types.MappingProxyType({})
+
+FIELD_DEFAULTS: _t.Mapping[str, _t.Any] = types.MappingProxyType(
+    {
+        "default_factory": _pf._Unset,
+        "alias": _pf._Unset,
+        "alias_priority": None,
+        "validation_alias": _pf._Unset,
+        "serialization_alias": _pf._Unset,
+        "title": _pf._Unset,
+        "field_title_generator": _pf._Unset,
+        "examples": _pf._Unset,
+        "exclude": _pf._Unset,
+        "discriminator": _pf._Unset,
+        "deprecated": _pf._Unset,
+        "json_schema_extra": _pf._Unset,
+        "frozen": _pf._Unset,
+        "validate_default": _pf._Unset,
+        "repr": _pf._Unset,
+        "init": _pf._Unset,
+        "init_var": _pf._Unset,
+        "kw_only": _pf._Unset,
+        "pattern": _pf._Unset,
+        "strict": _pf._Unset,
+        "coerce_numbers_to_str": _pf._Unset,
+        "gt": _pf._Unset,
+        "ge": _pf._Unset,
+        "lt": _pf._Unset,
+        "le": _pf._Unset,
+        "multiple_of": _pf._Unset,
+        "allow_inf_nan": _pf._Unset,
+        "max_digits": _pf._Unset,
+        "decimal_places": _pf._Unset,
+        "min_length": _pf._Unset,
+        "max_length": _pf._Unset,
+        "union_mode": _pf._Unset,
+        "fail_fast": _pf._Unset,
+        "pydantic_extra": _EMPTY_EXTRA,
+        "anotation": None,
+    }
+)
+
+
+class FieldSpec:
+    """
+    Immutable set of the Pydantic field arguments of a column, holding only
+    the values that differ from `FIELD_DEFAULTS`. Specs are interned, so
+    columns declared with the same arguments share one instance; the values
+    themselves must therefore be treated as read-only.
+    """
+
+    __slots__ = ("_values", "__weakref__")
+
+    _interned: "weakref.WeakValueDictionary[_t.Hashable, FieldSpec]" = (
+        weakref.WeakValueDictionary()
+    )
+    _lock = threading.Lock()
+
+    if _t.TYPE_CHECKING:
+        _values: dict[str, _t.Any]
+
+    def __new__(cls, **values: _t.Any) -> "FieldSpec":
+        values = {
+            name: normalized
+            for name, value in sorted(values.items())
+            if (normalized := cls._normalize(name, value)) is not FIELD_DEFAULTS[name]
+        }
+        # `freeze` keeps the types of nested values, so `[1]` and `[True]` differ
+        key = tuple((name, freeze(value)) for name, value in values.items())
+
+        with cls._lock:
+            spec = cls._interned.get(key)
+            if spec is None:
+                spec = super(FieldSpec, cls).__new__(cls)
+                object.__setattr__(spec, "_values", values)
+                cls._interned[key] = spec
+        return spec
+
+    @staticmethod
+    def _normalize(name: str, value: _t.Any) -> _t.Any:
+        if name == "pydantic_extra":
+            if not value:
+                return _EMPTY_EXTRA
+            if isinstance(value, types.MappingProxyType) is False:
+                return types.MappingProxyType(dict(value))
+        return value
+
+    def __setattr__(self, name: str, value: _t.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return _restore_field_spec, (self._values,)
+
+    def get(self, name: str) -> _t.Any:
+        return self._values.get(name, FIELD_DEFAULTS[name])
+
+    def replace(self, **changes: _t.Any) -> "FieldSpec":
+        return FieldSpec(**(self._values | changes))
+
+    def items(self) -> _t.Iterator[tuple[str, _t.Any]]:
+        return iter(self._values.items())
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({values})"
+
+
+def _restore_field_spec(values: dict[str, _t.Any]) -> FieldSpec:
+    return FieldSpec(**values)
+
+
+EMPTY_FIELD_SPEC = FieldSpec()
+
+
+class FieldSpecAttribute:
+    """
+    Column attribute stored in the column's `FieldSpec`. Assigning it swaps
+    the spec for one with the new value.
+    """
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        if name not in FIELD_DEFAULTS:
+            raise TypeError(f"`{name}` is not a Pydantic field argument")
+        self.name = name
+
+    def __get__(self, instance: _t.Any, owner: type | None = None) -> _t.Any:
+        if instance is None:
+            return self
+        return instance.__field_spec__.get(self.name)
+
+    def __set__(self, instance: _t.Any, value: _t.Any) -> None:
+        instance.__field_spec__ = instance.__field_spec__.replace(**{self.name: value})
+
+
+def copy_field_info(field: _pf.FieldInfo) -> _pf.FieldInfo:
+    """
+    Shallow copy of `field` that pydantic can mutate while building a model
+    without touching the original.
+    """
+    copied = copy.copy(field)
+    copied.metadata = list(field.metadata)
+    copied._attributes_set = dict(field._attributes_set)
+    return copied
@@ -0,0 +1,35 @@
+import importlib
+import typing as _t
+
+LazyAttributes: _t.TypeAlias = _t.Mapping[str, tuple[str, str | None]]
+
+
+def lazy_attributes(
+    package: str, namespace: dict[str, _t.Any], attributes: LazyAttributes
+) -> tuple[_t.Callable[[str], _t.Any], _t.Callable[[], list[str]]]:
+    """
+    Module `__getattr__` and `__dir__` (PEP 562) importing `attributes` on
+    first access. Each attribute maps to `(module, name)`, where `module` may
+    be relative to `package` and a `None` name stands for the module itself.
+    Loaded values are stored in `namespace`, so later lookups are plain
+    global reads.
+    """
+
+    def __getattr__(name: str) -> _t.Any:
+        try:
+            module_name, attribute = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+
+        value = importlib.import_module(module_name, package)
+        if attribute is not None:
+            value = getattr(value, attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(namespace.keys() | attributes.keys())
+
+    return __getattr__, __dir__
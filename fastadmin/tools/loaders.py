@@ -0,0 +1,95 @@
+import typing as _t
+
+import sqlalchemy as _sa
+from sqlalchemy.engine import Row
+
+from .connections import ConnectionManager
+from .relations import ForeignKeyEdge, ForeignKeyGraph
+
+
+def _row_value(row: _t.Any, name: str) -> _t.Any:
+    if isinstance(row, _t.Mapping):
+        return row.get(name)
+    if isinstance(row, Row):
+        return row._mapping.get(name)
+    return getattr(row, name, None)
+
+
+class RelatedLoader:
+    """
+    Resolves foreign key values to rows of the referred tables with one
+    `WHERE <referred column> IN (...)` query per referred column, keeping the
+    loaded rows for the lifetime of the loader. Declared as a FastAPI
+    dependency (`loader: RelatedLoader = Depends()`) a single loader is
+    shared by everything that handles the same request.
+    """
+
+    def __init__(self):
+        self._rows: dict[tuple[str, str], dict[_t.Any, _sa.RowMapping | None]] = {}
+        self.queries = 0
+
+    async def load(
+        self, edge: ForeignKeyEdge, values: _t.Iterable[_t.Any]
+    ) -> dict[_t.Any, _sa.RowMapping | None]:
+        """
+        Referred rows of `edge` by value, `None` for values without a row.
+        Only values not loaded before are queried.
+        """
+        column = edge.referred_column
+        loaded = self._rows.setdefault((column.table.fullname, column.key), {})
+        values = {value for value in values if value is not None}
+
+        missing = values - loaded.keys()
+        if missing:
+            statement = _sa.select(column.table).where(column.in_(missing))
+            async with ConnectionManager().scoped_aconnection() as conn:
+                result = await conn.execute(statement)
+                rows = result.mappings().all()
+            self.queries += 1
+
+            for row in rows:
+                loaded[row[column.key]] = row
+            for value in missing:
+                loaded.setdefault(value, None)
+
+        return {value: loaded[value] for value in values}
+
+    async def display(
+        self,
+        table: _sa.Table,
+        rows: _t.Sequence[_t.Any],
+        fields: _t.Mapping[str, str],
+    ) -> dict[str, dict[_t.Any, _t.Any]]:
+        """
+        `{column: {value: display}}` for `as_model_table(related=...)`, where
+        `fields` maps each foreign key column of `table` to the column of the
+        referred table to show, e.g. `{"user_id": "name"}`. Columns referring
+        to the same table column share one query.
+        """
+        graph = ForeignKeyGraph.of(table.metadata)
+
+        edges: dict[str, ForeignKeyEdge] = {}
+        wanted: dict[ForeignKeyEdge, set[_t.Any]] = {}
+        by_target: dict[tuple[str, str], ForeignKeyEdge] = {}
+        for name in fields:
+            edge = graph.edge(table, name)
+            if edge is None:
+                raise ValueError(
+                    f"Column `{name}` of `{table.name}` is not a foreign key"
+                )
+            target = (edge.referred_column.table.fullname, edge.referred_column.key)
+            edges[name] = edge = by_target.setdefault(target, edge)
+            wanted.setdefault(edge, set()).update(_row_value(row, name) for row in rows)
+
+        loaded = {
+            edge: await self.load(edge, values) for edge, values in wanted.items()
+        }
+
+        display: dict[str, dict[_t.Any, _t.Any]] = {}
+        for name, attribute in fields.items():
+            related = loaded[edges[name]]
+            display[name] = {
+                value: None if row is None else row[attribute]
+                for value, row in related.items()
+            }
+        return display
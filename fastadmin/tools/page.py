@@ -1,4 +1,5 @@
 import enum
+import functools
 import inspect
 import typing as _t
 
@@ -7,6 +8,8 @@ from fastui import AnyComponent, components, events
 from fastui import auth as _auth
 from sqlalchemy.util import FacadeDict
 
+from .page_cache import MemoryPageCache, PageCache
+from .render import RenderPool
 from .tracker import InheritanceTracker
 
 if _t.TYPE_CHECKING:
@@ -25,15 +28,31 @@ SPECIFIC_TYPES = (
 )
 
 
-FASTAPI_RESPONSES = tuple(
-    fresponse
-    for response in inspect.getmembers(responses, inspect.isclass)
-    if issubclass((fresponse := response[1]), responses.Response)
-    or fresponse is responses.Response
-)
+def _fastapi_responses() -> tuple[type[responses.Response], ...]:
+    return tuple(
+        fresponse
+        for response in inspect.getmembers(responses, inspect.isclass)
+        if issubclass((fresponse := response[1]), responses.Response)
+        or fresponse is responses.Response
+    )
+
 
+@functools.cache
+def allowed_responses() -> tuple[_t.Any, ...]:
+    """
+    Return annotations accepted for `Page.render`, built on first use
+    rather than by scanning `fastapi.responses` at import time.
+    """
+    return SPECIFIC_TYPES + _fastapi_responses()
 
-ALLOWED_RESPONSES = SPECIFIC_TYPES + FASTAPI_RESPONSES
+
+def __getattr__(name: str) -> _t.Any:
+    # `FASTAPI_RESPONSES` and `ALLOWED_RESPONSES` used to be module constants
+    if name == "FASTAPI_RESPONSES":
+        return allowed_responses()[len(SPECIFIC_TYPES) :]
+    if name == "ALLOWED_RESPONSES":
+        return allowed_responses()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class UriType(enum.StrEnum):
@@ -60,9 +79,39 @@ class PageMeta:
     root_url: str = ""
     path_strip: str = ""
     mount_path: str = ""
+    render_workers: int = 8
 
-    def __init__(self):
+    def __init__(self, render_workers: int | None = None):
         self.__pages__: _t.Dict[str, type["Page"]] = {}
+        if render_workers is not None:
+            self.render_workers = render_workers
+        self.render_pool = RenderPool(self.render_workers)
+        self.page_cache = MemoryPageCache()
+
+    def __setattr__(self, name: str, value: _t.Any) -> None:
+        if name == "render_workers" and "render_pool" in self.__dict__:
+            self.render_pool.max_workers = value
+        super(PageMeta, self).__setattr__(name, value)
+
+    def uri_prefix(self, add_root_uri: bool) -> tuple[str, str]:
+        """
+        The `PageMeta` values a page URI is built from, instance or class
+        level, so compiled URIs follow any assignment.
+        """
+        return self.mount_path, self.root_url if add_root_uri else self.path_strip
+
+
+class UriTemplate(_t.NamedTuple):
+    prefix: tuple[str, str]
+    uri: str
+    formattable: bool
+
+    @classmethod
+    def compile(cls, uri: str, prefix: tuple[str, str]) -> "UriTemplate":
+        return cls(prefix, uri, "{" in uri or "}" in uri)
+
+
+_NO_TEMPLATES: _t.Dict[bool, UriTemplate] = {}
 
 
 class Page(InheritanceTracker):
@@ -71,6 +120,8 @@ class Page(InheritanceTracker):
         _type: type
         parent: _t.Optional[type["Page"]]
         __pages__: _t.Dict[str, type["Page"]]
+        __uri_templates__: _t.Dict[bool, UriTemplate]
+        _async_render: bool
 
         @classmethod
         def get_versions(
@@ -87,6 +138,8 @@ class Page(InheritanceTracker):
     __define_init_subclass__ = False
     __pagemeta__ = PageMeta()
     method: RestMethods = RestMethods.GET
+    render_concurrency: int | None = None
+    cache: PageCache | None = None
     uri: str = ...
 
     def _init_subclass(cls, prefix: str = None, alias: str | None = None):
@@ -114,6 +167,19 @@ class Page(InheritanceTracker):
         if cls.method not in RestMethods:
             raise ValueError(f"Method must be one of {RestMethods} ({cls.__name__})")
 
+        if cls.render_concurrency is not None and cls.render_concurrency < 1:
+            raise ValueError(
+                f"render_concurrency must be a positive integer ({cls.__name__})"
+            )
+
+        if cls.cache is not None:
+            if isinstance(cls.cache, PageCache) is False:
+                raise ValueError(f"cache must be a PageCache instance ({cls.__name__})")
+            if cls.method not in (RestMethods.GET, RestMethods.HEAD):
+                raise ValueError(
+                    f"Only GET and HEAD pages can be cached ({cls.__name__})"
+                )
+
     def __init_subclass__(cls):
         cls.__check_metdata__()
         cls.__pages__ = cls.__pagemeta__.__pages__
@@ -159,6 +225,14 @@ class Page(InheritanceTracker):
                 f"Page `render` method must be a method of the class ({cls.__name__})"
             )
 
+        if inspect.isgeneratorfunction(render_func) or inspect.isasyncgenfunction(
+            render_func
+        ):
+            raise ValueError(
+                f"Page `render` method must not be a generator ({cls.__name__})"
+            )
+        cls._async_render = inspect.iscoroutinefunction(render_func)
+
         func_signature = inspect.signature(render_func)
 
         return_annotation = func_signature.return_annotation
@@ -167,32 +241,50 @@ class Page(InheritanceTracker):
                 f"Page `render` method must have a return annotation ({cls.__name__})"
             )
 
-        if return_annotation not in ALLOWED_RESPONSES:
+        if return_annotation not in allowed_responses():
             raise ValueError(
                 "Page `render` method "
-                f"must return one of {ALLOWED_RESPONSES} ({cls.__name__})"
+                f"must return one of {allowed_responses()} ({cls.__name__})"
             )
 
         return return_annotation
 
     @classmethod
     def get_uri(cls, *args, add_root_uri: bool = True, **kwds) -> str:
+        template = cls.__dict__.get("__uri_templates__", _NO_TEMPLATES).get(
+            add_root_uri
+        )
+        prefix = cls.__pagemeta__.uri_prefix(add_root_uri)
+        if template is None or template.prefix != prefix:
+            template = cls._compile_uri(add_root_uri, prefix)
+
+        if template.formattable and (args or kwds):
+            return template.uri.format(*args, **kwds)
+        return template.uri
+
+    @classmethod
+    def _compile_uri(cls, add_root_uri: bool, prefix: tuple[str, str]) -> UriTemplate:
+        if "__uri_templates__" not in cls.__dict__:
+            cls.__uri_templates__ = {}
+
+        template = UriTemplate.compile(cls._build_uri(add_root_uri), prefix)
+        cls.__uri_templates__[add_root_uri] = template
+        return template
+
+    @classmethod
+    def _build_uri(cls, add_root_uri: bool = True) -> str:
         if add_root_uri is False:
             root_prefix = cls.__pagemeta__.path_strip
         else:
             root_prefix = cls.__pagemeta__.root_url
 
-        uri = (
+        return (
             cls.__pagemeta__.mount_path
             + root_prefix
             + cls._build_recursive_uri()
             + cls.uri
         )
 
-        if args or kwds:
-            return uri.format(*args, **kwds)
-        return uri
-
     @classmethod
     def _page_uris_recursive(cls) -> _t.List[str]:
         return [parent.uri for parent in cls.get_versions()]
@@ -0,0 +1,228 @@
+import abc
+import dataclasses
+import inspect
+import typing as _t
+
+from fastapi import Request, responses
+
+from .cache import TTLCache, freeze
+from .connections import table_writes
+
+if _t.TYPE_CHECKING:
+    from .page import Page
+    from .tools import FastAdminTable
+
+
+_REQUEST_PARAM = "fastadmin_cache_request"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+
+    @classmethod
+    def capture(cls, response: responses.Response) -> _t.Optional["CachedResponse"]:
+        body = getattr(response, "body", None)
+        if response.status_code != 200 or not isinstance(body, bytes):
+            # streaming and error responses are never cached
+            return None
+        return cls(body, response.status_code, list(response.raw_headers))
+
+    def response(self) -> responses.Response:
+        response = responses.Response(self.body, status_code=self.status_code)
+        response.raw_headers = list(self.headers)
+        return response
+
+
+class PageCacheBackend(abc.ABC):
+    """
+    Storage for cached page results. Every entry is tagged with the names of
+    the tables it depends on; `invalidate` drops the entries tagged with any
+    of the written tables and bumps `generation`, so results rendered before
+    the write are not stored afterwards.
+    """
+
+    generation: int = 0
+
+    @abc.abstractmethod
+    def get(self, key: _t.Hashable) -> _t.Any | None: ...
+
+    @abc.abstractmethod
+    def set(
+        self,
+        key: _t.Hashable,
+        value: _t.Any,
+        *,
+        ttl: float | None,
+        tags: frozenset[str],
+        generation: int,
+    ) -> None: ...
+
+    @abc.abstractmethod
+    def invalidate(self, tags: frozenset[str]) -> None: ...
+
+    @abc.abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryPageCache(PageCacheBackend):
+    """
+    In-process LRU backend with per-entry TTL.
+    """
+
+    def __init__(self, maxsize: int | None = 256):
+        self.entries: TTLCache[_t.Hashable, _t.Any] = TTLCache(maxsize)
+
+    @property
+    def generation(self) -> int:
+        return self.entries.generation
+
+    def get(self, key: _t.Hashable) -> _t.Any | None:
+        return self.entries.get(key)
+
+    def set(
+        self,
+        key: _t.Hashable,
+        value: _t.Any,
+        *,
+        ttl: float | None,
+        tags: frozenset[str],
+        generation: int,
+    ) -> None:
+        self.entries.set(key, value, ttl=ttl, generation=generation, tags=tags)
+
+    def invalidate(self, tags: frozenset[str]) -> None:
+        self.entries.invalidate(tags)
+
+    def clear(self) -> None:
+        self.entries.invalidate()
+
+
+@dataclasses.dataclass(slots=True)
+class PageCache:
+    """
+    Declarative response cache of a `Page`::
+
+        class Dashboard(Page):
+            uri = "/dashboard"
+            cache = PageCache(ttl=60, query=("page",), tables=("users",))
+
+    The key is built from the page, its path parameters, the `query`
+    parameters (all of them with `query=True`) and `user(request)`.
+    Entries are dropped after `ttl` seconds and whenever one of `tables`
+    is written through `ConnectionManager`. Without a `backend`, the
+    `MemoryPageCache` of the page's `PageMeta` is used.
+
+    Writes only invalidate the backends of the process that made them, so
+    `ttl` bounds how stale pages of other workers get. `ttl=None` (never
+    expire) needs a `backend` shared between the workers.
+    """
+
+    ttl: float | None = 60.0
+    query: tuple[str, ...] | bool = ()
+    user: _t.Callable[[Request], _t.Hashable] | None = None
+    tables: tuple[_t.Union[str, "FastAdminTable"], ...] = ()
+    backend: PageCacheBackend | None = None
+
+    def table_names(self, known: _t.Mapping[str, _t.Any]) -> frozenset[str]:
+        names = frozenset(
+            table if isinstance(table, str) else table.fullname for table in self.tables
+        )
+        if unknown := sorted(names - known.keys()):
+            raise ValueError(f"Unknown tables in page cache: {', '.join(unknown)}")
+        return names
+
+    def key(self, page: type["Page"], request: Request) -> _t.Hashable:
+        if self.query is True:
+            query = tuple(sorted(request.query_params.multi_items()))
+        else:
+            query = tuple(
+                (name, tuple(request.query_params.getlist(name))) for name in self.query
+            )
+        user = None if self.user is None else freeze(self.user(request))
+        return (
+            page,
+            request.method,
+            tuple(sorted(request.path_params.items())),
+            query,
+            user,
+        )
+
+    def endpoint(
+        self,
+        page: type["Page"],
+        endpoint: _t.Callable[..., _t.Any],
+        backend: PageCacheBackend,
+        tables: frozenset[str],
+    ) -> _t.Callable[..., _t.Any]:
+        """
+        Wrap a route endpoint so its result is served from `backend`.
+        The key is built from the `Request` parameter of the endpoint; one
+        is appended to the signature when the endpoint has none.
+        """
+        backend = self.backend or backend
+        if self.ttl is None and isinstance(backend, MemoryPageCache):
+            raise ValueError(
+                "PageCache with ttl=None needs a shared backend, "
+                "MemoryPageCache only sees the writes of its own process"
+            )
+        table_writes.connect(backend.invalidate)
+
+        signature = inspect.signature(endpoint)
+        request_name = next(
+            (
+                name
+                for name, param in signature.parameters.items()
+                if isinstance(param.annotation, type)
+                and issubclass(param.annotation, Request)
+            ),
+            None,
+        )
+
+        async def cached(*args, **kwds) -> _t.Any:
+            if request_name is None:
+                request: Request = kwds.pop(_REQUEST_PARAM)
+            else:
+                request = kwds[request_name]
+            key = self.key(page, request)
+            if (value := backend.get(key)) is not None:
+                return value.response() if isinstance(value, CachedResponse) else value
+
+            generation = backend.generation
+            result = endpoint(*args, **kwds)
+            if inspect.isawaitable(result):
+                result = await result
+
+            value = (
+                CachedResponse.capture(result)
+                if isinstance(result, responses.Response)
+                else result
+            )
+            if value is not None:
+                backend.set(
+                    key, value, ttl=self.ttl, tags=tables, generation=generation
+                )
+            return result
+
+        if request_name is None:
+            request_param = inspect.Parameter(
+                _REQUEST_PARAM, inspect.Parameter.KEYWORD_ONLY, annotation=Request
+            )
+            parameters = [
+                param
+                for param in signature.parameters.values()
+                if param.kind is not param.VAR_KEYWORD
+            ]
+            parameters.append(request_param)
+            parameters.extend(
+                param
+                for param in signature.parameters.values()
+                if param.kind is param.VAR_KEYWORD
+            )
+            signature = signature.replace(parameters=parameters)
+        cached.__signature__ = signature
+        cached.__name__ = getattr(endpoint, "__name__", "render")
+        cached.__doc__ = getattr(endpoint, "__doc__", None)
+        return cached
@@ -0,0 +1,257 @@
+import base64
+import binascii
+import dataclasses
+import typing as _t
+
+import pydantic as _p
+import pydantic_core as _pc
+import sqlalchemy as _sa
+from fastui import components, events
+
+if _t.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from .counts import RowCount
+    from .tools import FastAdminTable, FastColumn
+
+
+# dialects comparing row values, `(a, b) > (x, y)`, in index range scans
+ROW_VALUE_DIALECTS = frozenset({"postgresql", "mysql", "mariadb", "sqlite"})
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class KeysetPage:
+    rows: list[_sa.Row[_t.Any]]
+    next_cursor: str | None
+    prev_cursor: str | None
+    page_size: int
+
+    def as_components(
+        self,
+        url: str | None = None,
+        *,
+        after_param: str = "after",
+        before_param: str = "before",
+        next_text: str = "Next",
+        prev_text: str = "Previous",
+        total: "RowCount | None" = None,
+        total_text: str = "{} rows",
+    ) -> list[components.AnyComponent]:
+        """
+        Previous/next links carrying the cursor tokens as query parameters,
+        after the `total` row count ("about N" when estimated).
+        """
+        links = []
+        if total is not None:
+            links.append(components.Text(text=total_text.format(total)))
+        for text, param, cursor in (
+            (prev_text, before_param, self.prev_cursor),
+            (next_text, after_param, self.next_cursor),
+        ):
+            if cursor is None:
+                continue
+            links.append(
+                components.Link(
+                    components=[components.Text(text=text)],
+                    on_click=events.GoToEvent(url=url, query={param: cursor}),
+                )
+            )
+        return [components.Div(components=links, class_name="d-flex gap-3")]
+
+
+class KeysetPaginator:
+    """
+    Seek pagination over a `FastAdminTable`.
+
+    Pages are selected with `WHERE (keys) > (cursor)` on the primary key or
+    an indexed column (with the primary key as a tie breaker), so every page
+    costs the same as the first one. Dialects without row values get the
+    expanded `(a > x) OR (a = x AND b > y)` form.
+    """
+
+    def __init__(
+        self,
+        table: "FastAdminTable",
+        order_by: str | _t.Sequence[str] | None = None,
+        *,
+        descending: bool = False,
+        page_size: int = 50,
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+
+        self.table = table
+        self.descending = descending
+        self.page_size = page_size
+        self.columns = self._resolve_columns(order_by)
+        key_types = tuple(
+            column.anotation or column.type.python_type for column in self.columns
+        )
+        self._cursor_adapter = _p.TypeAdapter(tuple[key_types])
+
+    def _resolve_columns(
+        self, order_by: str | _t.Sequence[str] | None
+    ) -> tuple["FastColumn[_t.Any]", ...]:
+        info = self.table.__fastadmin_metadata__()
+        primary = list(info.primary_columns)
+        if not primary:
+            raise ValueError(
+                f"Keyset pagination requires a primary key ({self.table.name})"
+            )
+
+        names = [order_by] if isinstance(order_by, str) else list(order_by or ())
+        for name in names:
+            if name in info.primary_columns:
+                continue
+            if name not in info.index_columns and name not in info.unique_columns:
+                raise ValueError(
+                    f"Column `{name}` must be indexed to paginate by it "
+                    f"({self.table.name})"
+                )
+            if name in info.nullable_columns:
+                raise ValueError(
+                    f"Column `{name}` must not be nullable to paginate by it "
+                    f"({self.table.name})"
+                )
+
+        names += [name for name in primary if name not in names]
+        return tuple(self.table.columns[name] for name in names)
+
+    def encode_cursor(self, row: _t.Any) -> str:
+        if isinstance(row, _sa.Row):
+            mapping = row._mapping
+            values = [mapping[column] for column in self.columns]
+        elif isinstance(row, _t.Mapping):
+            values = [row[column.name] for column in self.columns]
+        else:
+            values = [getattr(row, column.name) for column in self.columns]
+        token = base64.urlsafe_b64encode(_pc.to_json(values))
+        return token.rstrip(b"=").decode()
+
+    def decode_cursor(self, cursor: str) -> tuple[_t.Any, ...]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            return self._cursor_adapter.validate_json(raw)
+        except (binascii.Error, ValueError) as e:
+            raise InvalidCursor(f"Invalid pagination cursor `{cursor}`") from e
+
+    @staticmethod
+    def supports_row_values(dialect: _sa.Dialect) -> bool:
+        if dialect.name == "sqlite":
+            # row values arrived in SQLite 3.15
+            return (dialect.server_version_info or (0,)) >= (3, 15)
+        return dialect.name in ROW_VALUE_DIALECTS
+
+    def _seek(self, values: tuple[_t.Any, ...], forward: bool, row_values: bool):
+        greater = forward is not self.descending
+        if row_values and len(self.columns) > 1:
+            keys, cursor = _sa.tuple_(*self.columns), _sa.tuple_(*values)
+            return keys > cursor if greater else keys < cursor
+
+        clauses = []
+        for index, column in enumerate(self.columns):
+            equal = [c == v for c, v in zip(self.columns[:index], values[:index])]
+            compare = column > values[index] if greater else column < values[index]
+            clauses.append(_sa.and_(*equal, compare))
+        return _sa.or_(*clauses)
+
+    def _order_by(self, forward: bool):
+        ascending = forward is not self.descending
+        return [column.asc() if ascending else column.desc() for column in self.columns]
+
+    def statement(
+        self,
+        *,
+        after: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+        where: _t.Iterable[_sa.ColumnElement[bool]] = (),
+        row_values: bool = False,
+    ) -> _sa.Select[_t.Any]:
+        """
+        Page query; `row_values` seeks with a single row value comparison,
+        see `supports_row_values`.
+        """
+        if after is not None and before is not None:
+            raise ValueError("Use either `after` or `before`, not both")
+
+        forward = before is None
+        statement = _sa.select(self.table).where(*where)
+        if (cursor := after if forward else before) is not None:
+            seek = self._seek(self.decode_cursor(cursor), forward, row_values)
+            statement = statement.where(seek)
+
+        limit = self.page_size if limit is None else limit
+        return statement.order_by(*self._order_by(forward)).limit(limit + 1)
+
+    def page(
+        self,
+        rows: _t.Sequence[_sa.Row[_t.Any]],
+        *,
+        after: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+    ) -> KeysetPage:
+        """
+        Build a `KeysetPage` from rows fetched with `statement(...)`.
+        """
+        limit = self.page_size if limit is None else limit
+        has_more = len(rows) > limit
+        rows = list(rows[:limit])
+
+        if before is not None:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, after is not None
+
+        return KeysetPage(
+            rows=rows,
+            next_cursor=self.encode_cursor(rows[-1]) if rows and has_next else None,
+            prev_cursor=self.encode_cursor(rows[0]) if rows and has_prev else None,
+            page_size=limit,
+        )
+
+    def fetch(
+        self,
+        connection: _sa.Connection,
+        *,
+        after: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+        where: _t.Iterable[_sa.ColumnElement[bool]] = (),
+        parameters: _t.Mapping[str, _t.Any] | None = None,
+    ) -> KeysetPage:
+        statement = self.statement(
+            after=after,
+            before=before,
+            limit=limit,
+            where=where,
+            row_values=self.supports_row_values(connection.dialect),
+        )
+        rows = connection.execute(statement, parameters).all()
+        return self.page(rows, after=after, before=before, limit=limit)
+
+    async def afetch(
+        self,
+        connection: "AsyncConnection",
+        *,
+        after: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+        where: _t.Iterable[_sa.ColumnElement[bool]] = (),
+        parameters: _t.Mapping[str, _t.Any] | None = None,
+    ) -> KeysetPage:
+        statement = self.statement(
+            after=after,
+            before=before,
+            limit=limit,
+            where=where,
+            row_values=self.supports_row_values(connection.dialect),
+        )
+        rows = (await connection.execute(statement, parameters)).all()
+        return self.page(rows, after=after, before=before, limit=limit)
@@ -0,0 +1,113 @@
+import gzip
+import hashlib
+import typing as _t
+
+from fastapi import Request, responses
+from fastui import prebuilt_html
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+class PrebuiltKey(_t.NamedTuple):
+    title: str
+    root_url: str
+    path_mode: str | None
+    path_strip: str
+
+
+class PrebuiltShell:
+    """
+    The FastUI HTML shell rendered once per `PrebuiltKey` and served from
+    memory with a strong ETag, answering conditional requests with 304.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_control: str = "no-cache",
+        compress: bool = True,
+        compress_level: int = 9,
+    ):
+        self.cache_control = cache_control
+        self.compress = compress
+        self.compress_level = compress_level
+        self.key: PrebuiltKey | None = None
+        self.bodies: dict[str, bytes] = {}
+        self.etags: dict[str, str] = {}
+
+    def render(self, key: PrebuiltKey) -> None:
+        if key == self.key:
+            return
+
+        html = prebuilt_html(
+            title=key.title,
+            api_root_url=key.root_url,
+            api_path_mode=key.path_mode,
+            api_path_strip=key.path_strip,
+        ).encode()
+        bodies = {"identity": html}
+        if self.compress:
+            bodies["gzip"] = gzip.compress(
+                html, compresslevel=self.compress_level, mtime=0
+            )
+            if brotli is not None:
+                bodies["br"] = brotli.compress(html)
+
+        digest = hashlib.sha256(html).hexdigest()[:32]
+        self.etags = {
+            encoding: f'"{digest}"'
+            if encoding == "identity"
+            else f'"{digest}-{encoding}"'
+            for encoding in bodies
+        }
+        self.bodies = bodies
+        self.key = key
+
+    def negotiate(self, accept_encoding: str) -> str:
+        accepted = set()
+        for part in accept_encoding.lower().split(","):
+            coding, *params = part.split(";")
+            quality = 1.0
+            for param in params:
+                name, _, value = param.strip().partition("=")
+                if name == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(coding.strip())
+
+        for encoding in ("br", "gzip"):
+            if encoding in self.bodies and (encoding in accepted or "*" in accepted):
+                return encoding
+        return "identity"
+
+    def not_modified(self, if_none_match: str) -> bool:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return not tags.isdisjoint(self.etags.values())
+
+    def response(self, request: Request) -> responses.Response:
+        if self.key is None:
+            raise RuntimeError("Prebuilt HTML was not rendered yet")
+
+        encoding = self.negotiate(request.headers.get("accept-encoding", ""))
+        headers = {
+            "ETag": self.etags[encoding],
+            "Cache-Control": self.cache_control,
+        }
+        if self.compress:
+            headers["Vary"] = "Accept-Encoding"
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and self.not_modified(if_none_match):
+            return responses.Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return responses.HTMLResponse(self.bodies[encoding], headers=headers)
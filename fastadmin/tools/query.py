@@ -0,0 +1,350 @@
+import dataclasses
+import operator
+import typing as _t
+
+import fastapi as _fa
+import pydantic as _p
+import pydantic_core as _pc
+import sqlalchemy as _sa
+from fastui import components
+
+from .cache import LRUCache
+from .components import BaseModelComponents
+
+if _t.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from .tools import FastAdminTable, FastColumn
+
+_Clause: _t.TypeAlias = _t.Callable[[_t.Any, _t.Any], _sa.ColumnElement[bool]]
+
+OPERATORS: dict[str, _Clause] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "in": lambda column, value: column.in_(value),
+    "contains": lambda column, value: column.contains(value, escape="/"),
+    "icontains": lambda column, value: column.icontains(value, escape="/"),
+    "startswith": lambda column, value: column.startswith(value, escape="/"),
+}
+LIKE_OPERATORS = frozenset({"contains", "icontains", "startswith"})
+SEARCH_PARAMETER = "fastadmin_search"
+# query parameters of pagination (`KeysetPage.as_components`) and search
+RESERVED_PARAMETERS = frozenset({"page", "limit", "after", "before"})
+
+
+class InvalidQuery(ValueError):
+    pass
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ParsedQuery:
+    """
+    Filters as `(column, operator)` pairs, sort keys as `(column, descending)`
+    and the search term parsed from query parameters. Bound values are kept
+    apart in `parameters`, so queries differing only in values share `shape`.
+    """
+
+    filters: tuple[tuple[str, str], ...] = ()
+    order_by: tuple[tuple[str, bool], ...] = ()
+    search: str | None = None
+    parameters: dict[str, _t.Any] = dataclasses.field(
+        default_factory=dict, compare=False
+    )
+
+    @property
+    def shape(self) -> tuple[_t.Hashable, ...]:
+        return self.filters, self.order_by, self.search is not None
+
+    def value(self, name: str, op: str = "eq") -> _t.Any:
+        return self.parameters.get(f"{name}__{op}")
+
+
+class QueryBuilder:
+    """
+    Turns query parameters into `WHERE`/`ORDER BY` clauses on a
+    `FastAdminTable`, so filtering, sorting and search run in the database.
+
+    Filters are `column=value` or `column__<operator>=value` (see
+    `OPERATORS`, plus `isnull`), sorting is `order_by=-age,name` and
+    search is `q=term`, matched against the table's `search_columns`.
+    Sorting is limited to primary key and indexed columns plus the table's
+    `sortable_columns`; filtering to `filterable_columns` (all by default).
+    Columns named like a `reserved` parameter, the sort or the search
+    parameter are only filtered with an explicit operator, e.g. `page__eq=2`.
+    Statements are built once per query shape and executed with the
+    parsed values as bound parameters. Used as a FastAPI dependency, an
+    instance parses the request's query parameters.
+    """
+
+    def __init__(
+        self,
+        table: "FastAdminTable",
+        *,
+        order_param: str = "order_by",
+        search_param: str = "q",
+        reserved: _t.Iterable[str] = RESERVED_PARAMETERS,
+        statement_cache_size: int | None = 64,
+    ):
+        self.table = table
+        self.order_param = order_param
+        self.search_param = search_param
+        self.reserved = frozenset({*reserved, order_param, search_param})
+
+        info = table.__fastadmin_metadata__()
+        self.filterable = self._check_columns(
+            info.column_names
+            if table.filterable_columns is None
+            else table.filterable_columns
+        )
+        self.sortable = self._check_columns(
+            (*info.primary_columns, *info.index_columns, *table.sortable_columns)
+        )
+        self.searchable = self._check_columns(table.search_columns)
+        self.default_order = tuple((name, False) for name in info.primary_key_names)
+
+        self._adapters: dict[tuple[str, str], _p.TypeAdapter[_t.Any]] = {}
+        self._statements: LRUCache[_t.Hashable, _t.Any] = LRUCache(statement_cache_size)
+        self._filter_model: type[BaseModelComponents] | None = None
+
+    def _check_columns(self, names: _t.Iterable[str]) -> dict[str, "FastColumn"]:
+        columns = {}
+        for name in names:
+            if name not in self.table.columns:
+                raise ValueError(f"Table `{self.table.name}` has no column `{name}`")
+            columns[name] = self.table.columns[name]
+        return columns
+
+    def _adapter(self, name: str, op: str) -> _p.TypeAdapter[_t.Any]:
+        adapter = self._adapters.get((name, op))
+        if adapter is None:
+            column = self.filterable[name]
+            python_type = column.anotation or column.type.python_type
+            if op == "isnull":
+                python_type = bool
+            elif op in LIKE_OPERATORS:
+                python_type = str
+            elif op == "in":
+                python_type = list[python_type]
+            adapter = self._adapters[(name, op)] = _p.TypeAdapter(python_type)
+        return adapter
+
+    def filter_param(self, name: str) -> str:
+        """
+        Query parameter of the equality filter on column `name`.
+        """
+        return f"{name}__eq" if name in self.reserved else name
+
+    def parse(self, params: _t.Mapping[str, str]) -> ParsedQuery:
+        """
+        Parse filters, sorting and search from `params`. Reserved parameters
+        and parameters not naming a column are left to other consumers
+        (e.g. pagination).
+        """
+        filters, parameters = set(), {}
+        for key, raw in params.items():
+            if key in self.reserved or raw == "":
+                continue
+            name, _, op = key.partition("__")
+            if name not in self.table.columns:
+                continue
+            op = op or "eq"
+            if name not in self.filterable:
+                raise InvalidQuery(f"Filtering by `{name}` is not allowed")
+            if op not in OPERATORS and op != "isnull":
+                raise InvalidQuery(f"Unknown filter operator `{op}`")
+
+            value = raw.split(",") if op == "in" else raw
+            try:
+                value = self._adapter(name, op).validate_python(value)
+            except _p.ValidationError as e:
+                raise InvalidQuery(f"Invalid value for `{key}`: {raw!r}") from e
+            if op in LIKE_OPERATORS:
+                value = _escape_like(value)
+            if op == "isnull":
+                # IS NULL and IS NOT NULL are different statements
+                op = "isnull" if value else "notnull"
+            else:
+                parameters[f"{name}__{op}"] = value
+            filters.add((name, op))
+
+        search = params.get(self.search_param) or None
+        if search is not None:
+            if not self.searchable:
+                raise InvalidQuery(f"Table `{self.table.name}` is not searchable")
+            parameters[SEARCH_PARAMETER] = _escape_like(search)
+
+        return ParsedQuery(
+            filters=tuple(sorted(filters)),
+            order_by=self._parse_order(params.get(self.order_param) or ""),
+            search=search,
+            parameters=parameters,
+        )
+
+    def _parse_order(self, raw: str) -> tuple[tuple[str, bool], ...]:
+        order_by = []
+        for item in filter(None, (item.strip() for item in raw.split(","))):
+            descending = item.startswith("-")
+            name = item.removeprefix("-")
+            if name not in self.sortable:
+                raise InvalidQuery(f"Sorting by `{name}` is not allowed")
+            order_by.append((name, descending))
+        return tuple(order_by)
+
+    def __call__(self, request: _fa.Request) -> ParsedQuery:
+        try:
+            return self.parse(request.query_params)
+        except InvalidQuery as e:
+            raise _fa.HTTPException(400, str(e)) from e
+
+    def where(self, query: ParsedQuery) -> tuple[_sa.ColumnElement[bool], ...]:
+        """
+        Clauses of `query` with bound parameters, to be executed with
+        `query.parameters`.
+        """
+        key = ("where", query.filters, query.search is not None)
+        return self._statements.get_or_set(key, lambda: self._where(query))
+
+    def _where(self, query: ParsedQuery) -> tuple[_sa.ColumnElement[bool], ...]:
+        clauses = []
+        for name, op in query.filters:
+            column = self.table.columns[name]
+            if op == "isnull":
+                clauses.append(column.is_(None))
+            elif op == "notnull":
+                clauses.append(column.is_not(None))
+            else:
+                value = _sa.bindparam(f"{name}__{op}", expanding=op == "in")
+                clauses.append(OPERATORS[op](column, value))
+
+        if query.search is not None:
+            value = _sa.bindparam(SEARCH_PARAMETER)
+            clauses.append(
+                _sa.or_(
+                    *(
+                        column.icontains(value, escape="/")
+                        for column in self.searchable.values()
+                    )
+                )
+            )
+        return tuple(clauses)
+
+    def statement(self, query: ParsedQuery) -> _sa.Select[_t.Any]:
+        """
+        `SELECT` of the table filtered and sorted by `query`, ending with
+        the primary key so that the order is stable.
+        """
+        return self._statements.get_or_set(
+            ("select", *query.shape), lambda: self._statement(query)
+        )
+
+    def _statement(self, query: ParsedQuery) -> _sa.Select[_t.Any]:
+        sorted_names = {name for name, _ in query.order_by}
+        order_by = [
+            *query.order_by,
+            *(item for item in self.default_order if item[0] not in sorted_names),
+        ]
+        return (
+            _sa.select(self.table)
+            .where(*self.where(query))
+            .order_by(
+                *(
+                    self.table.columns[name].desc()
+                    if descending
+                    else self.table.columns[name].asc()
+                    for name, descending in order_by
+                )
+            )
+        )
+
+    def _page(
+        self, query: ParsedQuery, limit: int | None, offset: int
+    ) -> _sa.Select[_t.Any]:
+        statement = self.statement(query)
+        if limit is not None:
+            statement = statement.limit(limit)
+        if offset:
+            statement = statement.offset(offset)
+        return statement
+
+    def fetch(
+        self,
+        connection: _sa.Connection,
+        query: ParsedQuery,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[_sa.Row[_t.Any]]:
+        statement = self._page(query, limit, offset)
+        return connection.execute(statement, query.parameters).all()
+
+    async def afetch(
+        self,
+        connection: "AsyncConnection",
+        query: ParsedQuery,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[_sa.Row[_t.Any]]:
+        statement = self._page(query, limit, offset)
+        return (await connection.execute(statement, query.parameters)).all()
+
+    def filter_model(self) -> type[BaseModelComponents]:
+        """
+        Model of the filter form: an optional equality field per filterable
+        column, the search term and the sort order.
+        """
+        if self._filter_model is None:
+            fields: dict[str, _t.Any] = {
+                self.filter_param(name): (
+                    _t.Optional[column.anotation or column.type.python_type],
+                    None,
+                )
+                for name, column in self.filterable.items()
+            }
+            if self.searchable:
+                fields[self.search_param] = (_t.Optional[str], None)
+            choices = [order for name in self.sortable for order in (name, f"-{name}")]
+            if choices:
+                fields[self.order_param] = (
+                    _t.Optional[_t.Literal[tuple(choices)]],  # type: ignore
+                    None,
+                )
+            self._filter_model = _p.create_model(
+                f"{self.table.__table_name__.title()}Filter",
+                __base__=BaseModelComponents,
+                **fields,
+            )
+        return self._filter_model
+
+    def filter_form(
+        self, query: ParsedQuery | None = None, submit_url: str = "."
+    ) -> components.ModelForm:
+        """
+        Form sending its values back as query parameters on change,
+        prefilled from `query`.
+        """
+        initial: dict[str, _t.Any] = {}
+        if query is not None:
+            for name, op in query.filters:
+                if op == "eq":
+                    initial[self.filter_param(name)] = query.value(name)
+            if query.search is not None:
+                initial[self.search_param] = query.search
+            if query.order_by:
+                name, descending = query.order_by[0]
+                initial[self.order_param] = f"-{name}" if descending else name
+
+        return self.filter_model().as_model_form(
+            submit_url=submit_url,
+            initial_data=_pc.to_jsonable_python(initial),
+            method="GOTO",
+            submit_on_change=True,
+        )
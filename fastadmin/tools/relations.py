@@ -0,0 +1,103 @@
+import dataclasses
+import threading
+import types
+import typing as _t
+
+import sqlalchemy as _sa
+
+if _t.TYPE_CHECKING:
+    from .tools import FastAdminTable, FastColumn
+
+_GRAPH_KEY = "fastadmin_foreign_key_graph"
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class ForeignKeyEdge:
+    """
+    `column` of `table` referring to `referred_column` of `referred_table`.
+    """
+
+    column: "FastColumn[_t.Any]"
+    referred_column: _sa.Column
+
+    @property
+    def table(self) -> "FastAdminTable":
+        return self.column.table
+
+    @property
+    def referred_table(self) -> "FastAdminTable":
+        return self.referred_column.table
+
+    @property
+    def name(self) -> str:
+        return self.column.name
+
+
+_NO_EDGES: tuple[ForeignKeyEdge, ...] = ()
+
+
+class ForeignKeyGraph:
+    """
+    Read-only index of the foreign keys between the tables of a `MetaData`,
+    with outgoing (`references`) and incoming (`referenced_by`) edges.
+    Built once per metadata by `ForeignKeyGraph.of` and rebuilt after tables,
+    columns or constraints are attached to it. Foreign keys whose referred
+    table is not part of the metadata yet are left out.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, metadata: _sa.MetaData):
+        self.metadata = metadata
+        self.size = len(metadata.tables)
+
+        forward: dict[_sa.Table, list[ForeignKeyEdge]] = {}
+        reverse: dict[_sa.Table, list[ForeignKeyEdge]] = {}
+        columns: dict[tuple[_sa.Table, str], ForeignKeyEdge] = {}
+        for table in metadata.tables.values():
+            for column in table.columns:
+                for foreign_key in column.foreign_keys:
+                    try:
+                        referred = foreign_key.column
+                    except _sa.exc.NoReferenceError:
+                        continue
+                    edge = ForeignKeyEdge(column, referred)
+                    forward.setdefault(table, []).append(edge)
+                    reverse.setdefault(referred.table, []).append(edge)
+                    columns.setdefault((table, column.name), edge)
+
+        self._forward = types.MappingProxyType(
+            {table: tuple(edges) for table, edges in forward.items()}
+        )
+        self._reverse = types.MappingProxyType(
+            {table: tuple(edges) for table, edges in reverse.items()}
+        )
+        self._columns = types.MappingProxyType(columns)
+        self.dependency_order: tuple[_sa.Table, ...] = tuple(metadata.sorted_tables)
+
+    @classmethod
+    def of(cls, metadata: _sa.MetaData) -> "ForeignKeyGraph":
+        graph = metadata.info.get(_GRAPH_KEY)
+        if graph is None or graph.size != len(metadata.tables):
+            with cls._lock:
+                graph = metadata.info.get(_GRAPH_KEY)
+                if graph is None or graph.size != len(metadata.tables):
+                    graph = metadata.info[_GRAPH_KEY] = cls(metadata)
+        return graph
+
+    @staticmethod
+    def invalidate(metadata: _sa.MetaData) -> None:
+        metadata.info.pop(_GRAPH_KEY, None)
+
+    def references(self, table: _sa.Table) -> tuple[ForeignKeyEdge, ...]:
+        return self._forward.get(table, _NO_EDGES)
+
+    def referenced_by(self, table: _sa.Table) -> tuple[ForeignKeyEdge, ...]:
+        return self._reverse.get(table, _NO_EDGES)
+
+    def edge(self, table: _sa.Table, column: str) -> ForeignKeyEdge | None:
+        return self._columns.get((table, column))
+
+    def __iter__(self) -> _t.Iterator[ForeignKeyEdge]:
+        for edges in self._forward.values():
+            yield from edges
@@ -0,0 +1,133 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+import threading
+import typing as _t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+
+class RenderPool:
+    """
+    Dedicated thread pool for sync page renders, so CPU-heavy renders do not
+    hold the event loop or compete with the default FastAPI threadpool.
+    The executor is started on first use and restarted after `shutdown`
+    or a change of `max_workers`.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "fastadmin-render"):
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("max_workers must be a positive integer")
+        with self._lock:
+            self._max_workers = value
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # renders already submitted finish on the old threads,
+            # the next render starts an executor of the new size
+            executor.shutdown(wait=False)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.thread_name_prefix,
+            )
+        return self._executor
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            return self._get_executor()
+
+    async def run[_R](self, func: _t.Callable[..., _R], *args, **kwds) -> _R:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args, **kwds)
+        # submit under the lock, so a concurrent restart cannot shut the
+        # executor down between getting and using it
+        with self._lock:
+            future = loop.run_in_executor(self._get_executor(), call)
+        return await future
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+class ConcurrencyLimit:
+    """
+    Limits how many calls run at once. The semaphore is bound to the running
+    event loop and is recreated when the loop changes.
+    """
+
+    def __init__(self, limit: int):
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
+
+        self.limit = limit
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._semaphore = loop, asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self._get_semaphore():
+            yield
+
+
+def render_endpoint(
+    render: _t.Callable[..., _t.Any],
+    pool: RenderPool,
+    concurrency: int | None = None,
+    is_async: bool | None = None,
+) -> _t.Callable[..., _t.Any]:
+    """
+    Make a page `render` awaitable. Sync renders run in `pool`, and at most
+    `concurrency` calls of the page run at once. The signature is kept, so
+    FastAPI still resolves the render parameters.
+    `is_async` is detected from `render` when not given.
+    """
+    if is_async is None:
+        is_async = inspect.iscoroutinefunction(render)
+    if is_async and concurrency is None:
+        return render
+
+    limit = None if concurrency is None else ConcurrencyLimit(concurrency)
+
+    async def call(*args, **kwds) -> _t.Any:
+        if is_async:
+            return await render(*args, **kwds)
+        return await pool.run(render, *args, **kwds)
+
+    if limit is None:
+
+        @functools.wraps(render)
+        async def endpoint(*args, **kwds) -> _t.Any:
+            return await call(*args, **kwds)
+
+    else:
+
+        @functools.wraps(render)
+        async def endpoint(*args, **kwds) -> _t.Any:
+            async with limit.acquire():
+                return await call(*args, **kwds)
+
+    return endpoint
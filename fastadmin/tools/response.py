@@ -0,0 +1,93 @@
+import functools
+import inspect
+import typing as _t
+
+import pydantic as _p
+from fastapi import responses
+from fastui import FastUI
+from fastui.components import Table
+
+_DUMP_OPTIONS: dict[str, _t.Any] = {"by_alias": True, "exclude_none": True}
+
+
+def _rows(data: _t.Any) -> _p.RootModel | None:
+    if not isinstance(data, list) or not data:
+        return None
+    model = type(data[0])
+    rows_model = getattr(model, "rows_model", None)
+    if rows_model is None or any(type(row) is not model for row in data):
+        return None
+    return rows_model().model_construct(data)
+
+
+def _typed_tables(value: _t.Any) -> _t.Any:
+    """
+    Give homogeneous tables their rows as a `rows_model` instance.
+    `Table.data` serializes each row through `SerializeAsAny`; anything
+    that is not a sequence is passed on to the serializer of its own type,
+    so the rows are dumped with the schema of their model in one pass.
+    """
+    if isinstance(value, Table):
+        rows = _rows(value.data)
+        if rows is None:
+            return value
+        return value.model_copy(update={"data": rows})
+
+    if isinstance(value, list):
+        items = [_typed_tables(item) for item in value]
+        if any(new is not old for new, old in zip(items, value)):
+            return items
+        return value
+
+    if isinstance(value, _p.BaseModel):
+        update = {}
+        for name, field_value in value.__dict__.items():
+            new_value = _typed_tables(field_value)
+            if new_value is not field_value:
+                update[name] = new_value
+        return value.model_copy(update=update) if update else value
+
+    return value
+
+
+def dump_components(components: _t.Any) -> bytes:
+    """
+    Serialize already validated components straight to JSON bytes,
+    without validating the tree again.
+    """
+    if isinstance(components, FastUI):
+        components = components.root
+
+    root = FastUI.model_construct(root=_typed_tables(components))
+    return FastUI.__pydantic_serializer__.to_json(root, **_DUMP_OPTIONS)
+
+
+class FastUIResponse(responses.JSONResponse):
+    def render(self, content: _t.Any) -> bytes:
+        return dump_components(content)
+
+
+def component_endpoint(render: _t.Callable[..., _t.Any]) -> _t.Callable[..., _t.Any]:
+    """
+    Wrap a page `render` so its components are returned as a `FastUIResponse`.
+    The signature is kept, so FastAPI still resolves the render parameters.
+    """
+
+    def as_response(content: _t.Any) -> responses.Response:
+        if isinstance(content, responses.Response):
+            return content
+        return FastUIResponse(content)
+
+    if inspect.iscoroutinefunction(render):
+
+        @functools.wraps(render)
+        async def endpoint(*args, **kwds) -> responses.Response:
+            return as_response(await render(*args, **kwds))
+
+    else:
+
+        @functools.wraps(render)
+        def endpoint(*args, **kwds) -> responses.Response:
+            return as_response(render(*args, **kwds))
+
+    return endpoint
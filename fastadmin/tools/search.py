@@ -0,0 +1,618 @@
+import abc
+import dataclasses
+import itertools
+import math
+import re
+import threading
+import typing as _t
+import weakref
+
+import pydantic as _p
+import sqlalchemy as _sa
+from fastui import components
+from sqlalchemy import event
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, BooleanClauseList
+
+from .components import BaseModelComponents
+
+if _t.TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+    from .tools import FastAdminTable
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: _t.Any) -> list[str]:
+    return _TOKEN.findall(str(text).lower()) if text is not None else []
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class SearchHit:
+    """
+    Primary key of a matching row and its relevance, higher is better.
+    """
+
+    key: tuple[_t.Any, ...]
+    score: float
+
+
+def _check_columns(table: "FastAdminTable", columns: _t.Sequence[str]) -> None:
+    for name in columns:
+        if name not in table.columns:
+            raise ValueError(f"Table `{table.name}` has no column `{name}`")
+    if not table.__fastadmin_metadata__().primary_key_names:
+        raise ValueError(f"Full-text search requires a primary key ({table.name})")
+
+
+class SearchIndex(abc.ABC):
+    """
+    Ranked full-text search over `columns` of a `FastAdminTable`.
+    Multiple terms match rows containing all of them.
+    """
+
+    def __init__(self, table: "FastAdminTable", columns: _t.Sequence[str]):
+        _check_columns(table, columns)
+        self.table = table
+        self.columns = tuple(columns)
+        self.primary_key_names = table.__fastadmin_metadata__().primary_key_names
+
+    @abc.abstractmethod
+    def search(
+        self, connection: _sa.Connection, term: str, limit: int = 20
+    ) -> list[SearchHit]: ...
+
+
+class FTS5Index(SearchIndex):
+    """
+    SQLite FTS5 index kept in an external-content shadow table
+    (`<table>_fts`), which triggers keep in sync with the table. The shadow
+    table is created and dropped with the table by `metadata.create_all`
+    and `drop_all`, or by `create` for existing databases. Ranked by bm25.
+    """
+
+    def __init__(self, table: "FastAdminTable", columns: _t.Sequence[str]):
+        super().__init__(table, columns)
+        if not self.supports(table):
+            raise ValueError(
+                f"FTS5 requires a single integer primary key ({table.name})"
+            )
+        self.name = f"{table.name}_fts"
+        self._available: weakref.WeakKeyDictionary[_sa.Engine, bool] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def supports(table: _sa.Table) -> bool:
+        primary = list(table.primary_key.columns)
+        return len(primary) == 1 and isinstance(primary[0].type, _sa.Integer)
+
+    def ddl(self) -> list[str]:
+        table, fts = _quote(self.table.name), _quote(self.name)
+        rowid = _quote(self.primary_key_names[0])
+        columns = ", ".join(_quote(name) for name in self.columns)
+        new = ", ".join(f"new.{_quote(name)}" for name in self.columns)
+        old = ", ".join(f"old.{_quote(name)}" for name in self.columns)
+        insert = f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.{rowid}, {new});"
+        delete = (
+            f"INSERT INTO {fts}({fts}, rowid, {columns}) "
+            f"VALUES ('delete', old.{rowid}, {old});"
+        )
+        trigger = "CREATE TRIGGER IF NOT EXISTS {} AFTER {} ON {} BEGIN {} END"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({columns}, "
+            f"content={table}, content_rowid={rowid})",
+            trigger.format(_quote(f"{self.name}_ai"), "INSERT", table, insert),
+            trigger.format(_quote(f"{self.name}_ad"), "DELETE", table, delete),
+            trigger.format(
+                _quote(f"{self.name}_au"), "UPDATE", table, delete + " " + insert
+            ),
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+
+    def create(self, connection: _sa.Connection, **kwds: _t.Any) -> None:
+        if connection.dialect.name != "sqlite":
+            return
+        for statement in self.ddl():
+            connection.exec_driver_sql(statement)
+        self._available.pop(connection.engine, None)
+
+    def drop(self, connection: _sa.Connection, **kwds: _t.Any) -> None:
+        if connection.dialect.name != "sqlite":
+            return
+        for suffix in ("_ai", "_ad", "_au"):
+            connection.exec_driver_sql(
+                f"DROP TRIGGER IF EXISTS {_quote(self.name + suffix)}"
+            )
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {_quote(self.name)}")
+        self._available.pop(connection.engine, None)
+
+    def _listeners(self) -> tuple[tuple[str, _t.Callable[..., None]], ...]:
+        return (
+            ("after_create", self._after_create),
+            ("before_drop", self._before_drop),
+        )
+
+    def install(self) -> None:
+        """
+        Create and drop the shadow table together with the table.
+        """
+        for name, listener in self._listeners():
+            if not event.contains(self.table, name, listener):
+                event.listen(self.table, name, listener)
+
+    def uninstall(self) -> None:
+        for name, listener in self._listeners():
+            if event.contains(self.table, name, listener):
+                event.remove(self.table, name, listener)
+
+    def _after_create(self, target: _sa.Table, connection: _sa.Connection, **kw):
+        self.create(connection)
+
+    def _before_drop(self, target: _sa.Table, connection: _sa.Connection, **kw):
+        self.drop(connection)
+
+    def available(self, connection: _sa.Connection) -> bool:
+        if connection.dialect.name != "sqlite":
+            return False
+        available = self._available.get(connection.engine)
+        if available is None:
+            available = self._available[connection.engine] = (
+                connection.execute(
+                    _sa.text(
+                        "SELECT 1 FROM sqlite_master "
+                        "WHERE type = 'table' AND name = :name"
+                    ),
+                    {"name": self.name},
+                ).scalar()
+                is not None
+            )
+        return available
+
+    @staticmethod
+    def match_expression(term: str) -> str:
+        # quoted tokens, so FTS5 query syntax in the term is matched literally
+        return " ".join(f'"{token}"' for token in tokenize(term))
+
+    def search(
+        self, connection: _sa.Connection, term: str, limit: int = 20
+    ) -> list[SearchHit]:
+        match = self.match_expression(term)
+        if not match:
+            return []
+        fts = _quote(self.name)
+        result = connection.execute(
+            _sa.text(
+                f"SELECT rowid, bm25({fts}) AS rank FROM {fts} "
+                f"WHERE {fts} MATCH :match ORDER BY rank LIMIT :limit"
+            ),
+            {"match": match, "limit": limit},
+        )
+        # bm25 is lower for better matches
+        return [SearchHit((rowid,), -rank) for rowid, rank in result]
+
+
+_PENDING = "fastadmin_search_pending"
+_SAVEPOINTS = "fastadmin_search_savepoints"
+_STALE = object()
+
+
+class InvertedIndex(SearchIndex):
+    """
+    In-process inverted index ranked with BM25, for backends without a
+    native full-text index. Built from the table on the first search and
+    then kept up to date from the writes of committed transactions on
+    the engine it was built from: inserted rows are indexed as they are,
+    and the rows of updates and deletes matching the primary key are
+    selected again after the statement. Other updates and deletes mark
+    the index stale, so the next search rebuilds it.
+    Searching through another engine rebuilds the index for that engine.
+    """
+
+    #: primary keys selected again per statement after an update or delete
+    reselect_size = 500
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, table: "FastAdminTable", columns: _t.Sequence[str]):
+        super().__init__(table, columns)
+        self.postings: dict[str, dict[tuple[_t.Any, ...], int]] = {}
+        self.lengths: dict[tuple[_t.Any, ...], int] = {}
+        self.terms: dict[tuple[_t.Any, ...], frozenset[str]] = {}
+        self.stale = True
+        self._lock = threading.RLock()
+        self._engine: weakref.ref[_sa.Engine] | None = None
+
+    @property
+    def engine(self) -> _sa.Engine | None:
+        return None if self._engine is None else self._engine()
+
+    def build(self, connection: _sa.Connection) -> None:
+        # watch first, so writes committed while the table is read are kept
+        self.watch(connection.engine)
+        keys = [self.table.columns[name] for name in self.primary_key_names]
+        values = [self.table.columns[name] for name in self.columns]
+        rows = connection.execute(_sa.select(*keys, *values)).all()
+        size = len(keys)
+
+        with self._lock:
+            self.postings, self.lengths, self.terms = {}, {}, {}
+            for row in rows:
+                self._add(tuple(row[:size]), row[size:])
+            self.stale = False
+
+    def _add(self, key: tuple[_t.Any, ...], values: _t.Iterable[_t.Any]) -> None:
+        self._remove(key)
+        tokens = [token for value in values for token in tokenize(value)]
+        for token in tokens:
+            counts = self.postings.setdefault(token, {})
+            counts[key] = counts.get(key, 0) + 1
+        self.lengths[key] = len(tokens)
+        self.terms[key] = frozenset(tokens)
+
+    def _remove(self, key: tuple[_t.Any, ...]) -> None:
+        self.lengths.pop(key, None)
+        for token in self.terms.pop(key, ()):
+            del self.postings[token][key]
+            if not self.postings[token]:
+                del self.postings[token]
+
+    def add(self, key: tuple[_t.Any, ...], values: _t.Iterable[_t.Any]) -> None:
+        with self._lock:
+            self._add(key, values)
+
+    def remove(self, key: tuple[_t.Any, ...]) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _listeners(self) -> tuple[tuple[str, _t.Callable[..., None]], ...]:
+        return (
+            ("after_execute", self._record),
+            ("savepoint", self._savepoint),
+            ("release_savepoint", self._release_savepoint),
+            ("rollback_savepoint", self._rollback_savepoint),
+            ("commit", self._apply),
+            ("rollback", self._discard),
+        )
+
+    def watch(self, engine: _sa.Engine) -> None:
+        """
+        Follow the writes to the table on `engine`, instead of the engine
+        watched so far.
+        """
+        if self.engine is engine:
+            return
+        self.unwatch()
+        for name, listener in self._listeners():
+            event.listen(engine, name, listener)
+        self._engine = weakref.ref(engine)
+
+    def unwatch(self) -> None:
+        engine = self.engine
+        if engine is not None:
+            for name, listener in self._listeners():
+                event.remove(engine, name, listener)
+        self._engine = None
+
+    def _record(
+        self,
+        conn: _sa.Connection,
+        clauseelement: _t.Any,
+        multiparams: _t.Sequence[_t.Mapping[str, _t.Any]],
+        params: _t.Mapping[str, _t.Any],
+        execution_options: _t.Any,
+        result: _t.Any,
+    ) -> None:
+        if getattr(clauseelement, "is_dml", False) is False:
+            return
+        table = getattr(clauseelement, "table", None)
+        # ORM statements refer to an annotated copy of the table
+        if table is None or table._deannotate() is not self.table:
+            return
+
+        pending = conn.info.setdefault(_PENDING, {}).setdefault(self, [])
+        context = getattr(result, "context", None)
+        parameters = getattr(context, "compiled_parameters", None)
+        if not parameters:
+            pending.append(_STALE)
+        elif clauseelement.is_insert:
+            self._record_inserts(result, parameters, pending)
+        else:
+            self._record_matched(conn, context.compiled, parameters, pending)
+
+    def _record_inserts(
+        self,
+        result: _sa.CursorResult[_t.Any],
+        parameters: _t.Sequence[_t.Mapping[str, _t.Any]],
+        pending: list[_t.Any],
+    ) -> None:
+        try:
+            inserted = result.inserted_primary_key_rows
+        except _sa.exc.InvalidRequestError:
+            inserted = [None] * len(parameters)
+
+        for values, inserted_key in zip(parameters, inserted):
+            key = tuple(values.get(name) for name in self.primary_key_names)
+            if None in key and inserted_key is not None:
+                key = tuple(inserted_key)
+            if None in key:
+                pending.append(_STALE)
+                return
+            pending.append((key, tuple(values.get(name) for name in self.columns)))
+
+    def _record_matched(
+        self,
+        conn: _sa.Connection,
+        compiled: _sa.Compiled,
+        parameters: _t.Sequence[_t.Mapping[str, _t.Any]],
+        pending: list[_t.Any],
+    ) -> None:
+        # the compiled statement, as its bind names are those of `parameters`
+        statement = compiled.statement
+        binds = self._primary_key_binds(statement)
+        if binds is None:
+            pending.append(_STALE)
+            return
+        names = [compiled.bind_names[bind] for bind in binds]
+        if statement.is_update and self._sets_primary_key(statement, parameters, names):
+            pending.append(_STALE)
+            return
+
+        keys = {tuple(values[name] for name in names) for values in parameters}
+        rows = {}
+        primary = [self.table.columns[name] for name in self.primary_key_names]
+        columns = [self.table.columns[name] for name in self.columns]
+        size = len(primary)
+        for chunk in itertools.batched(keys, self.reselect_size):
+            if size > 1:
+                where = _sa.tuple_(*primary).in_(chunk)
+            else:
+                where = primary[0].in_([key[0] for key in chunk])
+            for row in conn.execute(_sa.select(*primary, *columns).where(where)):
+                rows[tuple(row[:size])] = tuple(row[size:])
+
+        # updated rows are indexed again, deleted ones removed
+        pending.extend((key, None) for key in keys if key not in rows)
+        pending.extend(rows.items())
+
+    def _primary_key_binds(self, statement: _t.Any) -> list[BindParameter] | None:
+        """
+        Bind parameters compared with each primary key column in the WHERE
+        clause of `statement`, when the clause requires all of them.
+        """
+        where = getattr(statement, "whereclause", None)
+        if where is None:
+            return None
+        if isinstance(where, BooleanClauseList) and where.operator is operators.and_:
+            clauses = where.clauses
+        else:
+            clauses = [where]
+
+        binds = {}
+        for clause in clauses:
+            if not isinstance(clause, BinaryExpression):
+                continue
+            if clause.operator is not operators.eq:
+                continue
+            column, value = clause.left, clause.right
+            if isinstance(column, BindParameter):
+                column, value = value, column
+            if (
+                isinstance(column, _sa.Column)
+                and column.table._deannotate() is self.table
+                and column.name in self.primary_key_names
+                and isinstance(value, BindParameter)
+                and not value.expanding
+            ):
+                binds[column.name] = value
+        if len(binds) != len(self.primary_key_names):
+            return None
+        return [binds[name] for name in self.primary_key_names]
+
+    def _sets_primary_key(
+        self,
+        statement: _t.Any,
+        parameters: _t.Sequence[_t.Mapping[str, _t.Any]],
+        where_names: _t.Collection[str],
+    ) -> bool:
+        # the SET clause comes from `values()` or from the parameter names
+        values = dict(statement._ordered_values or ()) or statement._values or {}
+        keys = {getattr(column, "key", column) for column in values}
+        keys.update(name for name in parameters[0] if name not in where_names)
+        return any(
+            self.table.columns[name].key in keys for name in self.primary_key_names
+        )
+
+    def _savepoint(self, conn: _sa.Connection, name: str | None) -> None:
+        # savepoints are nested, the last one is released or rolled back first
+        pending = conn.info.get(_PENDING, {}).get(self, ())
+        conn.info.setdefault(_SAVEPOINTS, {}).setdefault(self, []).append(len(pending))
+
+    def _release_savepoint(
+        self, conn: _sa.Connection, name: str, context: _t.Any
+    ) -> None:
+        marks = conn.info.get(_SAVEPOINTS, {}).get(self)
+        if marks:
+            marks.pop()
+
+    def _rollback_savepoint(
+        self, conn: _sa.Connection, name: str, context: _t.Any
+    ) -> None:
+        # writes made since the savepoint are undone
+        marks = conn.info.get(_SAVEPOINTS, {}).get(self)
+        pending = conn.info.get(_PENDING, {}).get(self)
+        if marks:
+            mark = marks.pop()
+            if pending is not None:
+                del pending[mark:]
+
+    def _apply(self, conn: _sa.Connection) -> None:
+        conn.info.get(_SAVEPOINTS, {}).pop(self, None)
+        pending = conn.info.get(_PENDING, {}).pop(self, None)
+        if not pending:
+            return
+        with self._lock:
+            for change in pending:
+                if change is _STALE:
+                    self.stale = True
+                    break
+                key, values = change
+                if values is None:
+                    self._remove(key)
+                else:
+                    self._add(key, values)
+
+    def _discard(self, conn: _sa.Connection) -> None:
+        conn.info.get(_SAVEPOINTS, {}).pop(self, None)
+        conn.info.get(_PENDING, {}).pop(self, None)
+
+    def search(
+        self, connection: _sa.Connection, term: str, limit: int = 20
+    ) -> list[SearchHit]:
+        tokens = set(tokenize(term))
+        if not tokens:
+            return []
+        if self.stale or connection.engine is not self.engine:
+            self.build(connection)
+
+        with self._lock:
+            postings = [self.postings.get(token, {}) for token in tokens]
+            if not all(postings):
+                return []
+            size = len(self.lengths)
+            average = sum(self.lengths.values()) / size
+
+            postings.sort(key=len)
+            keys = set(postings[0]).intersection(*postings[1:])
+            scores = dict.fromkeys(keys, 0.0)
+            for counts in postings:
+                idf = math.log(1 + (size - len(counts) + 0.5) / (len(counts) + 0.5))
+                for key in keys:
+                    frequency = counts[key]
+                    norm = 1 - self.b + self.b * self.lengths[key] / average
+                    scores[key] += (
+                        idf * frequency * (self.k1 + 1) / (frequency + self.k1 * norm)
+                    )
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [SearchHit(key, score) for key, score in ranked]
+
+
+class FullTextSearch:
+    """
+    Full-text search of a table, using FTS5 on SQLite when the shadow
+    table exists and the in-process `InvertedIndex` everywhere else.
+    """
+
+    def __init__(self, table: "FastAdminTable", columns: _t.Sequence[str]):
+        _check_columns(table, columns)
+        self.table = table
+        self.columns = tuple(columns)
+        self._inverted: weakref.WeakKeyDictionary[_sa.Engine, InvertedIndex] = (
+            weakref.WeakKeyDictionary()
+        )
+        self.fts5 = FTS5Index(table, columns) if FTS5Index.supports(table) else None
+        if self.fts5 is not None:
+            self.fts5.install()
+
+    def create(self, connection: _sa.Connection) -> None:
+        """
+        Create the FTS5 shadow table when the table exists without it,
+        e.g. when it was created before the search was set up.
+        """
+        if self.fts5 is None or connection.dialect.name != "sqlite":
+            return
+        if self.fts5.available(connection):
+            return
+        if _sa.inspect(connection).has_table(self.table.name, self.table.schema):
+            self.fts5.create(connection)
+
+    def index(self, connection: _sa.Connection) -> SearchIndex:
+        if self.fts5 is not None and self.fts5.available(connection):
+            return self.fts5
+        return self.inverted(connection.engine)
+
+    def inverted(self, engine: _sa.Engine) -> InvertedIndex:
+        """
+        `InvertedIndex` of the table on `engine`, one per engine.
+        """
+        index = self._inverted.get(engine)
+        if index is None:
+            index = self._inverted[engine] = InvertedIndex(self.table, self.columns)
+        return index
+
+    def search(
+        self, connection: _sa.Connection, term: str, limit: int = 20
+    ) -> list[SearchHit]:
+        return self.index(connection).search(connection, term, limit)
+
+    def rows(
+        self, connection: _sa.Connection, term: str, limit: int = 20
+    ) -> list[tuple[_sa.Row[_t.Any], float]]:
+        """
+        Matching rows with their scores, best match first.
+        """
+        hits = self.search(connection, term, limit)
+        if not hits:
+            return []
+
+        info = self.table.__fastadmin_metadata__()
+        keys = [self.table.columns[name] for name in info.primary_key_names]
+        statement = _sa.select(self.table).where(
+            _sa.tuple_(*keys).in_([hit.key for hit in hits])
+            if len(keys) > 1
+            else keys[0].in_([hit.key[0] for hit in hits])
+        )
+        rows = {
+            info.primary_key_from_mapping(row._mapping): row
+            for row in connection.execute(statement)
+        }
+        return [(rows[hit.key], hit.score) for hit in hits if hit.key in rows]
+
+    async def asearch(
+        self, connection: "AsyncConnection", term: str, limit: int = 20
+    ) -> list[SearchHit]:
+        return await connection.run_sync(self.search, term, limit)
+
+    async def arows(
+        self, connection: "AsyncConnection", term: str, limit: int = 20
+    ) -> list[tuple[_sa.Row[_t.Any], float]]:
+        return await connection.run_sync(self.rows, term, limit)
+
+
+class SearchForm(BaseModelComponents):
+    q: str = _p.Field(title="Search")
+
+
+def search_page(
+    table: "FastAdminTable",
+    term: str,
+    results: _t.Sequence[tuple[_sa.Row[_t.Any], float]],
+    *,
+    submit_url: str = ".",
+) -> list[components.AnyComponent]:
+    """
+    Components of a search page: a search form sending `q` as a query
+    parameter and the matching rows, best match first.
+    """
+    model = table.as_pydantic_model()
+    body: list[components.AnyComponent] = [
+        components.Heading(text=f"Search {table.name}", level=2),
+        SearchForm.as_model_form(
+            submit_url=submit_url, initial_data={"q": term}, method="GOTO"
+        ),
+    ]
+    if term:
+        body.append(
+            model.as_model_table(
+                [row for row, _ in results],
+                no_data_message=f"Nothing matches `{term}`",
+            )
+        )
+    return [components.Page(components=body)]
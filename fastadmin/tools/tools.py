@@ -1,3 +1,4 @@
+import operator
 import typing as _t
 
 import pydantic as _p
@@ -24,15 +25,39 @@ from sqlalchemy.sql.schema import (
     _ServerOnUpdateArgument,
 )
 
-from .components import BaseModelComponents
+from .cache import CacheInfo, LRUCache, freeze
+from .fields import EMPTY_FIELD_SPEC, FieldSpec, FieldSpecAttribute, copy_field_info
+from .lazy import lazy_attributes
+from .relations import ForeignKeyGraph
+
+if _t.TYPE_CHECKING:
+    from .bulk import BulkMode, BulkResult
+    from .components import BaseModelComponents
+    from .counts import RowCounter
+    from .query import QueryBuilder
+    from .search import FullTextSearch
 
 
 class FastAdminTable(_sa.Table):  # type: ignore
-    cache_pydantic_models: _t.ClassVar[bool] = False
+    cache_pydantic_models: _t.ClassVar[bool] = True
+    pydantic_models_cache_size: _t.ClassVar[int | None] = 32
+    trust_rows: bool = False
+    bulk_chunk_size: int = 1000
+    filterable_columns: tuple[str, ...] | None = None
+    sortable_columns: tuple[str, ...] = ()
+    search_columns: tuple[str, ...] = ()
+    count_mode: str = "tracked"
+    count_ttl: float | None = 60.0
+    count_estimate_threshold: int = 100_000
+    fulltext_columns: tuple[str, ...] = ()
 
     if _t.TYPE_CHECKING:
         __table_name__: str
         __table_info__: "TableInfo" | None
+        __query_builder__: "QueryBuilder | None"
+        __row_counter__: "RowCounter | None"
+        __full_text_search__: "FullTextSearch | None"
+        __pydantic_models__: LRUCache[_t.Hashable, type[BaseModelComponents]]
         _columns: DedupeColumnCollection["FastColumn[_t.Any]"]
 
     @classmethod
@@ -51,7 +76,11 @@ class FastAdminTable(_sa.Table):  # type: ignore
 
         table.__table_name__ = name
         table.__table_info__ = None
-        table.__pydantic_model__ = None
+        table.__query_builder__ = None
+        table.__row_counter__ = None
+        table.__full_text_search__ = None
+        table.__pydantic_models__ = LRUCache(cls.pydantic_models_cache_size)
+        table.__fastadmin_metadata__()
 
         return table
 
@@ -69,10 +98,43 @@ class FastAdminTable(_sa.Table):  # type: ignore
         cls_kwargs: dict[str, _t.Any] | None = None,
         exclude: list[str] = ...,  # type: ignore
     ):
-        if self.cache_pydantic_models and self.__pydantic_model__ is not None:
-            return self.__pydantic_model__
-
         exclude = [] if isinstance(exclude, (list, tuple, set)) is False else exclude
+        model_config = {
+            "config": config,
+            "doc": doc,
+            "base": base,
+            "module": module,
+            "validators": validators,
+            "cls_kwargs": cls_kwargs,
+            "exclude": exclude,
+        }
+
+        if self.cache_pydantic_models is False:
+            return self._build_pydantic_model(**model_config)
+
+        return self.__pydantic_models__.get_or_set(
+            self._pydantic_model_key(**model_config),
+            lambda: self._build_pydantic_model(**model_config),
+        )
+
+    @staticmethod
+    def _pydantic_model_key(
+        exclude: _t.Iterable[str], **model_config: _t.Any
+    ) -> _t.Hashable:
+        return freeze(model_config), frozenset(exclude)
+
+    def _build_pydantic_model(
+        self,
+        config: _p.ConfigDict | None,
+        doc: str | None,
+        base: type[_p.BaseModel] | tuple[type[_p.BaseModel], ...] | None,
+        module: str,
+        validators: dict[str, _t.Callable[[_t.Any], _t.Any]] | None,
+        cls_kwargs: dict[str, _t.Any] | None,
+        exclude: list[str],
+    ) -> "type[BaseModelComponents]":
+        from .components import BaseModelComponents
+
         define_columns = {
             name: (
                 column.anotation or column.type.python_type,
@@ -94,6 +156,7 @@ class FastAdminTable(_sa.Table):  # type: ignore
         )
         model = type(model.__name__, (model, BaseModelComponents), {})
 
+        model.__fastadmin_table__ = self
         model.fast_model_config = {
             "config": config,
             "doc": doc,
@@ -103,11 +166,14 @@ class FastAdminTable(_sa.Table):  # type: ignore
             "cls_kwargs": cls_kwargs,
             "exclude": exclude,
         }
-
-        if self.cache_pydantic_models:
-            self.__pydantic_model__ = model
         return model
 
+    def pydantic_models_cache_info(self) -> CacheInfo:
+        return self.__pydantic_models__.info()
+
+    def invalidate_pydantic_models(self) -> None:
+        self.__pydantic_models__.clear()
+
     @staticmethod
     def _clone_foregin_keys(foreign_keys: set[_sa.ForeignKey]):
         return {fk._copy() for fk in foreign_keys}
@@ -147,33 +213,119 @@ class FastAdminTable(_sa.Table):  # type: ignore
         return handled
 
     def __fastadmin_metadata__(self) -> "TableInfo":
-        if self.__table_info__ is not None:
-            return self.__table_info__
-
-        info = TableInfo(table=self, table_name=self.__table_name__)  # type: ignore
-        for column in self.columns:
-            pre_added = {column.name: column}
-            if column.primary_key is True:
-                info.primary_columns.update(pre_added)
-            if (
-                column.default is not None
-                or column.default_factory != _pc.PydanticUndefined
-            ):
-                info.default_columns.update(pre_added)
-            if column.unique is True:
-                info.unique_columns.update(pre_added)
-            if column.index is True:
-                info.index_columns.update(pre_added)
-            if column.nullable is True:
-                info.nullable_columns.update(pre_added)
-            if len(column.foreign_keys) > 0:
-                info.foregin_colummns.update(pre_added)
-        self.__table_info__ = info
+        info = self.__table_info__
+        if info is None:
+            info = self.__table_info__ = TableInfo.compile(self)
         return info
 
+    def invalidate_table_info(self) -> None:
+        self.__table_info__ = None
+        self.__query_builder__ = None
+
+    def query_builder(self) -> "QueryBuilder":
+        """
+        Default `QueryBuilder` of the table, rebuilt with the table info.
+        """
+        builder = self.__query_builder__
+        if builder is None:
+            from .query import QueryBuilder
+
+            builder = self.__query_builder__ = QueryBuilder(self)
+        return builder
+
+    def row_counter(self) -> "RowCounter":
+        """
+        `RowCounter` of the table, configured by the `count_*` attributes.
+        """
+        counter = self.__row_counter__
+        if counter is None:
+            from .counts import RowCounter
+
+            counter = self.__row_counter__ = RowCounter(
+                self,
+                self.count_mode,
+                ttl=self.count_ttl,
+                estimate_threshold=self.count_estimate_threshold,
+            )
+        return counter
+
+    def full_text_search(self) -> "FullTextSearch":
+        """
+        `FullTextSearch` over the `fulltext_columns` of the table. Call it
+        before `metadata.create_all` to create the SQLite FTS5 index with
+        the table.
+        """
+        search = self.__full_text_search__
+        if search is None:
+            if not self.fulltext_columns:
+                raise ValueError(f"Table `{self.name}` has no fulltext_columns")
+            from .search import FullTextSearch
+
+            search = self.__full_text_search__ = FullTextSearch(
+                self, self.fulltext_columns
+            )
+        return search
+
+    def foreign_key_graph(self) -> ForeignKeyGraph:
+        return ForeignKeyGraph.of(self.metadata)
+
+    async def bulk_write(
+        self,
+        rows: _t.Iterable[_t.Any],
+        mode: "BulkMode | str" = "insert",
+        *,
+        chunk_size: int | None = None,
+        model: "type[BaseModelComponents] | None" = None,
+    ) -> "BulkResult":
+        """
+        Validate and insert or update many rows in one transaction,
+        `bulk_chunk_size` rows per statement. See `bulk.bulk_write`.
+        """
+        from .bulk import bulk_write
+
+        return await bulk_write(self, rows, mode, chunk_size=chunk_size, model=model)
+
 
 class FastColumn[_T](_sa.Column):
     inherit_cache = True
+    __field_spec__: FieldSpec = EMPTY_FIELD_SPEC
+    __pydantic_fields__: dict[str, tuple[tuple, _pf.FieldInfo]] | None = None
+
+    default_factory = FieldSpecAttribute()
+    alias = FieldSpecAttribute()
+    alias_priority = FieldSpecAttribute()
+    validation_alias = FieldSpecAttribute()
+    serialization_alias = FieldSpecAttribute()
+    title = FieldSpecAttribute()
+    field_title_generator = FieldSpecAttribute()
+    examples = FieldSpecAttribute()
+    exclude = FieldSpecAttribute()
+    discriminator = FieldSpecAttribute()
+    deprecated = FieldSpecAttribute()
+    json_schema_extra = FieldSpecAttribute()
+    frozen = FieldSpecAttribute()
+    validate_default = FieldSpecAttribute()
+    repr = FieldSpecAttribute()
+    init = FieldSpecAttribute()
+    init_var = FieldSpecAttribute()
+    kw_only = FieldSpecAttribute()
+    pattern = FieldSpecAttribute()
+    strict = FieldSpecAttribute()
+    coerce_numbers_to_str = FieldSpecAttribute()
+    gt = FieldSpecAttribute()
+    ge = FieldSpecAttribute()
+    lt = FieldSpecAttribute()
+    le = FieldSpecAttribute()
+    multiple_of = FieldSpecAttribute()
+    allow_inf_nan = FieldSpecAttribute()
+    max_digits = FieldSpecAttribute()
+    decimal_places = FieldSpecAttribute()
+    min_length = FieldSpecAttribute()
+    max_length = FieldSpecAttribute()
+    union_mode = FieldSpecAttribute()
+    fail_fast = FieldSpecAttribute()
+    pydantic_extra = FieldSpecAttribute()
+    anotation = FieldSpecAttribute()
 
     def __init__(
         self,
@@ -272,43 +424,73 @@ class FastColumn[_T](_sa.Column):
             _proxies=_proxies,
             **dialect_kwargs,
         )
-        self.default_factory = default_factory
-        self.alias = alias
-        self.alias_priority = alias_priority
-        self.validation_alias = validation_alias
-        self.serialization_alias = serialization_alias
-        self.title = title
-        self.field_title_generator = field_title_generator
-        self.examples = examples
-        self.exclude = exclude
-        self.discriminator = discriminator
-        self.deprecated = deprecated
-        self.json_schema_extra = json_schema_extra
-        self.frozen = frozen
-        self.validate_default = validate_default
-        self.repr = repr
-        self.init = init
-        self.init_var = init_var
-        self.kw_only = kw_only
-        self.pattern = pattern
-        self.strict = strict
-        self.coerce_numbers_to_str = coerce_numbers_to_str
-        self.gt = gt
-        self.ge = ge
-        self.lt = lt
-        self.le = le
-        self.multiple_of = multiple_of
-        self.allow_inf_nan = allow_inf_nan
-        self.max_digits = max_digits
-        self.decimal_places = decimal_places
-        self.min_length = min_length
-        self.max_length = max_length
-        self.union_mode = union_mode
-        self.fail_fast = fail_fast
-        self.pydantic_extra = pydantic_extra or {}
-        self.anotation = anotation
+        self.__field_spec__ = FieldSpec(
+            default_factory=default_factory,
+            alias=alias,
+            alias_priority=alias_priority,
+            validation_alias=validation_alias,
+            serialization_alias=serialization_alias,
+            title=title,
+            field_title_generator=field_title_generator,
+            examples=examples,
+            exclude=exclude,
+            discriminator=discriminator,
+            deprecated=deprecated,
+            json_schema_extra=json_schema_extra,
+            frozen=frozen,
+            validate_default=validate_default,
+            repr=repr,
+            init=init,
+            init_var=init_var,
+            kw_only=kw_only,
+            pattern=pattern,
+            strict=strict,
+            coerce_numbers_to_str=coerce_numbers_to_str,
+            gt=gt,
+            ge=ge,
+            lt=lt,
+            le=le,
+            multiple_of=multiple_of,
+            allow_inf_nan=allow_inf_nan,
+            max_digits=max_digits,
+            decimal_places=decimal_places,
+            min_length=min_length,
+            max_length=max_length,
+            union_mode=union_mode,
+            fail_fast=fail_fast,
+            pydantic_extra=pydantic_extra,
+            anotation=anotation,
+        )
 
     def as_pydantic_field_info(self) -> _p.fields.FieldInfo:
+        return self._cached_field("field_info", self._build_pydantic_field_info)
+
+    def as_pydantic_field(self) -> _t.Any:
+        return self._cached_field("field", self._build_pydantic_field)
+
+    def _pydantic_field_key(self) -> tuple:
+        return (self.__field_spec__, self.default, self.doc, self.type)
+
+    def _cached_field(
+        self, kind: str, build: _t.Callable[[], _pf.FieldInfo]
+    ) -> _pf.FieldInfo:
+        """
+        Build the field once per set of Pydantic-relevant attributes and hand
+        out copies, since pydantic mutates the `FieldInfo` it is given.
+        """
+        if self.__pydantic_fields__ is None:
+            self.__pydantic_fields__ = {}
+
+        key = self._pydantic_field_key()
+        cached = self.__pydantic_fields__.get(kind)
+        if cached is None or any(a is not b for a, b in zip(cached[0], key)):
+            cached = self.__pydantic_fields__[kind] = (key, build())
+        return copy_field_info(cached[1])
+
+    def invalidate_pydantic_fields(self) -> None:
+        self.__pydantic_fields__ = None
+
+    def _build_pydantic_field_info(self) -> _p.fields.FieldInfo:
         return _p.fields.FieldInfo(
             annotation=self.type.python_type,
             default_factory=self.default_factory,
@@ -347,7 +529,7 @@ class FastColumn[_T](_sa.Column):
             default=self._handle_default(),
         )
 
-    def as_pydantic_field(self) -> _t.Any:
+    def _build_pydantic_field(self) -> _t.Any:
         return _p.Field(
             default=self._handle_default(),
             default_factory=self.default_factory,
@@ -456,46 +638,48 @@ class FastMappedColumn[_T](MappedColumn):
         self.column = FastAdminTable._proccess_columns(self.column)[0]
 
         self.column.default = default
-        self.column.default_factory = (
-            default_factory
-            if default_factory != _sa.sql.base._NoArg.NO_ARG
-            else _pf._Unset
-        )
-        self.column.alias = alias
-        self.column.alias_priority = alias_priority
-        self.column.validation_alias = validation_alias
-        self.column.serialization_alias = serialization_alias
-        self.column.title = title
-        self.column.field_title_generator = field_title_generator
-        self.column.examples = examples
-        self.column.exclude = exclude
-        self.column.discriminator = discriminator
-        self.column.deprecated = deprecated
-        self.column.json_schema_extra = json_schema_extra
-        self.column.frozen = frozen
-        self.column.validate_default = validate_default
-        self.column.repr = repr if isinstance(repr, bool) else _pf._Unset
-        self.column.init = init if isinstance(init, bool) else _pf._Unset
-        self.column.init_var = init_var
-        self.column.kw_only = kw_only if isinstance(kw_only, bool) else _pf._Unset
-        self.column.pattern = pattern
-        self.column.strict = strict
-        self.column.coerce_numbers_to_str = coerce_numbers_to_str
-        self.column.gt = gt
-        self.column.ge = ge
-        self.column.lt = lt
-        self.column.le = le
-        self.column.multiple_of = multiple_of
-        self.column.allow_inf_nan = allow_inf_nan
-        self.column.max_digits = max_digits
-        self.column.decimal_places = decimal_places
-        self.column.min_length = min_length
-        self.column.max_length = max_length
-        self.column.union_mode = union_mode
-        self.column.fail_fast = fail_fast
-        self.column.pydantic_extra = pydantic_extra or {}
         self.column.doc = doc
-        self.column.anotation = anotation
+        self.column.__field_spec__ = FieldSpec(
+            default_factory=(
+                default_factory
+                if default_factory != _sa.sql.base._NoArg.NO_ARG
+                else _pf._Unset
+            ),
+            alias=alias,
+            alias_priority=alias_priority,
+            validation_alias=validation_alias,
+            serialization_alias=serialization_alias,
+            title=title,
+            field_title_generator=field_title_generator,
+            examples=examples,
+            exclude=exclude,
+            discriminator=discriminator,
+            deprecated=deprecated,
+            json_schema_extra=json_schema_extra,
+            frozen=frozen,
+            validate_default=validate_default,
+            repr=repr if isinstance(repr, bool) else _pf._Unset,
+            init=init if isinstance(init, bool) else _pf._Unset,
+            init_var=init_var,
+            kw_only=kw_only if isinstance(kw_only, bool) else _pf._Unset,
+            pattern=pattern,
+            strict=strict,
+            coerce_numbers_to_str=coerce_numbers_to_str,
+            gt=gt,
+            ge=ge,
+            lt=lt,
+            le=le,
+            multiple_of=multiple_of,
+            allow_inf_nan=allow_inf_nan,
+            max_digits=max_digits,
+            decimal_places=decimal_places,
+            min_length=min_length,
+            max_length=max_length,
+            union_mode=union_mode,
+            fail_fast=fail_fast,
+            pydantic_extra=pydantic_extra,
+            anotation=anotation,
+        )
 
 
 @dataclasses.dataclass(
@@ -507,6 +691,10 @@ class FastMappedColumn[_T](MappedColumn):
 class TableInfo:
     table: FastAdminTable
     table_name: str
+    columns: tuple[FastColumn[_t.Any], ...] = ()
+    column_names: tuple[str, ...] = ()
+    primary_key_names: tuple[str, ...] = ()
+    primary_key_from_mapping: _t.Callable[[_t.Any], tuple[_t.Any, ...]] | None = None
     primary_columns: dict[str, FastColumn[_t.Any]] = dataclasses.Field(
         default_factory=dict
     )
@@ -526,6 +714,69 @@ class TableInfo:
         default_factory=dict
     )
 
+    @classmethod
+    def compile(cls, table: FastAdminTable) -> "TableInfo":
+        columns = tuple(table.columns)
+        primary_key_names = tuple(c.name for c in columns if c.primary_key is True)
+        info = cls(
+            table=table,
+            table_name=table.__table_name__,
+            columns=columns,
+            column_names=tuple(column.name for column in columns),
+            primary_key_names=primary_key_names,
+            primary_key_from_mapping=_tuple_getter(primary_key_names),
+        )
+        for column in columns:
+            pre_added = {column.name: column}
+            if column.primary_key is True:
+                info.primary_columns.update(pre_added)
+            if (
+                column.default is not None
+                or column.default_factory != _pc.PydanticUndefined
+            ):
+                info.default_columns.update(pre_added)
+            if column.unique is True:
+                info.unique_columns.update(pre_added)
+            if column.index is True:
+                info.index_columns.update(pre_added)
+            if column.nullable is True:
+                info.nullable_columns.update(pre_added)
+            if len(column.foreign_keys) > 0:
+                info.foregin_colummns.update(pre_added)
+        return info
+
+
+def _tuple_getter(
+    names: tuple[str, ...],
+) -> _t.Callable[[_t.Any], tuple[_t.Any, ...]]:
+    # itemgetter returns a bare value for a single name
+    if len(names) == 1:
+        get = operator.itemgetter(names[0])
+        return lambda obj: (get(obj),)
+    if not names:
+        return lambda obj: ()
+    return operator.itemgetter(*names)
+
+
+@_sa.event.listens_for(FastAdminTable, "after_parent_attach")
+@_sa.event.listens_for(FastColumn, "after_parent_attach")
+@_sa.event.listens_for(_sa.ForeignKey, "after_parent_attach")
+@_sa.event.listens_for(_sa.Constraint, "after_parent_attach")
+def _invalidate_schema_caches(target: _t.Any, parent: _t.Any) -> None:
+    # tables, columns, foreign keys or constraints added after compilation
+    if isinstance(parent, _sa.MetaData):
+        ForeignKeyGraph.invalidate(parent)
+        return
+
+    table = parent if isinstance(parent, _sa.Table) else getattr(parent, "table", None)
+    if isinstance(table, FastAdminTable):
+        table.invalidate_table_info()
+        # not assigned yet while the table attaches its initial columns
+        if getattr(table, "__pydantic_models__", None) is not None:
+            table.invalidate_pydantic_models()
+    if isinstance(table, _sa.Table) and table.metadata is not None:
+        ForeignKeyGraph.invalidate(table.metadata)
+
 
 def fastadmin_mapped_column[_T](
     __name_pos: _t.Optional[
@@ -700,7 +951,39 @@ class FastBase(_declarative):  # type: ignore
             exclude=exclude,
         )
 
-        return _t.cast(_t.Union[type[BaseModelComponents], type[_t.Self]], model)
+        return _t.cast("type[BaseModelComponents] | type[_t.Self]", model)
+
+    @classmethod
+    def to_pydantic_models(
+        cls,
+        items: _t.Iterable[_t.Self],
+        config: _p.ConfigDict | None = None,
+        doc: str | None = None,
+        base: type[_p.BaseModel] | tuple[type[_p.BaseModel], ...] | None = None,
+        module: str = __name__,
+        validators: dict[str, _t.Callable[[_t.Any], _t.Any]] | None = None,
+        cls_kwargs: dict[str, _t.Any] | None = None,
+        exclude: _t.Iterable[str] = ...,
+        trusted: bool | None = None,
+    ):
+        model = cls.as_pydantic_model(
+            config=config,
+            doc=doc,
+            base=base,
+            module=module,
+            validators=validators,
+            cls_kwargs=cls_kwargs,
+            exclude=exclude,
+        )
+        trusted = model.trusts_rows() if trusted is None else trusted
+        rows = (item.__column_values__(model.model_fields) for item in items)
+
+        if trusted:
+            models = model.construct_many(rows)
+        else:
+            models = model.validate_many(rows)
+
+        return _t.cast("list[BaseModelComponents | _t.Self]", models)
 
     def to_pydantic_model(
         self,
@@ -711,6 +994,7 @@ class FastBase(_declarative):  # type: ignore
         validators: dict[str, _t.Callable[[_t.Any], _t.Any]] | None = None,
         cls_kwargs: dict[str, _t.Any] | None = None,
         exclude: _t.Iterable[str] = ...,
+        trusted: bool | None = None,
     ):
         model = self.__table__.as_pydantic_model(
             config=config,
@@ -721,34 +1005,36 @@ class FastBase(_declarative):  # type: ignore
             cls_kwargs=cls_kwargs,
             exclude=exclude,
         )
+        trusted = model.trusts_rows() if trusted is None else trusted
+        data = self.__column_values__(model.model_fields)
 
-        data = {
-            name: getattr(self, column.name)
+        if trusted:
+            instance = model.model_construct(**data)
+        else:
+            instance = model(**data)
+        return _t.cast("BaseModelComponents | _t.Self", instance)
+
+    def __column_values__(self, fields: _t.Container[str]) -> dict[str, _t.Any]:
+        return {
+            name: getattr(self, name)
             for column in self.__table__.columns
-            if (name := column.name) in model.model_fields
+            if (name := column.name) in fields
         }
 
-        return _t.cast(_t.Union[BaseModelComponents, _t.Self], model(**data))
-
     @classmethod
     def table_info(cls):
         return cls.__table__.__fastadmin_metadata__()
 
+    @classmethod
+    def foreign_key_graph(cls) -> ForeignKeyGraph:
+        return cls.__table__.foreign_key_graph()
+
     @classmethod
     def __iter_foregin_keys__(
         cls,
     ) -> _t.Generator[tuple[str, FastAdminTable], _t.Any, None]:
-        info = cls.table_info()
-
-        for name, column in info.foregin_colummns.items():
-            foregin_key = column.foreign_keys.pop()
-            constraint = foregin_key.constraint
-
-            if constraint is None:
-                continue
-
-            table = constraint.referred_table
-            yield name, table
+        for edge in cls.foreign_key_graph().references(cls.__table__):
+            yield edge.name, edge.referred_table
 
     @classmethod
     def __list_foregin_keys__(cls) -> list[tuple[str, FastAdminTable]]:
@@ -758,3 +1044,11 @@ class FastBase(_declarative):  # type: ignore
     def primary_key(cls):
         info = cls.table_info()
         return next(iter(info.primary_columns.values()))
+
+
+# BaseModelComponents imports FastUI, which pulls in FastAPI
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    globals(),
+    {"BaseModelComponents": (f"{__package__}.components", "BaseModelComponents")},
+)
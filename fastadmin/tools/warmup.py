@@ -0,0 +1,71 @@
+import dataclasses
+import time
+import typing as _t
+from concurrent.futures import ThreadPoolExecutor
+
+if _t.TYPE_CHECKING:
+    from .page import Page
+    from .tools import FastAdminTable
+
+
+@dataclasses.dataclass(slots=True)
+class WarmupReport:
+    """
+    Seconds spent warming each table and all pages, and in total.
+    """
+
+    tables: dict[str, float] = dataclasses.field(default_factory=dict)
+    pages: float = 0.0
+    elapsed: float = 0.0
+
+    def slowest(self, count: int = 5) -> list[tuple[str, float]]:
+        return sorted(self.tables.items(), key=lambda item: -item[1])[:count]
+
+
+def warm_table(table: "FastAdminTable") -> float:
+    """
+    Build and cache everything derived from `table` that requests use:
+    its `TableInfo`, the default Pydantic model with its core schema,
+    the list adapter and the form fields derived from the JSON schema.
+    """
+    started = time.perf_counter()
+    table.__fastadmin_metadata__()
+    model = table.as_pydantic_model()
+    model.list_adapter()
+    model.model_form_fields()
+    return time.perf_counter() - started
+
+
+def warm_pages(pages: _t.Iterable[type["Page"]]) -> float:
+    started = time.perf_counter()
+    for page in pages:
+        page.get_uri()
+        page.get_uri(add_root_uri=False)
+    return time.perf_counter() - started
+
+
+def warmup(
+    tables: _t.Iterable["FastAdminTable"],
+    pages: _t.Iterable[type["Page"]],
+    workers: int | None = None,
+) -> WarmupReport:
+    """
+    Warm `tables` and `pages`. Tables are independent of each other, so with
+    `workers` greater than one they are warmed in parallel on a thread pool.
+    """
+    started = time.perf_counter()
+    tables = list(tables)
+    report = WarmupReport()
+
+    if workers is not None and workers > 1 and len(tables) > 1:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fastadmin-warmup"
+        ) as executor:
+            timings = list(executor.map(warm_table, tables))
+    else:
+        timings = [warm_table(table) for table in tables]
+
+    report.tables = {table.fullname: timing for table, timing in zip(tables, timings)}
+    report.pages = warm_pages(pages)
+    report.elapsed = time.perf_counter() - started
+    return report
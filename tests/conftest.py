@@ -1,7 +1,9 @@
 import pytest
 import pytest_asyncio
 
-from .tables import FastBase, User, Post, Comment
+from .tables import FastBase, User, Post, Comment, samples
+
+from fastadmin.tools.connections import ConnectionManager
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker, Session
@@ -26,6 +28,15 @@ def engine(create_engine: _sa.Engine):
     create_engine.dispose()
 
 
+@pytest.fixture(scope="function")
+def samples_engine():
+    engine = _sa.create_engine("sqlite:///:memory:")
+    samples.create_all(engine)
+    yield engine
+    samples.drop_all(engine)
+    engine.dispose()
+
+
 @pytest.fixture(scope="session")
 def create_async_engine_fixture():
     return create_async_engine(
@@ -44,6 +55,16 @@ async def aengine(create_async_engine_fixture: AsyncEngine):
     await create_async_engine_fixture.dispose()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def connection_manager(engine: _sa.Engine, aengine: AsyncEngine):
+    ConnectionManager._instance = None
+    manager = ConnectionManager(engine, aengine)
+    yield manager
+    manager.registry.close_all()
+    await manager.async_registry.close_all()
+    ConnectionManager._instance = None
+
+
 @pytest.fixture(scope="function")
 def session(engine: _sa.Engine):
     Session = sessionmaker(bind=engine)
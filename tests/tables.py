@@ -34,3 +34,40 @@ Comment = FastAdminTable(
     FastColumn("post_id", _sa.Integer, _sa.ForeignKey("posts.id")),
     _sa.Column("user_id", _sa.Integer, _sa.ForeignKey("users.id")),
 )
+
+
+# standalone tables of the pagination, query, count and search tests
+samples = _sa.MetaData()
+
+Article = FastAdminTable(
+    "articles",
+    samples,
+    FastColumn("id", _sa.Integer, primary_key=True),
+    FastColumn("rank", _sa.Integer, index=True, nullable=False),
+    FastColumn("title", _sa.String, nullable=False),
+    FastColumn("note", _sa.String, index=True, nullable=True),
+)
+
+Book = FastAdminTable(
+    "books",
+    samples,
+    FastColumn("id", _sa.Integer, primary_key=True),
+    FastColumn("year", _sa.Integer, index=True, nullable=False),
+    FastColumn("title", _sa.String, nullable=False),
+    FastColumn("note", _sa.String, nullable=True),
+)
+
+Event = FastAdminTable(
+    "events",
+    samples,
+    FastColumn("id", _sa.Integer, primary_key=True),
+    FastColumn("kind", _sa.String, index=True, nullable=False),
+)
+
+Note = FastAdminTable(
+    "notes",
+    samples,
+    FastColumn("id", _sa.Integer, primary_key=True),
+    FastColumn("title", _sa.String, nullable=False),
+    FastColumn("body", _sa.String, nullable=True),
+)
@@ -44,3 +44,95 @@ def test_as_pydantic_model_multiple_bases(table: FastAdminTable):
 def test_as_pydantic_model_none_base(table: FastAdminTable):
     model = table.as_pydantic_model(base=None)
     assert issubclass(model, BaseModelComponents)
+
+
+def test_as_pydantic_model_cached_per_arguments(table: FastAdminTable):
+    model = table.as_pydantic_model()
+    assert table.as_pydantic_model() is model
+    assert table.as_pydantic_model(exclude=["name"]) is not model
+    assert "name" not in table.as_pydantic_model(exclude=["name"]).model_fields
+    assert table.as_pydantic_model(base=CustomBaseModel) is not model
+
+    info = table.pydantic_models_cache_info()
+    assert info.hits == 2
+    assert info.misses == 3
+    assert info.currsize == 3
+
+
+def test_as_pydantic_model_cache_normalizes_arguments(table: FastAdminTable):
+    model = table.as_pydantic_model(exclude=["id", "name"], config={"frozen": True})
+    assert (
+        table.as_pydantic_model(exclude=("name", "id"), config={"frozen": True})
+        is model
+    )
+    assert (
+        table.as_pydantic_model(exclude=["id"], config={"frozen": False}) is not model
+    )
+
+
+def test_as_pydantic_model_cache_key_is_type_aware(table: FastAdminTable):
+    def model(flags: list) -> type:
+        return table.as_pydantic_model(config={"json_schema_extra": {"flags": flags}})
+
+    assert model([1]) is model([1])
+    assert model([True]) is not model([1])
+    assert model([1.0]) is not model([1])
+
+
+def test_as_pydantic_model_cache_size(table: FastAdminTable):
+    table.__pydantic_models__.maxsize = 2
+    first = table.as_pydantic_model(doc="first")
+    table.as_pydantic_model(doc="second")
+    table.as_pydantic_model(doc="third")
+
+    assert table.pydantic_models_cache_info().currsize == 2
+    assert table.as_pydantic_model(doc="first") is not first
+
+
+def test_as_pydantic_model_invalidate(table: FastAdminTable):
+    model = table.as_pydantic_model()
+    table.invalidate_pydantic_models()
+
+    assert table.pydantic_models_cache_info().currsize == 0
+    assert table.as_pydantic_model() is not model
+
+
+def test_as_pydantic_model_invalidated_by_column_attach(table: FastAdminTable):
+    model = table.as_pydantic_model()
+    table.append_column(FastColumn("email", _sa.String, nullable=True))
+
+    assert table.as_pydantic_model() is not model
+    assert "email" in table.as_pydantic_model().model_fields
+
+
+def test_as_pydantic_model_cache_disabled(table: FastAdminTable, monkeypatch):
+    monkeypatch.setattr(FastAdminTable, "cache_pydantic_models", False)
+    assert table.as_pydantic_model() is not table.as_pydantic_model()
+
+
+def test_as_pydantic_field_cached(table: FastAdminTable, monkeypatch):
+    column = table.c.name
+    first = column.as_pydantic_field()
+
+    monkeypatch.setattr(
+        column, "_build_pydantic_field", lambda: pytest.fail("field rebuilt")
+    )
+    second = column.as_pydantic_field()
+
+    assert second is not first
+    assert repr(second) == repr(first)
+
+
+def test_as_pydantic_field_invalidated_by_attributes(table: FastAdminTable):
+    column = table.c.name
+    assert column.as_pydantic_field_info().metadata == []
+
+    column.max_length = 5
+    (max_len,) = column.as_pydantic_field_info().metadata
+    assert max_len.max_length == 5
+
+    column.doc = "The name"
+    assert column.as_pydantic_field().description == "The name"
+
+    with pytest.raises(_p.ValidationError):
+        table.as_pydantic_model(doc="fresh")(id=1, name="too long")
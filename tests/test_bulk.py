@@ -0,0 +1,149 @@
+import httpx
+import pytest
+import sqlalchemy as _sa
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fastadmin import FastUIRouter, PageMeta
+from fastadmin import Page as _page
+from fastadmin.config import ROOT_URL
+from fastadmin.tools.bulk import BulkMode, BulkWriter, bulk_write, validate_rows
+
+from .tables import FastBase, User
+
+
+class BulkPage(_page):
+    __pagemeta__ = PageMeta()
+
+
+async def select_users(aengine: AsyncEngine) -> list[tuple]:
+    async with aengine.connect() as conn:
+        result = await conn.execute(
+            _sa.select(User.id, User.name, User.age).order_by(User.id)
+        )
+        return [tuple(row) for row in result]
+
+
+def test_validate_rows():
+    model = User.as_pydantic_model()
+    valid, errors = validate_rows(
+        model,
+        [
+            {"id": 1, "name": "a", "age": 1},
+            {"id": "x", "name": "b", "age": 2},
+            {"id": 3, "age": 3},
+            {"id": 4, "name": "d", "age": 4},
+        ],
+    )
+
+    assert valid == [
+        (0, {"id": 1, "name": "a", "age": 1}),
+        (3, {"id": 4, "name": "d", "age": 4}),
+    ]
+    assert [error.index for error in errors] == [1, 2]
+    assert errors[0].errors[0]["loc"] == ("id",)
+    assert errors[1].errors[0]["loc"] == ("name",)
+
+
+async def test_bulk_insert(aengine: AsyncEngine, connection_manager):
+    rows = [{"id": i, "name": f"user {i}", "age": i} for i in range(1, 8)]
+    rows[3] = {"id": 4, "name": None, "age": 4}
+
+    result = await User.__table__.bulk_write(rows, chunk_size=2)
+
+    assert result.written == 6
+    assert [error.index for error in result.errors] == [3]
+    assert [row[0] for row in await select_users(aengine)] == [1, 2, 3, 5, 6, 7]
+
+
+async def test_bulk_insert_database_errors(aengine: AsyncEngine, connection_manager):
+    await bulk_write(User.__table__, [{"id": 1, "name": "first", "age": 1}])
+
+    result = await bulk_write(
+        User.__table__,
+        [
+            {"id": 2, "name": "a", "age": 2},
+            {"id": 1, "name": "duplicate", "age": 1},
+            {"id": 3, "name": "c", "age": 3},
+        ],
+    )
+
+    assert result.written == 2
+    assert [error.index for error in result.errors] == [1]
+    assert result.errors[0].errors[0]["type"] == "database_error"
+    assert await select_users(aengine) == [
+        (1, "first", 1),
+        (2, "a", 2),
+        (3, "c", 3),
+    ]
+
+
+async def test_bulk_update(aengine: AsyncEngine, connection_manager):
+    await bulk_write(
+        User.__table__, [{"id": i, "name": f"user {i}", "age": i} for i in (1, 2, 3)]
+    )
+
+    result = await bulk_write(
+        User.__table__,
+        [
+            {"id": 1, "name": "one", "age": 1},
+            {"id": 3, "name": "three", "age": 30},
+            {"id": 2, "name": "two"},
+            {"id": 4, "age": "x"},
+            {"name": "no key"},
+        ],
+        BulkMode.UPDATE,
+    )
+
+    assert result.written == 3
+    assert [error.index for error in result.errors] == [3, 4]
+    assert await select_users(aengine) == [
+        (1, "one", 1),
+        (2, "two", 2),
+        (3, "three", 30),
+    ]
+
+
+async def test_bulk_write_is_one_transaction(
+    aengine: AsyncEngine, connection_manager, monkeypatch
+):
+    parameters = BulkWriter.parameters
+
+    def failing_parameters(self, values):
+        if values["id"] == 3:
+            raise RuntimeError("aborted")
+        return parameters(self, values)
+
+    monkeypatch.setattr(BulkWriter, "parameters", failing_parameters)
+    rows = [{"id": i, "name": f"user {i}", "age": i} for i in range(1, 5)]
+
+    with pytest.raises(RuntimeError):
+        await bulk_write(User.__table__, rows, chunk_size=2)
+
+    assert await select_users(aengine) == []
+
+
+async def test_bulk_endpoint(aengine: AsyncEngine, connection_manager):
+    app = FastUIRouter(
+        metadata=FastBase.metadata,
+        page_meta=BulkPage.__pagemeta__,
+        bulk_tables=True,
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.post(
+            ROOT_URL + "/bulk/insert/users",
+            json=[{"id": 1, "name": "a", "age": 1}, {"id": 2}],
+        )
+        missing = await c.post(ROOT_URL + "/bulk/insert/missing", json=[])
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["written"] == 1
+    assert [error["index"] for error in body["errors"]] == [1]
+    assert missing.status_code == 404
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_chunk_size_must_be_positive(chunk_size: int):
+    with pytest.raises(ValueError):
+        BulkWriter(User.__table__, "insert", chunk_size)
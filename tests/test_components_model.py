@@ -4,6 +4,7 @@ from fastadmin import FastBase, FastColumn
 from fastui import components as _c
 
 import sqlalchemy as _sa
+import pytest
 
 
 class BaseTestModel(BaseModelComponents):
@@ -126,3 +127,133 @@ def test_fast_model_config():
         "cls_kwargs": None,
         "exclude": ["id"],
     }
+
+
+def test_as_model_table_builds_model_once(monkeypatch):
+    model = BaseFastTestModel.as_pydantic_model()
+    calls = []
+    monkeypatch.setattr(
+        BaseFastTestModel,
+        "to_pydantic_model",
+        lambda *args, **kwds: calls.append(args),
+    )
+
+    data = [BaseFastTestModel(id=i, name=f"Test {i}") for i in range(10)]
+    table = model.as_model_table(data)
+
+    assert calls == []
+    assert [row.id for row in table.data] == list(range(10))
+    assert all(type(row) is model for row in table.data)
+
+
+def test_list_adapter_is_cached():
+    model = BaseFastTestModel.as_pydantic_model()
+    assert model.list_adapter() is model.list_adapter()
+
+
+def test_validate_many():
+    model = BaseFastTestModel.as_pydantic_model()
+    rows = model.validate_many([{"id": 1, "name": "a"}, {"id": "2", "name": "b"}])
+
+    assert [row.id for row in rows] == [1, 2]
+
+
+def test_to_pydantic_models():
+    data = [BaseFastTestModel(id=1, name="a"), BaseFastTestModel(id=2, name="b")]
+    models = BaseFastTestModel.to_pydantic_models(data, exclude=["name"])
+
+    assert [model.id for model in models] == [1, 2]
+    assert "name" not in models[0].model_fields
+
+
+def test_as_model_table_trusted_rows():
+    model = BaseFastTestModel.as_pydantic_model()
+    data = [BaseFastTestModel(id="1", name="Test"), {"id": "2", "name": "Dict"}]
+
+    table = model.as_model_table(data, trusted=True)
+
+    # database rows are taken as-is, dicts are still validated
+    assert table.data[0].id == "1"
+    assert table.data[1].id == 2
+
+
+def test_as_model_table_trusted_per_table(monkeypatch):
+    model = BaseFastTestModel.as_pydantic_model()
+    assert model.trusts_rows() is False
+
+    monkeypatch.setattr(BaseFastTestModel.__table__, "trust_rows", True, raising=False)
+    assert model.trusts_rows() is True
+
+    table = model.as_model_table([BaseFastTestModel(id="1", name="Test")])
+    assert table.data[0].id == "1"
+
+    table = model.as_model_table(
+        [BaseFastTestModel(id="1", name="Test")], trusted=False
+    )
+    assert table.data[0].id == 1
+
+
+def test_to_pydantic_model_trusted():
+    instance = BaseFastTestModel(id="1", name="Test")
+
+    assert instance.to_pydantic_model().id == 1
+    assert instance.to_pydantic_model(trusted=True).id == "1"
+    assert BaseFastTestModel.to_pydantic_models([instance], trusted=True)[0].id == "1"
+
+
+def test_dump_components_matches_fastui():
+    import pydantic
+    from fastui import FastUI
+
+    from fastadmin.tools.response import dump_components
+
+    class OptionalModel(BaseModelComponents):
+        id: int
+        name: str | None = None
+
+    table = OptionalModel.as_model_table(
+        [{"id": 1, "name": "one"}, {"id": 2, "name": None}]
+    )
+
+    class PlainModel(pydantic.BaseModel):
+        id: int
+
+    plain = _c.Table(data=[PlainModel(id=1)], data_model=PlainModel)
+    tree = [
+        _c.Page(components=[_c.Heading(text="Rows"), table]),
+        _c.Div(components=[plain, table]),
+    ]
+
+    expected = FastUI(root=tree).model_dump_json(by_alias=True, exclude_none=True)
+    assert dump_components(tree) == expected.encode()
+    # the component tree itself is left untouched
+    assert tree[0].components[1] is table
+    assert len(table.data) == 2
+
+
+def test_model_form_fields_cached(monkeypatch):
+    from fastui import FastUI
+
+    from fastadmin.tools import components as components_module
+
+    class FormModel(BaseModelComponents):
+        id: int
+        name: str
+
+    plain = _c.ModelForm(submit_url="/submit", model=FormModel)
+    form = FormModel.as_model_form(submit_url="/submit")
+    expected = FastUI(root=[plain]).model_dump_json(by_alias=True, exclude_none=True)
+    assert FastUI(root=[form]).model_dump_json(by_alias=True, exclude_none=True) == (
+        expected
+    )
+
+    monkeypatch.setattr(
+        components_module,
+        "model_json_schema_to_fields",
+        lambda model: pytest.fail("form fields rebuilt"),
+    )
+    form = FormModel(id=1, name="Test").as_form(submit_url="/submit")
+    assert (
+        form.model_dump(by_alias=True)["formFields"]
+        == plain.model_dump(by_alias=True)["formFields"]
+    )
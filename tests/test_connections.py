@@ -0,0 +1,399 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import sqlalchemy as _sa
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from fastadmin import FastUIRouter, PageMeta
+from fastadmin import Page as _page
+from fastadmin.config import ROOT_URL
+from fastadmin.tools.connections import (
+    AsyncConnectionRegistry,
+    ConnectionManager,
+    ConnectionRegistry,
+    PoolTimeout,
+    _scoped_connection,
+    aconnection,
+    connection,
+)
+from fastadmin.tools.metrics import InMemoryMetrics
+
+from .tables import FastBase, User
+
+
+class StatsPage(_page):
+    __pagemeta__ = PageMeta()
+
+
+@pytest.fixture
+def sync_engine(tmp_path):
+    engine = _sa.create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+async def async_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+    yield engine
+    await engine.dispose()
+
+
+def test_registry_reuses_connections(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=2)
+
+    with registry.connection() as first:
+        pass
+    with registry.connection() as second:
+        assert second is first
+
+    assert registry.size == 1
+    registry.close_all()
+    assert first.closed
+
+
+def test_registry_drops_closed_connections(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=2)
+
+    with registry.connection() as conn:
+        conn.close()
+
+    assert registry.empty
+    with registry.connection() as other:
+        assert other is not conn
+
+
+def test_registry_timeout(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=1, timeout=0.05)
+
+    with registry.connection():
+        with pytest.raises(PoolTimeout):
+            registry.checkout()
+
+
+def test_registry_evicts_stale_connections(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=2, max_idle_time=0.01)
+
+    with registry.connection() as conn:
+        pass
+    time.sleep(0.02)
+
+    with registry.connection() as other:
+        assert other is not conn
+    assert conn.closed
+
+
+def test_registry_resets_transaction_on_checkin(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=1)
+
+    with registry.connection() as conn:
+        conn.execute(_sa.text("SELECT 1"))
+        assert conn.in_transaction()
+
+    assert not conn.in_transaction()
+
+
+def test_registry_threads_never_share(sync_engine):
+    registry = ConnectionRegistry(sync_engine, max_size=3, timeout=5)
+    in_use, peak, errors = set(), [0], []
+    lock = threading.Lock()
+
+    def worker():
+        try:
+            for _ in range(20):
+                with registry.connection() as conn:
+                    with lock:
+                        assert conn not in in_use
+                        in_use.add(conn)
+                        peak[0] = max(peak[0], len(in_use))
+                    conn.execute(_sa.text("SELECT 1"))
+                    with lock:
+                        in_use.remove(conn)
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert peak[0] <= 3
+    assert registry.size <= 3
+    registry.close_all()
+
+
+async def test_async_registry_concurrency_stress(async_engine):
+    registry = AsyncConnectionRegistry(async_engine, max_size=4, timeout=10)
+    in_use: set = set()
+    peak = 0
+
+    async def worker(index: int):
+        nonlocal peak
+        for _ in range(5):
+            async with registry.connection() as conn:
+                assert conn not in in_use
+                in_use.add(conn)
+                peak = max(peak, len(in_use))
+                result = await conn.execute(_sa.select(_sa.literal(index)))
+                assert result.scalar() == index
+                await asyncio.sleep(0)
+                in_use.remove(conn)
+
+    await asyncio.gather(*(worker(i) for i in range(50)))
+
+    assert peak == 4
+    assert registry.size <= 4
+    assert not registry.checked_out
+    await registry.close_all()
+
+
+async def test_async_registry_timeout(async_engine):
+    registry = AsyncConnectionRegistry(async_engine, max_size=1, timeout=0.05)
+
+    async with registry.connection():
+        with pytest.raises(PoolTimeout):
+            await registry.checkout()
+
+    async with registry.connection():
+        pass
+    await registry.close_all()
+
+
+async def test_async_registry_waiter_gets_returned_connection(async_engine):
+    registry = AsyncConnectionRegistry(async_engine, max_size=1, timeout=5)
+    first = await registry.checkout()
+
+    waiter = asyncio.ensure_future(registry.checkout())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await registry.checkin(first)
+    assert await waiter is first
+    await registry.close_all()
+
+
+def test_async_registry_discards_connections_of_other_loop(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'loop.db'}")
+    metrics = InMemoryMetrics()
+    registry = AsyncConnectionRegistry(
+        engine, max_size=1, timeout=0.05, metrics=metrics
+    )
+
+    first = asyncio.run(registry.checkout())
+    # still checked out, but on a loop that is gone
+    second = asyncio.run(registry.checkout())
+
+    assert second is not first
+    assert list(registry.checked_out) == [second]
+    assert metrics.snapshot()["counters"]["pool.async.discarded"] == 1
+
+    async def close():
+        await registry.close_all()
+        await engine.dispose()
+
+    asyncio.run(close())
+
+
+async def test_manager_commit(connection_manager: ConnectionManager):
+    async with connection_manager.aconnection(commit=True) as conn:
+        await conn.execute(User.__table__.insert().values(id=1, name="John"))
+
+    async with connection_manager.aconnection() as conn:
+        names = (await conn.execute(_sa.select(User.__table__.c.name))).scalars()
+        assert names.all() == ["John"]
+
+
+async def test_manager_rollback_on_error(connection_manager: ConnectionManager):
+    with pytest.raises(RuntimeError):
+        async with connection_manager.aconnection(commit=True) as conn:
+            await conn.execute(User.__table__.insert().values(id=1, name="John"))
+            raise RuntimeError
+
+    async with connection_manager.aconnection() as conn:
+        count = await conn.scalar(_sa.select(_sa.func.count()).select_from(User))
+        assert count == 0
+
+
+@aconnection
+async def fetch_connection(connection):
+    return connection
+
+
+@aconnection
+async def nested_connections(connection):
+    return connection, await fetch_connection()
+
+
+@aconnection(commit=True)
+async def insert_user(user_id: int, connection):
+    await connection.execute(User.__table__.insert().values(id=user_id, name="John"))
+
+
+@aconnection
+async def insert_users_without_commit(connection):
+    await insert_user(1)
+    await insert_user(2)
+    return connection.in_transaction()
+
+
+async def count_users(manager: ConnectionManager) -> int:
+    async with manager.aconnection() as conn:
+        return await conn.scalar(_sa.select(_sa.func.count()).select_from(User))
+
+
+async def test_nested_aconnection_reuses_outer(connection_manager):
+    outer, inner = await nested_connections()
+
+    assert inner is outer
+    assert not outer.closed
+    assert await fetch_connection() is outer
+
+
+async def test_sibling_tasks_get_separate_connections(connection_manager):
+    @aconnection
+    async def hold(connection):
+        await asyncio.sleep(0.01)
+        return connection
+
+    first, second = await asyncio.gather(hold(), hold())
+    assert first is not second
+
+
+async def test_spawned_task_does_not_inherit_connection(connection_manager):
+    @aconnection
+    async def outer(connection):
+        child = await asyncio.create_task(fetch_connection())
+        return connection, child
+
+    parent, child = await outer()
+    assert parent is not child
+
+
+async def test_nested_commit_applies_to_outer_transaction(connection_manager):
+    assert await insert_users_without_commit() is True
+    assert await count_users(connection_manager) == 2
+
+
+async def test_nested_error_rolls_back_outer(connection_manager):
+    @aconnection
+    async def failing(connection):
+        await insert_user(1)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await failing()
+    assert await count_users(connection_manager) == 0
+
+
+def test_nested_sync_connection_reuses_outer(engine):
+    ConnectionManager._instance = None
+    ConnectionManager(engine)
+
+    @connection
+    def inner(connection):
+        return connection
+
+    @connection
+    def outer(connection):
+        return connection, inner()
+
+    try:
+        first, second = outer()
+        assert first is second
+        # the outer scope was reset and its connection went back to the pool
+        assert _scoped_connection.get() is None
+        assert inner() is first
+    finally:
+        ConnectionManager().registry.close_all()
+        ConnectionManager._instance = None
+
+
+def test_registry_metrics(sync_engine):
+    metrics = InMemoryMetrics()
+    registry = ConnectionRegistry(
+        sync_engine, max_size=1, timeout=0.01, metrics=metrics
+    )
+
+    with registry.connection() as conn:
+        conn.execute(_sa.text("SELECT 1"))
+        with pytest.raises(PoolTimeout):
+            registry.checkout()
+    with registry.connection():
+        pass
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {
+        "pool.sync.opened": 1,
+        "pool.sync.timeouts": 1,
+        "pool.sync.leaked_transactions": 1,
+    }
+    assert snapshot["gauges"] == {"pool.sync.open": 1, "pool.sync.checked_out": 0}
+    assert snapshot["histograms"]["pool.sync.checkout_wait"]["count"] == 2
+    assert snapshot["histograms"]["pool.sync.hold"]["count"] == 2
+    registry.close_all()
+
+
+def test_registry_leaks(sync_engine):
+    registry = ConnectionRegistry(sync_engine, leak_threshold=0.01)
+    conn = registry.checkout()
+
+    assert registry.leaks() == []
+    time.sleep(0.02)
+    assert [leaked for leaked, _ in registry.leaks()] == [conn]
+    assert registry.stats()["leaks"] == 1
+
+    registry.checkin(conn)
+    assert registry.leaks() == []
+    registry.close_all()
+
+
+async def test_manager_commit_rollback_metrics(connection_manager: ConnectionManager):
+    async with connection_manager.aconnection(commit=True) as conn:
+        await conn.execute(User.__table__.insert().values(id=1, name="John"))
+    with pytest.raises(RuntimeError):
+        async with connection_manager.aconnection() as conn:
+            await conn.execute(User.__table__.insert().values(id=2, name="Jane"))
+            raise RuntimeError
+
+    counters = connection_manager.stats()["metrics"]["counters"]
+    assert counters["connection.commit"] == 1
+    assert counters["connection.rollback"] == 1
+    assert counters["pool.async.opened"] == 1
+    assert "pool.async.leaked_transactions" not in counters
+
+
+async def test_stats_endpoint(connection_manager: ConnectionManager):
+    app = FastUIRouter(
+        metadata=FastBase.metadata,
+        page_meta=StatsPage.__pagemeta__,
+        stats_endpoint=True,
+    )
+    async with connection_manager.aconnection():
+        pass
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get(ROOT_URL + "/stats")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["pools"]["async"]["size"] == 1
+    assert body["pools"]["async"]["max_size"] == 10
+    assert body["metrics"]["counters"]["pool.async.opened"] == 1
+
+
+def test_stats_endpoint_without_manager():
+    ConnectionManager._instance = None
+    app = FastUIRouter(
+        metadata=FastBase.metadata,
+        page_meta=StatsPage.__pagemeta__,
+        stats_endpoint=True,
+    )
+    response = TestClient(app).get(ROOT_URL + "/stats")
+    assert response.status_code == 503
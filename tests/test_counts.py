@@ -0,0 +1,121 @@
+import gc
+import weakref
+
+import pytest
+import sqlalchemy as _sa
+from fastui import components as _c
+
+from fastadmin import KeysetPaginator
+from fastadmin.tools.connections import table_writes
+from fastadmin.tools.counts import CountMode, RowCount, RowCounter
+
+from .tables import Event
+
+
+@pytest.fixture
+def connection(samples_engine: _sa.Engine):
+    with samples_engine.connect() as conn:
+        insert(conn, range(1, 11))
+        yield conn
+
+
+def insert(conn: _sa.Connection, ids: range) -> None:
+    conn.execute(
+        Event.insert(),
+        [{"id": i, "kind": "click" if i % 2 else "view"} for i in ids],
+    )
+
+
+@pytest.fixture
+def counter():
+    counter = RowCounter(Event, CountMode.TRACKED, ttl=None)
+    yield counter
+    counter.close()
+
+
+def test_row_count_str():
+    assert str(RowCount(1234)) == "1,234"
+    assert str(RowCount(1234, estimated=True)) == "about 1,234"
+
+
+def test_exact_count_cached(connection):
+    counter = RowCounter(Event, CountMode.EXACT, ttl=60)
+
+    assert counter.count(connection) == RowCount(10)
+    insert(connection, range(11, 13))
+    assert counter.count(connection) == RowCount(10)
+
+    counter.invalidate()
+    assert counter.count(connection) == RowCount(12)
+
+
+def test_exact_count_ttl(connection):
+    counter = RowCounter(Event, CountMode.EXACT, ttl=0)
+
+    assert counter.count(connection).value == 10
+    insert(connection, range(11, 13))
+    assert counter.count(connection).value == 12
+
+
+def test_tracked_count(counter: RowCounter, connection):
+    assert counter.count(connection).value == 10
+    insert(connection, range(11, 13))
+
+    table_writes.send(["other"])
+    assert counter.count(connection).value == 10
+
+    table_writes.send([Event.fullname])
+    assert counter.count(connection).value == 12
+
+
+def test_tracked_counter_not_kept_alive():
+    counter = RowCounter(Event, CountMode.TRACKED)
+    ref = weakref.ref(counter)
+
+    del counter
+    gc.collect()
+    assert ref() is None
+    table_writes.send([Event.fullname])
+
+
+def test_filtered_count(counter: RowCounter, connection):
+    builder = Event.query_builder()
+
+    clicks = counter.count(connection, builder.parse({"kind": "click"}))
+    views = counter.count(connection, builder.parse({"kind": "view", "id__gt": "4"}))
+    ordered = counter.count(connection, builder.parse({"order_by": "-id"}))
+
+    assert (clicks.value, views.value, ordered.value) == (5, 3, 10)
+    assert counter.entries.info().currsize == 3
+
+
+def test_estimated_count(connection):
+    counter = RowCounter(Event, CountMode.ESTIMATE, ttl=None, estimate_threshold=5)
+    try:
+        # no statistics before ANALYZE
+        assert counter.count(connection) == RowCount(10)
+
+        connection.execute(_sa.text("ANALYZE"))
+        counter.invalidate()
+        assert counter.count(connection) == RowCount(10, estimated=True)
+
+        counter.estimate_threshold = 100
+        counter.invalidate()
+        assert counter.count(connection) == RowCount(10)
+    finally:
+        counter.close()
+
+
+def test_pagination_total(connection):
+    page = KeysetPaginator(Event, page_size=4).fetch(connection)
+    total = RowCount(10, estimated=True)
+
+    [div] = page.as_components(total=total)
+    assert isinstance(div.components[0], _c.Text)
+    assert div.components[0].text == "about 10 rows"
+
+
+def test_table_row_counter():
+    counter = Event.row_counter()
+    assert counter is Event.row_counter()
+    assert counter.mode is CountMode.TRACKED
@@ -0,0 +1,84 @@
+import json
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fastadmin import FastUIRouter, PageMeta
+from fastadmin import Page as _page
+from fastadmin.config import ROOT_URL
+from fastadmin.tools.export import ExportFormat, iter_table_export
+
+from .tables import FastBase, User
+
+
+class ExportPage(_page):
+    __pagemeta__ = PageMeta()
+
+
+@pytest.fixture
+async def users(aengine: AsyncEngine, connection_manager):
+    async with aengine.begin() as conn:
+        await conn.execute(
+            User.__table__.insert(),
+            [{"id": i, "name": f"user, {i}", "age": i} for i in range(1, 6)],
+        )
+
+
+@pytest.fixture
+def app():
+    return FastUIRouter(
+        metadata=FastBase.metadata,
+        page_meta=ExportPage.__pagemeta__,
+        export_tables=True,
+        export_chunk_size=2,
+    )
+
+
+async def get(app: FastUIRouter, url: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        return await c.get(url)
+
+
+async def test_export_ndjson(app: FastUIRouter, users):
+    response = await get(app, ROOT_URL + "/export/ndjson/users")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows[0] == {"id": 1, "name": "user, 1", "age": 1}
+    assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+
+
+async def test_export_csv(app: FastUIRouter, users):
+    response = await get(app, ROOT_URL + "/export/csv/users")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="users.csv"' in response.headers["content-disposition"]
+    lines = response.text.splitlines()
+    assert lines[0] == "id,name,age"
+    assert lines[1] == '1,"user, 1",1'
+    assert len(lines) == 6
+
+
+async def test_export_unknown_table(app: FastUIRouter, users):
+    response = await get(app, ROOT_URL + "/export/csv/unknown")
+    assert response.status_code == 404
+
+
+async def test_export_streams_in_chunks(users):
+    chunks = [
+        chunk
+        async for chunk in iter_table_export(
+            User.__table__, ExportFormat.NDJSON, chunk_size=2
+        )
+    ]
+    assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_export_disabled_by_default():
+    app = FastUIRouter(metadata=FastBase.metadata, page_meta=ExportPage.__pagemeta__)
+    [mount] = [route for route in app.routes if route.path == ROOT_URL]
+    assert not any("/export/" in route.path for route in mount.app.routes)
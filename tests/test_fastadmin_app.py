@@ -5,9 +5,11 @@ from fastadmin import Page as _page, PageMeta
 from fastadmin.config import ROOT_URL, PATH_STRIP
 
 from fastapi.testclient import TestClient
-from fastapi import Request, responses
+from fastapi import FastAPI, Request, responses
 
 import fastui.components as fc
+import threading
+from contextlib import asynccontextmanager
 import sqlalchemy as sa
 import pytest
 
@@ -45,6 +47,29 @@ class TestPageWithParentsUri(TestPageWithComponent):
         return "Hello World"
 
 
+class TestAsyncPage(AppPage):
+    uri = "/async"
+
+    async def render(self) -> responses.HTMLResponse:
+        return "Async"
+
+
+class TestAsyncComponentPage(AppPage):
+    uri = "/async_component"
+    render_concurrency = 2
+
+    async def render(self) -> list[AnyComponent]:
+        return [fc.Text(text="Async")]
+
+
+class TestPageRenderThread(AppPage):
+    uri = "/render_thread"
+    render_concurrency = 1
+
+    def render(self) -> responses.HTMLResponse:
+        return threading.current_thread().name
+
+
 class TestPageForMount(AppPage2):
     uri = "/mount"
 
@@ -99,6 +124,27 @@ def test_fastadmin_component_route(fastadmin_app: FastUIRouter):
     ]
 
 
+def test_fastadmin_component_route_validated(fastadmin_app: FastUIRouter):
+    app = FastUIRouter(
+        metadata=metadata,
+        page_meta=AppPage.__pagemeta__,
+        validate_components=True,
+    )
+    validated = TestClient(app).get(TestPageWithComponent.get_uri())
+    response = TestClient(fastadmin_app).get(TestPageWithComponent.get_uri())
+
+    assert validated.status_code == 200
+    assert validated.content == response.content
+
+
+def test_fastadmin_component_route_schema(fastadmin_app: FastUIRouter):
+    schema = fastadmin_app.routes[4].app.openapi()
+    get = schema["paths"]["/component"]["get"]
+    content = get["responses"]["200"]["content"]["application/json"]
+
+    assert content["schema"] == {"$ref": "#/components/schemas/FastUI"}
+
+
 def test_fastadmin_invalid_metadata():
     with pytest.raises(ValueError) as exc_info:
         metadata = sa.MetaData()
@@ -129,6 +175,46 @@ def test_fastadmin_prebuilt_route(fastadmin_app: FastUIRouter):
     assert response.text.startswith("<!doctype html>")
 
 
+def test_fastadmin_prebuilt_conditional_request(fastadmin_app: FastUIRouter):
+    client = TestClient(fastadmin_app)
+    response = client.get(PATH_STRIP, headers={"Accept-Encoding": "identity"})
+    etag = response.headers["etag"]
+
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+    response = client.get(
+        PATH_STRIP + "/some/page",
+        headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_fastadmin_prebuilt_gzip(fastadmin_app: FastUIRouter):
+    client = TestClient(fastadmin_app)
+    plain = client.get(PATH_STRIP, headers={"Accept-Encoding": "identity"})
+    response = client.get(PATH_STRIP, headers={"Accept-Encoding": "gzip;q=0.5"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] != plain.headers["etag"]
+    assert response.text == plain.text
+
+
+def test_fastadmin_prebuilt_rendered_once(fastadmin_app: FastUIRouter, monkeypatch):
+    shell = fastadmin_app.prebuilt
+    body = shell.bodies["identity"]
+    client = TestClient(fastadmin_app)
+
+    client.get(PATH_STRIP)
+    assert shell.bodies["identity"] is body
+
+    monkeypatch.setattr(fastadmin_app, "title", "Renamed")
+    response = client.get(PATH_STRIP, headers={"Accept-Encoding": "identity"})
+    assert "<title>Renamed</title>" in response.text
+
+
 def test_fastadmin_page_with_parents_uri(fastadmin_app: FastUIRouter):
     assert TestPageWithParentsUri.get_uri() == ROOT_URL + "/component/home"
 
@@ -160,3 +246,101 @@ def test_fastadmin_mount():
 
     assert response.status_code == 200
     assert response.text == "Mount2"
+
+
+def test_fastadmin_async_render(fastadmin_app: FastUIRouter):
+    client = TestClient(fastadmin_app)
+
+    response = client.get(TestAsyncPage.get_uri())
+    assert response.status_code == 200
+    assert response.text == "Async"
+
+    response = client.get(TestAsyncComponentPage.get_uri())
+    assert response.status_code == 200
+    assert response.json() == [{"text": "Async", "type": "Text"}]
+
+
+def test_fastadmin_sync_render_in_render_pool(fastadmin_app: FastUIRouter):
+    pool = AppPage.__pagemeta__.render_pool
+    with TestClient(fastadmin_app) as client:
+        response = client.get(TestPageRenderThread.get_uri())
+
+        assert response.status_code == 200
+        assert response.text.startswith(pool.thread_name_prefix)
+
+    # the pool is shut down with the application and restarted on demand
+    assert pool._executor is None
+
+
+def test_fastadmin_warmup():
+    metadata = sa.MetaData()
+    for name in ("warm_first", "warm_second"):
+        FastAdminTable(
+            name,
+            metadata,
+            FastColumn("id", sa.Integer, primary_key=True),
+            FastColumn("name", sa.String, nullable=False),
+        )
+    app = FastUIRouter(
+        metadata=metadata,
+        page_meta=AppPage2.__pagemeta__,
+        warmup=True,
+        warmup_workers=2,
+    )
+
+    report = app.warmup_report
+    assert set(report.tables) == {"warm_first", "warm_second"}
+    assert report.elapsed >= sum(report.tables.values()) / 2
+    for table in metadata.tables.values():
+        assert table.pydantic_models_cache_info().currsize == 1
+        assert table.as_pydantic_model().__dict__.get("__fastadmin_list_adapter__")
+
+
+def test_fastadmin_warmup_on_startup():
+    app = FastUIRouter(
+        metadata=metadata, page_meta=AppPage2.__pagemeta__, warmup="startup"
+    )
+    assert app.warmup_report is None
+
+    with TestClient(app):
+        assert app.warmup_report is not None
+
+
+def test_fastadmin_lifespan_composed():
+    events = []
+
+    @asynccontextmanager
+    async def lifespan(app):
+        events.append("startup")
+        yield
+        events.append("shutdown")
+
+    app = FastUIRouter(
+        metadata=metadata,
+        page_meta=AppPage2.__pagemeta__,
+        warmup="startup",
+        lifespan=lifespan,
+    )
+    pool = AppPage2.__pagemeta__.render_pool
+    with TestClient(app):
+        assert app.warmup_report is not None
+        assert events == ["startup"]
+        pool.executor
+    assert events == ["startup", "shutdown"]
+    assert pool._executor is None
+
+
+def test_fastadmin_mounted_startup():
+    router = FastUIRouter(
+        metadata=metadata, page_meta=AppPage2.__pagemeta__, warmup="startup"
+    )
+    main = FastAPI()
+    main.mount("/admin", router)
+    pool = AppPage2.__pagemeta__.render_pool
+
+    with TestClient(main) as client:
+        assert router.warmup_report is None
+        client.get("/admin/")
+        assert router.warmup_report is not None
+        pool.executor
+    assert pool._executor is None
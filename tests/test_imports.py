@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import fastadmin
+import fastadmin.tools
+
+
+def loaded_modules(code: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(*sys.modules)"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return {name.partition(".")[0] for name in output.split()}
+
+
+def test_core_import_is_lazy():
+    modules = loaded_modules("import fastadmin; fastadmin.FastBase")
+
+    assert "fastapi" not in modules
+    assert "starlette" not in modules
+
+
+def test_router_loaded_on_access():
+    modules = loaded_modules("import fastadmin; fastadmin.FastUIRouter")
+
+    assert "fastapi" in modules
+
+
+def test_lazy_attributes():
+    from fastui import AnyComponent
+
+    from fastadmin.router import FastUIRouter
+    from fastadmin.tools.page import ALLOWED_RESPONSES, Page
+
+    assert fastadmin.FastUIRouter is FastUIRouter
+    assert fastadmin.Page is fastadmin.tools.Page is Page
+    assert "FastUIRouter" in dir(fastadmin)
+    assert "KeysetPaginator" in fastadmin.__all__
+    assert list[AnyComponent] in ALLOWED_RESPONSES
+
+    with pytest.raises(AttributeError) as exc_info:
+        fastadmin.Missing
+
+    assert "has no attribute 'Missing'" in str(exc_info.value)
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from fastadmin.tools.components import related_field
+from fastadmin.tools.loaders import RelatedLoader
+
+from .tables import Comment, Post, User
+
+
+@pytest.fixture
+async def posts(aengine: AsyncEngine, connection_manager):
+    async with aengine.begin() as conn:
+        await conn.execute(
+            User.__table__.insert(),
+            [{"id": i, "name": f"user {i}", "age": i} for i in range(1, 4)],
+        )
+        await conn.execute(
+            Post.__table__.insert(),
+            [
+                {"id": i, "title": f"post {i}", "content": "", "user_id": i % 3 + 1}
+                for i in range(1, 10)
+            ],
+        )
+        await conn.execute(
+            Comment.insert(),
+            [{"id": i, "content": "", "post_id": i, "user_id": 1} for i in range(1, 4)],
+        )
+        result = await conn.execute(Post.__table__.select())
+        return result.all()
+
+
+async def test_display_single_query(posts):
+    loader = RelatedLoader()
+
+    display = await loader.display(Post.__table__, posts, {"user_id": "name"})
+
+    assert loader.queries == 1
+    assert display == {"user_id": {1: "user 1", 2: "user 2", 3: "user 3"}}
+
+
+async def test_display_shares_loaded_rows(posts):
+    loader = RelatedLoader()
+    await loader.display(Post.__table__, posts, {"user_id": "name"})
+
+    comments = [{"post_id": 1, "user_id": 1}, {"post_id": 2, "user_id": 2}]
+    display = await loader.display(
+        Comment, comments, {"user_id": "age", "post_id": "title"}
+    )
+
+    # users were loaded for the posts, only posts are queried
+    assert loader.queries == 2
+    assert display == {
+        "user_id": {1: 1, 2: 2},
+        "post_id": {1: "post 1", 2: "post 2"},
+    }
+
+
+async def test_display_missing_rows(connection_manager):
+    loader = RelatedLoader()
+
+    display = await loader.display(
+        Post.__table__, [{"user_id": 7}, {"user_id": None}], {"user_id": "name"}
+    )
+    assert display == {"user_id": {7: None}}
+
+    await loader.display(Post.__table__, [{"user_id": 7}], {"user_id": "name"})
+    assert loader.queries == 1
+
+
+async def test_display_requires_foreign_key(connection_manager):
+    with pytest.raises(ValueError, match="not a foreign key"):
+        await RelatedLoader().display(Post.__table__, [], {"title": "name"})
+
+
+async def test_as_model_table_related(posts):
+    display = await RelatedLoader().display(Post.__table__, posts, {"user_id": "name"})
+
+    model = Post.as_pydantic_model()
+    table = model.as_model_table(posts, related=display)
+
+    assert table.data_model is model.related_model(["user_id"])
+    assert issubclass(table.data_model, model)
+    assert [getattr(row, related_field("user_id")) for row in table.data] == [
+        f"user {post.user_id}" for post in posts
+    ]
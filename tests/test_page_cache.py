@@ -0,0 +1,159 @@
+import inspect
+import types
+
+import pytest
+from fastapi import Request, responses
+from fastapi.testclient import TestClient
+
+from fastadmin import FastUIRouter, MemoryPageCache, PageCache, PageMeta
+from fastadmin import Page as _page
+from fastadmin.tools.connections import ConnectionManager, table_writes
+from fastadmin.tools.page_cache import PageCacheBackend
+
+from .tables import FastBase, User
+
+
+class CachePage(_page):
+    __pagemeta__ = PageMeta()
+
+
+renders = []
+
+
+class CachedUsersPage(CachePage):
+    uri = "/users"
+    cache = PageCache(ttl=60, query=("page",), tables=("users",))
+
+    def render(self, request: Request) -> responses.HTMLResponse:
+        renders.append(request.query_params.get("page"))
+        return f"render {len(renders)}"
+
+
+class CachedPerUserPage(CachePage):
+    uri = "/per_user"
+    cache = PageCache(user=lambda request: request.headers.get("x-user"))
+
+    def render(self) -> responses.HTMLResponse:
+        renders.append("per_user")
+        return f"render {len(renders)}"
+
+
+@pytest.fixture
+def client():
+    renders.clear()
+    CachePage.__pagemeta__.page_cache.clear()
+    return TestClient(
+        FastUIRouter(metadata=FastBase.metadata, page_meta=CachePage.__pagemeta__)
+    )
+
+
+def test_page_cache_serves_cached_response(client: TestClient):
+    first = client.get(CachedUsersPage.get_uri(), params={"page": 1})
+    second = client.get(CachedUsersPage.get_uri(), params={"page": 1, "other": 2})
+
+    assert first.status_code == second.status_code == 200
+    assert second.text == first.text == "render 1"
+    assert second.headers["content-type"] == "text/html; charset=utf-8"
+    assert renders == ["1"]
+
+
+def test_page_cache_key_parts(client: TestClient):
+    client.get(CachedUsersPage.get_uri(), params={"page": 1})
+    client.get(CachedUsersPage.get_uri(), params={"page": 2})
+    client.get(CachedPerUserPage.get_uri(), headers={"x-user": "a"})
+    client.get(CachedPerUserPage.get_uri(), headers={"x-user": "b"})
+    client.get(CachedPerUserPage.get_uri(), headers={"x-user": "a"})
+
+    assert renders == ["1", "2", "per_user", "per_user"]
+
+
+def test_page_cache_invalidated_by_write(
+    client: TestClient, connection_manager: ConnectionManager
+):
+    client.get(CachedUsersPage.get_uri())
+
+    with connection_manager.connection(commit=True) as conn:
+        conn.execute(User.__table__.insert().values(id=1, name="John"))
+
+    assert client.get(CachedUsersPage.get_uri()).text == "render 2"
+
+
+def test_page_cache_kept_on_rollback(
+    client: TestClient, connection_manager: ConnectionManager
+):
+    client.get(CachedUsersPage.get_uri())
+
+    with connection_manager.connection() as conn:
+        conn.execute(User.__table__.insert().values(id=1, name="John"))
+        conn.rollback()
+
+    assert client.get(CachedUsersPage.get_uri()).text == "render 1"
+
+
+def test_memory_page_cache_ttl_and_generation(monkeypatch):
+    cache = MemoryPageCache()
+    now = 100.0
+    clock = types.SimpleNamespace(monotonic=lambda: now)
+    monkeypatch.setattr("fastadmin.tools.cache.time", clock)
+
+    cache.set("key", "value", ttl=10, tags=frozenset({"users"}), generation=0)
+    assert cache.get("key") == "value"
+
+    now = 111.0
+    assert cache.get("key") is None
+
+    table_writes.connect(cache.invalidate)
+    try:
+        table_writes.send(["users"])
+    finally:
+        table_writes.disconnect(cache.invalidate)
+    cache.set("key", "stale", ttl=None, tags=frozenset(), generation=0)
+    assert cache.get("key") is None
+
+
+def test_page_cache_request_parameter():
+    def render(request: Request) -> str:
+        return "render"
+
+    def render_without_request(page: int) -> str:
+        return "render"
+
+    def parameters(endpoint) -> list[str]:
+        cached = PageCache().endpoint(
+            CachedUsersPage, endpoint, MemoryPageCache(), frozenset()
+        )
+        return list(inspect.signature(cached).parameters)
+
+    assert parameters(render) == ["request"]
+    assert parameters(render_without_request) == ["page", "fastadmin_cache_request"]
+
+
+def test_page_cache_backend_is_abstract():
+    with pytest.raises(TypeError):
+        PageCacheBackend()
+
+
+def test_page_cache_validation():
+    with pytest.raises(ValueError) as exc_info:
+
+        class PostCachedPage(CachePage):
+            uri = "/post_cached"
+            method = "POST"
+            cache = PageCache()
+
+            def render(self) -> responses.HTMLResponse:
+                return "PostCachedPage"
+
+    assert "Only GET and HEAD pages can be cached" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        PageCache(tables=("missing",)).table_names(FastBase.metadata.tables)
+
+    assert "Unknown tables in page cache: missing" in str(exc_info.value)
+
+    with pytest.raises(ValueError) as exc_info:
+        PageCache(ttl=None).endpoint(
+            CachedUsersPage, lambda: "render", MemoryPageCache(), frozenset()
+        )
+
+    assert "PageCache with ttl=None needs a shared backend" in str(exc_info.value)
@@ -144,6 +144,62 @@ def test_page_invalid_render_method():
     assert "Page `render` method must have a return annotation" in str(exc_info.value)
 
 
+def test_page_async_render():
+    class AsyncRenderPage(Page):
+        uri = "/async_render"
+
+        async def render(self) -> responses.HTMLResponse:
+            return "AsyncRenderPage"
+
+    assert AsyncRenderPage._async_render is True
+    assert TestPageOnlyPage._async_render is False
+
+
+def test_page_generator_render():
+    with pytest.raises(ValueError) as exc_info:
+
+        class GeneratorRenderPage(Page):
+            uri = "/generator_render"
+
+            async def render(self) -> responses.HTMLResponse:
+                yield "GeneratorRenderPage"
+
+    assert "Page `render` method must not be a generator" in str(exc_info.value)
+
+
+def test_page_invalid_render_concurrency():
+    with pytest.raises(ValueError) as exc_info:
+
+        class InvalidConcurrencyPage(Page):
+            uri = "/invalid_concurrency"
+            render_concurrency = 0
+
+            def render(self) -> responses.HTMLResponse:
+                return "InvalidConcurrencyPage"
+
+    assert "render_concurrency must be a positive integer" in str(exc_info.value)
+
+
+def test_page_meta_render_workers():
+    meta = PageMeta(render_workers=2)
+    assert meta.render_pool.max_workers == 2
+
+    meta.render_workers = 4
+    assert meta.render_pool.max_workers == 4
+
+
+def test_page_meta_render_workers_restarts_executor():
+    meta = PageMeta(render_workers=2)
+    executor = meta.render_pool.executor
+    assert executor._max_workers == 2
+
+    meta.render_workers = 4
+    assert executor._shutdown
+    assert meta.render_pool.executor is not executor
+    assert meta.render_pool.executor._max_workers == 4
+    meta.render_pool.shutdown()
+
+
 def test_page_invalid_render_return_type():
     with pytest.raises(ValueError) as exc_info:
 
@@ -204,3 +260,57 @@ def test_page_get_uri_with_args_and_kwargs():
         TestPageWithArgsAndKwargs.get_uri("value1", arg="value2")
         == "/test/value1/value2"
     )
+
+
+def test_page_get_uri_is_compiled_once(monkeypatch):
+    TestPageWithParent.get_uri()
+    calls = []
+    monkeypatch.setattr(
+        TestPageWithParent,
+        "_build_recursive_uri",
+        classmethod(lambda cls: calls.append(cls) or "/test"),
+    )
+
+    assert TestPageWithParent.get_uri() == "/test/child"
+    assert calls == []
+
+
+def test_page_get_uri_invalidated_by_page_meta():
+    meta = PageMeta()
+
+    class MetaPage(_page):
+        __pagemeta__ = meta
+
+    class MetaChildPage(MetaPage):
+        uri = "/child/{id}"
+
+        def render(self) -> responses.HTMLResponse:
+            return "MetaChildPage"
+
+    assert MetaChildPage.get_uri(id=1) == "/child/1"
+
+    meta.root_url = "/api"
+    assert MetaChildPage.get_uri(id=1) == "/api/child/1"
+
+    meta.mount_path = "/admin"
+    assert MetaChildPage.get_uri(id=1) == "/admin/api/child/1"
+
+    meta.path_strip = "/prebuilt"
+    assert MetaChildPage.get_uri(id=1, add_root_uri=False) == "/admin/prebuilt/child/1"
+    assert MetaChildPage.get_uri() == "/admin/api/child/{id}"
+
+
+def test_page_get_uri_invalidated_by_page_meta_class(monkeypatch):
+    class ClassMetaPage(_page):
+        __pagemeta__ = PageMeta()
+
+    class ClassMetaChildPage(ClassMetaPage):
+        uri = "/class_meta"
+
+        def render(self) -> responses.HTMLResponse:
+            return "ClassMetaChildPage"
+
+    assert ClassMetaChildPage.get_uri() == "/class_meta"
+
+    monkeypatch.setattr(PageMeta, "root_url", "/api")
+    assert ClassMetaChildPage.get_uri() == "/api/class_meta"
@@ -0,0 +1,107 @@
+import pytest
+import sqlalchemy as _sa
+from fastui import components as _c
+
+from fastadmin import InvalidCursor, KeysetPaginator
+
+from .tables import Article, User
+
+
+@pytest.fixture
+def connection(samples_engine: _sa.Engine):
+    with samples_engine.begin() as conn:
+        conn.execute(
+            Article.insert(),
+            [{"id": i, "rank": i % 4, "title": f"a{i}"} for i in range(1, 24)],
+        )
+    with samples_engine.connect() as conn:
+        yield conn
+
+
+def walk(paginator: KeysetPaginator, connection) -> list[list[int]]:
+    pages, after = [], None
+    while True:
+        page = paginator.fetch(connection, after=after)
+        pages.append([row.id for row in page.rows])
+        if (after := page.next_cursor) is None:
+            return pages
+
+
+def test_paginate_by_primary_key(connection):
+    pages = walk(KeysetPaginator(Article, page_size=10), connection)
+    assert pages == [list(range(1, 11)), list(range(11, 21)), [21, 22, 23]]
+
+
+def test_paginate_by_index_column(connection):
+    paginator = KeysetPaginator(Article, "rank", page_size=5)
+    rows = [row_id for page in walk(paginator, connection) for row_id in page]
+
+    expected = sorted(range(1, 24), key=lambda i: (i % 4, i))
+    assert rows == expected
+
+
+def test_paginate_descending(connection):
+    paginator = KeysetPaginator(Article, page_size=10, descending=True)
+    assert walk(paginator, connection)[0] == list(range(23, 13, -1))
+
+
+def test_paginate_backwards(connection):
+    paginator = KeysetPaginator(Article, page_size=10)
+    second = paginator.fetch(connection, after=paginator.fetch(connection).next_cursor)
+    assert second.prev_cursor is not None
+
+    first = paginator.fetch(connection, before=second.prev_cursor)
+    assert [row.id for row in first.rows] == list(range(1, 11))
+    assert first.prev_cursor is None
+    assert first.next_cursor is not None
+
+
+def test_deep_pages_do_not_use_offset(connection):
+    paginator = KeysetPaginator(Article, "rank", page_size=5)
+    cursor = paginator.encode_cursor({"id": 20, "rank": 3})
+    sql = str(paginator.statement(after=cursor))
+
+    assert "OFFSET" not in sql
+    assert "articles.rank > " in sql
+
+
+def test_seek_with_row_values(connection):
+    paginator = KeysetPaginator(Article, "rank", page_size=5)
+    cursor = paginator.encode_cursor({"id": 20, "rank": 3})
+    sql = str(paginator.statement(after=cursor, row_values=True))
+
+    assert "(articles.rank, articles.id) > (" in sql
+    assert paginator.supports_row_values(connection.dialect)
+
+
+def test_cursor_round_trip():
+    paginator = KeysetPaginator(Article, "rank")
+    cursor = paginator.encode_cursor({"id": 7, "rank": 3})
+    assert paginator.decode_cursor(cursor) == (3, 7)
+
+
+def test_invalid_cursor():
+    with pytest.raises(InvalidCursor):
+        KeysetPaginator(Article).decode_cursor("not a cursor")
+
+
+def test_paginate_requires_indexed_column():
+    with pytest.raises(ValueError, match="must be indexed"):
+        KeysetPaginator(Article, "title")
+
+    with pytest.raises(ValueError, match="must not be nullable"):
+        KeysetPaginator(Article, "note")
+
+
+def test_paginator_for_declarative_table():
+    paginator = KeysetPaginator(User.__table__)
+    assert [column.name for column in paginator.columns] == ["id"]
+
+
+def test_page_components(connection):
+    page = KeysetPaginator(Article, page_size=10).fetch(connection)
+    [links] = page.as_components("/articles")
+
+    assert isinstance(links, _c.Div)
+    [next_link] = links.components
+    assert next_link.on_click.query == {"after": page.next_cursor}
@@ -0,0 +1,158 @@
+import fastapi as _fa
+import pytest
+import sqlalchemy as _sa
+from fastui import components as _c
+
+from fastadmin import FastAdminTable, FastColumn, KeysetPaginator
+from fastadmin.tools.query import InvalidQuery, QueryBuilder
+
+from .tables import Book
+
+
+@pytest.fixture
+def connection(samples_engine: _sa.Engine):
+    with samples_engine.begin() as conn:
+        conn.execute(
+            Book.insert(),
+            [
+                {
+                    "id": i,
+                    "year": 2000 + i % 3,
+                    "title": f"book {i}" if i % 2 else f"50% book_{i}",
+                    "note": None if i % 4 else "classic",
+                }
+                for i in range(1, 13)
+            ],
+        )
+    with samples_engine.connect() as conn:
+        yield conn
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    monkeypatch.setattr(Book, "search_columns", ("title", "note"))
+    return QueryBuilder(Book)
+
+
+def ids(rows) -> list[int]:
+    return [row.id for row in rows]
+
+
+def test_filters(builder: QueryBuilder, connection):
+    query = builder.parse({"year": "2001", "id__gt": "3", "after": "ignored"})
+
+    assert query.filters == (("id", "gt"), ("year", "eq"))
+    assert ids(builder.fetch(connection, query)) == [4, 7, 10]
+
+
+def test_reserved_parameters():
+    table = FastAdminTable(
+        "pages",
+        _sa.MetaData(),
+        FastColumn("id", _sa.Integer, primary_key=True),
+        FastColumn("page", _sa.Integer, nullable=False),
+        FastColumn("q", _sa.String, nullable=True),
+    )
+    builder = QueryBuilder(table)
+
+    query = builder.parse({"page": "2", "after": "cursor", "limit": "10"})
+    assert query.filters == ()
+
+    query = builder.parse({"page__eq": "3", "q__eq": "term"})
+    assert query.filters == (("page", "eq"), ("q", "eq"))
+    assert query.value("page") == 3
+
+    form = builder.filter_form(query)
+    assert form.initial == {"page__eq": 3, "q__eq": "term"}
+    assert {"id", "page__eq", "q__eq"} <= set(form.model.model_fields)
+
+
+def test_operators(builder: QueryBuilder, connection):
+    def fetch(params):
+        return ids(builder.fetch(connection, builder.parse(params)))
+
+    assert fetch({"id__in": "1,5,9"}) == [1, 5, 9]
+    assert fetch({"note__isnull": "false"}) == [4, 8, 12]
+    assert fetch({"title__startswith": "50%", "id__le": "4"}) == [2, 4]
+    assert fetch({"title__contains": "_1"}) == [10, 12]
+    assert fetch({"title__icontains": "BOOK 1"}) == [1, 11]
+
+
+def test_order_by(builder: QueryBuilder, connection):
+    query = builder.parse({"order_by": "-year", "id__le": "6"})
+
+    assert query.order_by == (("year", True),)
+    assert ids(builder.fetch(connection, query)) == [2, 5, 1, 4, 3, 6]
+    assert ids(builder.fetch(connection, query, limit=2, offset=1)) == [5, 1]
+
+
+def test_order_by_requires_index(builder: QueryBuilder, monkeypatch):
+    with pytest.raises(InvalidQuery):
+        builder.parse({"order_by": "title"})
+
+    monkeypatch.setattr(Book, "sortable_columns", ("title",), raising=False)
+    assert QueryBuilder(Book).parse({"order_by": "title"}).order_by == (
+        ("title", False),
+    )
+
+
+def test_search(builder: QueryBuilder, connection):
+    query = builder.parse({"q": "classic"})
+    assert ids(builder.fetch(connection, query)) == [4, 8, 12]
+
+    query = builder.parse({"q": "%"})
+    assert ids(builder.fetch(connection, query)) == [2, 4, 6, 8, 10, 12]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{"id": "x"}, {"id__like": "1"}, {"order_by": "missing"}],
+)
+def test_invalid_query(builder: QueryBuilder, params):
+    with pytest.raises(InvalidQuery):
+        builder.parse(params)
+
+
+def test_statement_cached_per_shape(builder: QueryBuilder):
+    first = builder.parse({"year": "2001", "order_by": "-id"})
+    second = builder.parse({"year": "2002", "order_by": "-id"})
+    other = builder.parse({"year": "2002"})
+
+    assert first.shape == second.shape
+    assert builder.statement(first) is builder.statement(second)
+    assert builder.statement(other) is not builder.statement(first)
+
+
+def test_keyset_pagination(builder: QueryBuilder, connection):
+    query = builder.parse({"year": "2000"})
+    paginator = KeysetPaginator(Book, page_size=2)
+
+    page = paginator.fetch(
+        connection, where=builder.where(query), parameters=query.parameters
+    )
+    assert ids(page.rows) == [3, 6]
+
+
+def test_filter_form(builder: QueryBuilder):
+    query = builder.parse({"year": "2001", "q": "book", "order_by": "-year"})
+    form = builder.filter_form(query)
+
+    assert isinstance(form, _c.ModelForm)
+    assert form.method == "GOTO"
+    assert form.initial == {"year": 2001, "q": "book", "order_by": "-year"}
+    assert {"id", "year", "title", "note", "q", "order_by"} <= set(
+        form.model.model_fields
+    )
+    assert builder.filter_model() is form.model
+
+
+def test_dependency(builder: QueryBuilder):
+    request = _fa.Request({"type": "http", "query_string": b"order_by=title"})
+
+    with pytest.raises(_fa.HTTPException) as error:
+        builder(request)
+    assert error.value.status_code == 400
+
+
+def test_table_query_builder():
+    assert Book.query_builder() is Book.query_builder()
@@ -0,0 +1,234 @@
+import httpx
+import pytest
+import sqlalchemy as _sa
+from fastui import components as _c
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from fastadmin import FastAdminTable, FastColumn, FastUIRouter, PageMeta
+from fastadmin import Page as _page
+from fastadmin.config import ROOT_URL
+from fastadmin.tools.connections import ConnectionManager
+from fastadmin.tools.search import (
+    FTS5Index,
+    FullTextSearch,
+    InvertedIndex,
+    search_page,
+    tokenize,
+)
+
+from .tables import Note, samples
+
+NOTES = [
+    {"id": 1, "title": "Quarterly report", "body": "revenue grew"},
+    {"id": 2, "title": "Team lunch", "body": "pizza on friday"},
+    {"id": 3, "title": "Report draft", "body": "report the revenue report"},
+    {"id": 4, "title": "Revenue", "body": None},
+]
+
+
+@pytest.fixture
+def search(monkeypatch):
+    monkeypatch.setattr(Note, "fulltext_columns", ("title", "body"))
+    search = Note.full_text_search()
+    yield search
+    search.fts5.uninstall()
+    Note.__full_text_search__ = None
+
+
+@pytest.fixture
+def engine(samples_engine: _sa.Engine, search: FullTextSearch):
+    with samples_engine.begin() as conn:
+        search.create(conn)
+        conn.execute(Note.insert(), NOTES)
+    return samples_engine
+
+
+def keys(hits) -> list[int]:
+    return [hit.key[0] for hit in hits]
+
+
+def test_tokenize():
+    assert tokenize("Hello, World_2!") == ["hello", "world_2"]
+    assert tokenize(None) == []
+
+
+def test_fts5_index(engine: _sa.Engine):
+    search = Note.full_text_search()
+    with engine.connect() as conn:
+        assert search.index(conn) is search.fts5
+        assert keys(search.search(conn, "report")) == [3, 1]
+        assert keys(search.search(conn, "revenue report")) == [3, 1]
+        assert search.search(conn, 'pizza" OR "report') == []
+        assert search.search(conn, "   ") == []
+
+
+def test_fts5_triggers(engine: _sa.Engine):
+    search = Note.full_text_search()
+    with engine.begin() as conn:
+        conn.execute(Note.insert(), {"id": 5, "title": "Pizza party"})
+        conn.execute(Note.delete().where(Note.c.id == 2))
+        conn.execute(Note.update().where(Note.c.id == 4).values(title="Lunch"))
+
+    with engine.connect() as conn:
+        assert keys(search.search(conn, "pizza")) == [5]
+        assert keys(search.search(conn, "lunch")) == [4]
+
+
+def test_rows(engine: _sa.Engine):
+    with engine.connect() as conn:
+        results = Note.full_text_search().rows(conn, "revenue", limit=2)
+
+    assert [row.id for row, _ in results] == [4, 1]
+    assert results[0][1] >= results[1][1]
+
+
+def test_inverted_index(engine: _sa.Engine):
+    index = InvertedIndex(Note, ("title", "body"))
+    with engine.connect() as conn:
+        assert keys(index.search(conn, "report")) == [3, 1]
+        assert keys(index.search(conn, "revenue report")) == [3, 1]
+        assert index.search(conn, "missing") == []
+
+
+def test_inverted_index_follows_writes(engine: _sa.Engine):
+    index = InvertedIndex(Note, ("title", "body"))
+    with engine.connect() as conn:
+        index.search(conn, "pizza")
+
+    with engine.begin() as conn:
+        conn.execute(Note.insert(), {"id": 5, "title": "Pizza party"})
+    assert not index.stale
+    assert index.terms[(5,)] == {"pizza", "party"}
+
+    with engine.connect() as conn:
+        conn.execute(Note.insert(), {"id": 6, "title": "Pizza again"})
+        conn.rollback()
+    assert (6,) not in index.terms
+
+    with engine.begin() as conn:
+        conn.execute(Note.delete().where(Note.c.id == 2))
+        conn.execute(Note.update().where(Note.c.id == 4).values(body="pizza"))
+    assert not index.stale
+    assert (2,) not in index.terms
+    assert index.terms[(4,)] == {"revenue", "pizza"}
+
+    with engine.connect() as conn:
+        assert sorted(keys(index.search(conn, "pizza"))) == [4, 5]
+
+
+def test_inverted_index_bulk_update(engine: _sa.Engine):
+    index = InvertedIndex(Note, ("title", "body"))
+    with engine.connect() as conn:
+        index.search(conn, "pizza")
+
+    with engine.begin() as conn:
+        conn.execute(
+            Note.update().where(Note.c.id == _sa.bindparam("pk")),
+            [{"pk": 1, "title": "Pizza report"}, {"pk": 3, "title": "Pizza"}],
+        )
+        with conn.begin_nested() as savepoint:
+            conn.execute(Note.delete().where(Note.c.id == 1))
+            savepoint.rollback()
+    assert not index.stale
+    assert index.terms[(1,)] == {"pizza", "report", "revenue", "grew"}
+
+    with engine.connect() as conn:
+        assert sorted(keys(index.search(conn, "pizza"))) == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        Note.delete().where(Note.c.title == "Team lunch"),
+        Note.update().where(Note.c.id == 2).values(id=20),
+        Note.update().where(Note.c.id.in_([1, 2])).values(body=None),
+    ],
+)
+def test_inverted_index_stale(engine: _sa.Engine, statement):
+    index = InvertedIndex(Note, ("title", "body"))
+    with engine.connect() as conn:
+        index.search(conn, "pizza")
+
+    with engine.begin() as conn:
+        conn.execute(statement)
+    assert index.stale
+
+
+def test_inverted_index_scoped_to_engine(engine: _sa.Engine):
+    other = _sa.create_engine("sqlite:///:memory:")
+    samples.create_all(other)
+    index = InvertedIndex(Note, ("title", "body"))
+    with engine.connect() as conn:
+        index.search(conn, "pizza")
+
+    with other.begin() as conn:
+        conn.execute(Note.insert(), {"id": 99, "title": "Pizza elsewhere"})
+    assert (99,) not in index.terms
+
+    with other.connect() as conn:
+        assert keys(index.search(conn, "pizza")) == [99]
+    assert index.engine is other
+
+
+def test_fts5_requires_integer_key():
+    table = FastAdminTable(
+        "tags",
+        _sa.MetaData(),
+        FastColumn("name", _sa.String, primary_key=True),
+    )
+    assert FTS5Index.supports(table) is False
+    with pytest.raises(ValueError):
+        FTS5Index(table, ("name",))
+
+
+def test_search_page(engine: _sa.Engine):
+    with engine.connect() as conn:
+        results = Note.full_text_search().rows(conn, "pizza")
+
+    [page] = search_page(Note, "pizza", results)
+    assert isinstance(page, _c.Page)
+    heading, form, table = page.components
+    assert isinstance(form, _c.ModelForm)
+    assert form.initial == {"q": "pizza"}
+    assert [row.id for row in table.data] == [2]
+
+
+def test_full_text_search_requires_columns():
+    table = FastAdminTable(
+        "plain", _sa.MetaData(), FastColumn("id", _sa.Integer, primary_key=True)
+    )
+    with pytest.raises(ValueError):
+        table.full_text_search()
+
+
+class SearchPage(_page):
+    __pagemeta__ = PageMeta()
+
+
+async def test_search_endpoint_creates_fts5(tmp_path, search: FullTextSearch):
+    aengine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'notes.db'}")
+    async with aengine.begin() as conn:
+        await conn.run_sync(samples.create_all)
+        await conn.execute(Note.insert(), NOTES)
+        # a table created before the search was set up
+        await conn.run_sync(search.fts5.drop)
+
+    ConnectionManager._instance = None
+    manager = ConnectionManager(aengine=aengine)
+    try:
+        app = FastUIRouter(
+            metadata=samples, page_meta=SearchPage.__pagemeta__, search_tables=True
+        )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            response = await client.get(ROOT_URL + "/search/notes?q=pizza")
+        assert response.status_code == 200
+
+        async with aengine.connect() as conn:
+            assert await conn.run_sync(search.index) is search.fts5
+    finally:
+        await manager.async_registry.close_all()
+        ConnectionManager._instance = None
+        await aengine.dispose()
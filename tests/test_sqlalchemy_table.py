@@ -460,3 +460,128 @@ def test_query_comment_with_post_and_user(session: Session, user: User, post: Po
     queried_comment = session.query(Comment).filter_by(id=1).first()
     assert queried_comment.post_id == post.id
     assert queried_comment.user_id == user.id
+
+
+def test_column_field_spec_shared():
+    from fastadmin import FastColumn
+
+    first = FastColumn("first", _sa.String, max_length=10, title="Name")
+    second = FastColumn("second", _sa.String, title="Name", max_length=10)
+
+    assert first.__field_spec__ is second.__field_spec__
+    assert len(first.__field_spec__) == 2
+    assert "max_length" not in first.__dict__
+    assert first.pydantic_extra == {}
+
+    second.max_length = 20
+    assert second.max_length == 20
+    assert first.max_length == 10
+    assert first.__field_spec__ is not second.__field_spec__
+
+
+def test_column_field_spec_keeps_nested_types():
+    from fastadmin import FastColumn
+
+    ints = FastColumn("ints", _sa.Integer, examples=[1])
+    bools = FastColumn("bools", _sa.Integer, examples=[True])
+
+    assert ints.__field_spec__ is not bools.__field_spec__
+    assert bools.examples == [True]
+
+
+def test_mapped_column_field_spec():
+    column = User.__table__.c.id
+
+    assert column.frozen is True
+    assert dict(column.__field_spec__.items()) == {"frozen": True}
+
+
+def test_table_info_compiled_eagerly():
+    from fastadmin import FastAdminTable, FastColumn
+
+    table = FastAdminTable(
+        "eager_table",
+        _sa.MetaData(),
+        FastColumn("id", _sa.Integer, primary_key=True),
+        FastColumn("code", _sa.String, primary_key=True),
+        FastColumn("name", _sa.String, nullable=True),
+    )
+    info = table.__table_info__
+
+    assert info is not None
+    assert info.column_names == ("id", "code", "name")
+    assert info.primary_key_names == ("id", "code")
+    assert info.primary_key_from_mapping({"id": 1, "code": "a", "name": "x"}) == (
+        1,
+        "a",
+    )
+
+
+def test_table_info_invalidated_by_attach():
+    from fastadmin import FastAdminTable, FastColumn
+
+    table = FastAdminTable(
+        "attach_table",
+        _sa.MetaData(),
+        FastColumn("id", _sa.Integer, primary_key=True),
+    )
+    info = table.__fastadmin_metadata__()
+    model = table.as_pydantic_model()
+
+    table.append_column(FastColumn("rating", _sa.Integer, index=True))
+    assert table.__table_info__ is None
+    assert table.pydantic_models_cache_info().currsize == 0
+    assert "rating" in table.as_pydantic_model().model_fields
+    assert table.as_pydantic_model() is not model
+
+    refreshed = table.__fastadmin_metadata__()
+    assert refreshed is not info
+    assert refreshed.column_names[-1] == "rating"
+    assert "rating" in refreshed.index_columns
+
+
+def test_foreign_keys_not_consumed():
+    expected = [("user_id", User.__table__)]
+
+    assert Post.__list_foregin_keys__() == expected
+    assert Post.__list_foregin_keys__() == expected
+    assert len(Post.__table__.c.user_id.foreign_keys) == 1
+
+
+def test_foreign_key_graph():
+    graph = User.foreign_key_graph()
+
+    assert graph is Comment.foreign_key_graph()
+    assert {edge.table for edge in graph.referenced_by(User.__table__)} == {
+        Post.__table__,
+        Comment,
+    }
+    edge = graph.edge(Comment, "post_id")
+    assert edge.referred_table is Post.__table__
+    assert edge.referred_column is Post.__table__.c.id
+    assert graph.references(User.__table__) == ()
+    assert graph.dependency_order.index(User.__table__) < graph.dependency_order.index(
+        Comment
+    )
+
+
+def test_foreign_key_graph_rebuilt_on_attach():
+    from fastadmin import FastAdminTable, FastColumn
+
+    metadata = _sa.MetaData()
+    parent = FastAdminTable(
+        "graph_parent", metadata, FastColumn("id", _sa.Integer, primary_key=True)
+    )
+    graph = parent.foreign_key_graph()
+    assert graph.referenced_by(parent) == ()
+
+    child = FastAdminTable(
+        "graph_child",
+        metadata,
+        FastColumn("id", _sa.Integer, primary_key=True),
+        FastColumn("parent_id", _sa.Integer, _sa.ForeignKey("graph_parent.id")),
+    )
+    rebuilt = parent.foreign_key_graph()
+
+    assert rebuilt is not graph
+    assert [edge.table for edge in rebuilt.referenced_by(parent)] == [child]